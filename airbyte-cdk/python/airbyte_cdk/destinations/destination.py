@@ -7,12 +7,14 @@ import io
 import logging
 import sys
 from abc import ABC, abstractmethod
-from typing import Any, Iterable, List, Mapping
+from typing import Any, BinaryIO, Iterable, List, Mapping, Union
 
 from airbyte_cdk.connector import Connector
 from airbyte_cdk.exception_handler import init_uncaught_exception_handler
 from airbyte_cdk.models import AirbyteMessage, ConfiguredAirbyteCatalog, Type
 from airbyte_cdk.sources.utils.schema_helpers import check_config_against_spec_or_exit
+from airbyte_cdk.utils.message_reader import InvalidMessageError, parse_message
+from airbyte_cdk.utils.message_writer import AirbyteMessageWriter
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 from pydantic import ValidationError
 
@@ -21,6 +23,9 @@ logger = logging.getLogger("airbyte")
 
 class Destination(Connector, ABC):
     VALID_CMDS = {"spec", "check", "write"}
+    # configure whether stdin is read as bytes and record messages are deserialized without validating their data,
+    # see airbyte_cdk.utils.message_reader.parse_message
+    fast_input_parsing: bool = False
 
     @abstractmethod
     def write(
@@ -32,16 +37,31 @@ class Destination(Connector, ABC):
         check_result = self.check(logger, config)
         return AirbyteMessage(type=Type.CONNECTION_STATUS, connectionStatus=check_result)
 
-    def _parse_input_stream(self, input_stream: io.TextIOWrapper) -> Iterable[AirbyteMessage]:
+    def _parse_input_stream(self, input_stream: Union[io.TextIOWrapper, BinaryIO]) -> Iterable[AirbyteMessage]:
         """Reads from stdin, converting to Airbyte messages"""
+        if self.fast_input_parsing:
+            yield from self._fast_parse_input_stream(input_stream)
+            return
         for line in input_stream:
             try:
                 yield AirbyteMessage.parse_raw(line)
             except ValidationError:
                 logger.info(f"ignoring input which can't be deserialized as Airbyte Message: {line}")
 
+    @staticmethod
+    def _fast_parse_input_stream(input_stream: Union[io.TextIOWrapper, BinaryIO]) -> Iterable[AirbyteMessage]:
+        for line in input_stream:
+            if not line.strip():
+                continue
+            try:
+                yield parse_message(line)
+            except InvalidMessageError:
+                if isinstance(line, bytes):
+                    line = line.decode("utf-8", errors="replace")
+                logger.info(f"ignoring input which can't be deserialized as Airbyte Message: {line}")
+
     def _run_write(
-        self, config: Mapping[str, Any], configured_catalog_path: str, input_stream: io.TextIOWrapper
+        self, config: Mapping[str, Any], configured_catalog_path: str, input_stream: Union[io.TextIOWrapper, BinaryIO]
     ) -> Iterable[AirbyteMessage]:
         catalog = ConfiguredAirbyteCatalog.parse_file(configured_catalog_path)
         input_messages = self._parse_input_stream(input_stream)
@@ -108,13 +128,18 @@ class Destination(Connector, ABC):
         if cmd == "check":
             yield self._run_check(config=config)
         elif cmd == "write":
-            # Wrap in UTF-8 to override any other input encodings
-            wrapped_stdin = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
-            yield from self._run_write(config=config, configured_catalog_path=parsed_args.catalog, input_stream=wrapped_stdin)
+            if self.fast_input_parsing:
+                # Lines are decoded by the JSON parser directly from bytes, which is both faster and encoding agnostic
+                input_stream = sys.stdin.buffer
+            else:
+                # Wrap in UTF-8 to override any other input encodings
+                input_stream = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
+            yield from self._run_write(config=config, configured_catalog_path=parsed_args.catalog, input_stream=input_stream)
 
     def run(self, args: List[str]):
         init_uncaught_exception_handler(logger)
         parsed_args = self.parse_args(args)
         output_messages = self.run_cmd(parsed_args)
-        for message in output_messages:
-            print(message.json(exclude_unset=True))
+        with AirbyteMessageWriter() as writer:
+            for message in output_messages:
+                writer.write(message)
@@ -18,6 +18,7 @@ from airbyte_cdk.models.airbyte_protocol import ConnectorSpecification
 from airbyte_cdk.sources import Source
 from airbyte_cdk.sources.utils.schema_helpers import check_config_against_spec_or_exit, split_config
 from airbyte_cdk.utils.airbyte_secrets_utils import get_secrets, update_secrets
+from airbyte_cdk.utils.message_writer import AirbyteMessageWriter
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
 logger = init_logger("airbyte")
@@ -65,6 +66,13 @@ class AirbyteEntrypoint(object):
         return main_parser.parse_args(args)
 
     def run(self, parsed_args: argparse.Namespace) -> Iterable[str]:
+        for message in self.run_messages(parsed_args):
+            yield message.json(exclude_unset=True)
+
+    def run_messages(self, parsed_args: argparse.Namespace) -> Iterable[AirbyteMessage]:
+        """
+        Runs the command and yields the resulting messages without serializing them, so that callers can choose how to write them.
+        """
         cmd = parsed_args.command
         if not cmd:
             raise Exception("No command passed")
@@ -80,7 +88,7 @@ class AirbyteEntrypoint(object):
         with tempfile.TemporaryDirectory() as temp_dir:
             if cmd == "spec":
                 message = AirbyteMessage(type=Type.SPEC, spec=source_spec)
-                yield message.json(exclude_unset=True)
+                yield message
             else:
                 raw_config = self.source.read_config(parsed_args.config)
                 config = self.source.configure(raw_config, temp_dir)
@@ -99,7 +107,7 @@ class AirbyteEntrypoint(object):
                     except AirbyteTracedException as traced_exc:
                         connection_status = traced_exc.as_connection_status_message()
                         if connection_status and cmd == "check":
-                            yield connection_status.json(exclude_unset=True)
+                            yield connection_status
                             return
                         raise traced_exc
 
@@ -110,17 +118,14 @@ class AirbyteEntrypoint(object):
                     else:
                         self.logger.error("Check failed")
 
-                    output_message = AirbyteMessage(type=Type.CONNECTION_STATUS, connectionStatus=check_result).json(exclude_unset=True)
-                    yield output_message
+                    yield AirbyteMessage(type=Type.CONNECTION_STATUS, connectionStatus=check_result)
                 elif cmd == "discover":
                     catalog = self.source.discover(self.logger, config)
-                    yield AirbyteMessage(type=Type.CATALOG, catalog=catalog).json(exclude_unset=True)
+                    yield AirbyteMessage(type=Type.CATALOG, catalog=catalog)
                 elif cmd == "read":
                     config_catalog = self.source.read_catalog(parsed_args.catalog)
                     state = self.source.read_state(parsed_args.state)
-                    generator = self.source.read(self.logger, config, config_catalog, state)
-                    for message in generator:
-                        yield message.json(exclude_unset=True)
+                    yield from self.source.read(self.logger, config, config_catalog, state)
                 else:
                     raise Exception("Unexpected command " + cmd)
 
@@ -128,8 +133,9 @@ class AirbyteEntrypoint(object):
 def launch(source: Source, args: List[str]):
     source_entrypoint = AirbyteEntrypoint(source)
     parsed_args = source_entrypoint.parse_args(args)
-    for message in source_entrypoint.run(parsed_args):
-        print(message)
+    with AirbyteMessageWriter() as writer:
+        for message in source_entrypoint.run_messages(parsed_args):
+            writer.write(message)
 
 
 def main():
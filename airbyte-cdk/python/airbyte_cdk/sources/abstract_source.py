@@ -2,9 +2,12 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
+import copy
+import itertools
 import logging
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 from airbyte_cdk.models import (
     AirbyteCatalog,
@@ -22,9 +25,10 @@ from airbyte_cdk.sources.source import Source
 from airbyte_cdk.sources.streams import Stream
 from airbyte_cdk.sources.streams.core import StreamData
 from airbyte_cdk.sources.streams.http.http import HttpStream
+from airbyte_cdk.sources.utils.concurrency import read_partitions_concurrently, read_partitions_interleaved
 from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
-from airbyte_cdk.sources.utils.schema_helpers import InternalConfig, split_config
-from airbyte_cdk.utils.event_timing import create_timer
+from airbyte_cdk.sources.utils.schema_helpers import InternalConfig, limit_reached_message, split_config
+from airbyte_cdk.utils.event_timing import EventTimer, create_timer
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
 
@@ -99,34 +103,19 @@ class AbstractSource(Source, ABC):
         state_manager = ConnectorStateManager(stream_instance_map=stream_instances, state=state)
         self._stream_to_instance_map = stream_instances
         with create_timer(self.name) as timer:
-            for configured_stream in catalog.streams:
-                stream_instance = stream_instances.get(configured_stream.stream.name)
-                if not stream_instance:
-                    raise KeyError(
-                        f"The requested stream {configured_stream.stream.name} was not found in the source."
-                        f" Available streams: {stream_instances.keys()}"
+            concurrency = self.stream_concurrency
+            if concurrency > 1:
+
+                def read_configured_stream(configured_stream: ConfiguredAirbyteStream) -> Iterator[AirbyteMessage]:
+                    return self._read_configured_stream(logger, configured_stream, stream_instances, state_manager, internal_config, timer)
+
+                for _, message in read_partitions_interleaved(catalog.streams, read_configured_stream, max_workers=concurrency):
+                    yield message
+            else:
+                for configured_stream in catalog.streams:
+                    yield from self._read_configured_stream(
+                        logger, configured_stream, stream_instances, state_manager, internal_config, timer
                     )
-                try:
-                    timer.start_event(f"Syncing stream {configured_stream.stream.name}")
-                    yield from self._read_stream(
-                        logger=logger,
-                        stream_instance=stream_instance,
-                        configured_stream=configured_stream,
-                        state_manager=state_manager,
-                        internal_config=internal_config,
-                    )
-                except AirbyteTracedException as e:
-                    raise e
-                except Exception as e:
-                    logger.exception(f"Encountered an exception while reading stream {configured_stream.stream.name}")
-                    display_message = stream_instance.get_error_display_message(e)
-                    if display_message:
-                        raise AirbyteTracedException.from_exception(e, message=display_message) from e
-                    raise e
-                finally:
-                    timer.finish_event()
-                    logger.info(f"Finished syncing {configured_stream.stream.name}")
-                    logger.info(timer.report())
 
         logger.info(f"Finished syncing {self.name}")
 
@@ -134,6 +123,57 @@ class AbstractSource(Source, ABC):
     def per_stream_state_enabled(self) -> bool:
         return True
 
+    @property
+    def stream_concurrency(self) -> int:
+        """
+        Decides how many streams are read at the same time. By default streams are read one after the other.
+
+        When this returns a value greater than 1, the configured streams are read on a pool of threads and their messages are emitted as
+        they are produced. Messages of a given stream keep their order, so its state messages still follow the records they cover. If a
+        stream fails, its error is handled the same way as in a sequential read and the other streams are stopped.
+
+        Only enable it if the streams of the source can be read from different threads, e.g. they don't share a non thread safe client.
+        """
+        return 1
+
+    def _read_configured_stream(
+        self,
+        logger: logging.Logger,
+        configured_stream: ConfiguredAirbyteStream,
+        stream_instances: Mapping[str, Stream],
+        state_manager: ConnectorStateManager,
+        internal_config: InternalConfig,
+        timer: EventTimer,
+    ) -> Iterator[AirbyteMessage]:
+        stream_instance = stream_instances.get(configured_stream.stream.name)
+        if not stream_instance:
+            raise KeyError(
+                f"The requested stream {configured_stream.stream.name} was not found in the source."
+                f" Available streams: {stream_instances.keys()}"
+            )
+        event_name = f"Syncing stream {configured_stream.stream.name}"
+        try:
+            timer.start_event(event_name)
+            yield from self._read_stream(
+                logger=logger,
+                stream_instance=stream_instance,
+                configured_stream=configured_stream,
+                state_manager=state_manager,
+                internal_config=internal_config,
+            )
+        except AirbyteTracedException as e:
+            raise e
+        except Exception as e:
+            logger.exception(f"Encountered an exception while reading stream {configured_stream.stream.name}")
+            display_message = stream_instance.get_error_display_message(e)
+            if display_message:
+                raise AirbyteTracedException.from_exception(e, message=display_message) from e
+            raise e
+        finally:
+            timer.finish_event(event_name)
+            logger.info(f"Finished syncing {configured_stream.stream.name}")
+            logger.info(timer.report())
+
     def _read_stream(
         self,
         logger: logging.Logger,
@@ -146,6 +186,9 @@ class AbstractSource(Source, ABC):
         if internal_config.page_size and isinstance(stream_instance, HttpStream):
             logger.info(f"Setting page size for {stream_instance.name} to {internal_config.page_size}")
             stream_instance.page_size = internal_config.page_size
+        if internal_config.page_limit and hasattr(stream_instance, "page_limit"):
+            logger.info(f"Setting page limit for {stream_instance.name} to {internal_config.page_limit}")
+            stream_instance.page_limit = internal_config.page_limit
         logger.debug(
             f"Syncing configured stream: {configured_stream.stream.name}",
             extra={
@@ -221,49 +264,70 @@ class AbstractSource(Source, ABC):
             stream_instance.state = stream_state
             logger.info(f"Setting state of {stream_name} stream to {stream_state}")
 
-        slices = stream_instance.stream_slices(
-            cursor_field=configured_stream.cursor_field,
-            sync_mode=SyncMode.incremental,
-            stream_state=stream_state,
-        )
-        logger.debug(f"Processing stream slices for {stream_name} (sync_mode: incremental)", extra={"stream_slices": slices})
-
-        total_records_counter = 0
-        has_slices = False
-        for _slice in slices:
-            has_slices = True
-            logger.debug("Processing stream slice", extra={"slice": _slice})
-            records = stream_instance.read_records(
+        slices = iter(
+            stream_instance.stream_slices(
+                cursor_field=configured_stream.cursor_field,
                 sync_mode=SyncMode.incremental,
-                stream_slice=_slice,
                 stream_state=stream_state,
-                cursor_field=configured_stream.cursor_field or None,
             )
-            record_counter = 0
-            for message_counter, record_data_or_message in enumerate(records, start=1):
-                message = self._get_message(record_data_or_message, stream_instance)
-                yield message
-                if message.type == MessageType.RECORD:
-                    record = message.record
-                    stream_state = stream_instance.get_updated_state(stream_state, record.data)
-                    checkpoint_interval = stream_instance.state_checkpoint_interval
-                    record_counter += 1
-                    if checkpoint_interval and record_counter % checkpoint_interval == 0:
-                        yield self._checkpoint_state(stream_instance, stream_state, state_manager)
-
-                    total_records_counter += 1
-                    # This functionality should ideally live outside of this method
-                    # but since state is managed inside this method, we keep track
-                    # of it here.
-                    if self._limit_reached(internal_config, total_records_counter):
-                        # Break from slice loop to save state and exit from _read_incremental function.
-                        break
+        )
+        logger.debug(f"Processing stream slices for {stream_name} (sync_mode: incremental)", extra={"stream_slices": slices})
 
+        total_records_counter = 0
+        slices_counter = 0
+        concurrency = stream_instance.slice_concurrency
+        checkpoint_interval = stream_instance.state_checkpoint_interval if concurrency == 1 else None
+        checkpoint_interval_seconds = stream_instance.state_checkpoint_interval_seconds if concurrency == 1 else None
+        last_checkpoint_time = time.monotonic()
+        for slice_batch in self._batch_slices(self._limit_slices(slices, internal_config), concurrency):
+            # Slices read concurrently update the state from worker threads, possibly ahead of the records emitted so far
+            batch_start_state = self._copy_state(stream_instance, stream_state) if concurrency > 1 else None
+            for _slice, records in self._read_slices(
+                logger,
+                stream_instance,
+                slice_batch,
+                concurrency,
+                SyncMode.incremental,
+                configured_stream.cursor_field or None,
+                stream_state,
+            ):
+                slices_counter += 1
+                record_counter = 0
+                for message_counter, record_data_or_message in enumerate(records, start=1):
+                    message = self._get_message(record_data_or_message, stream_instance)
+                    yield message
+                    if message.type == MessageType.RECORD:
+                        record = message.record
+                        stream_state = stream_instance.get_updated_state(stream_state, record.data)
+                        record_counter += 1
+                        if (checkpoint_interval and record_counter % checkpoint_interval == 0) or (
+                            checkpoint_interval_seconds and time.monotonic() - last_checkpoint_time >= checkpoint_interval_seconds
+                        ):
+                            yield self._checkpoint_state(stream_instance, stream_state, state_manager)
+                            last_checkpoint_time = time.monotonic()
+
+                        total_records_counter += 1
+                        # This functionality should ideally live outside of this method
+                        # but since state is managed inside this method, we keep track
+                        # of it here.
+                        if self._limit_reached(internal_config, total_records_counter):
+                            # Break from slice loop to save state and exit from _read_incremental function.
+                            break
+                if self._limit_reached(internal_config, total_records_counter):
+                    break
+
+            if batch_start_state is not None and self._limit_reached(internal_config, total_records_counter):
+                # The batch may not have been fully emitted, so its slices will be read again
+                stream_state = self._restore_state(stream_instance, batch_start_state)
             yield self._checkpoint_state(stream_instance, stream_state, state_manager)
+            last_checkpoint_time = time.monotonic()
             if self._limit_reached(internal_config, total_records_counter):
                 return
 
-        if not has_slices:
+        if self._slice_limit_reached(slices_counter, internal_config):
+            yield self._slice_limit_reached_message(stream_name, internal_config)
+
+        if not slices_counter:
             # Safety net to ensure we always emit at least one state message even if there are no slices
             checkpoint = self._checkpoint_state(stream_instance, stream_state, state_manager)
             yield checkpoint
@@ -275,18 +339,22 @@ class AbstractSource(Source, ABC):
         configured_stream: ConfiguredAirbyteStream,
         internal_config: InternalConfig,
     ) -> Iterator[AirbyteMessage]:
-        slices = stream_instance.stream_slices(sync_mode=SyncMode.full_refresh, cursor_field=configured_stream.cursor_field)
+        slices = iter(stream_instance.stream_slices(sync_mode=SyncMode.full_refresh, cursor_field=configured_stream.cursor_field))
         logger.debug(
             f"Processing stream slices for {configured_stream.stream.name} (sync_mode: full_refresh)", extra={"stream_slices": slices}
         )
         total_records_counter = 0
-        for _slice in slices:
-            logger.debug("Processing stream slice", extra={"slice": _slice})
-            record_data_or_messages = stream_instance.read_records(
-                stream_slice=_slice,
-                sync_mode=SyncMode.full_refresh,
-                cursor_field=configured_stream.cursor_field,
-            )
+        slices_counter = 0
+        slice_reads = self._read_slices(
+            logger,
+            stream_instance,
+            self._limit_slices(slices, internal_config),
+            stream_instance.slice_concurrency,
+            SyncMode.full_refresh,
+            configured_stream.cursor_field,
+        )
+        for _slice, record_data_or_messages in slice_reads:
+            slices_counter += 1
             for record_data_or_message in record_data_or_messages:
                 message = self._get_message(record_data_or_message, stream_instance)
                 yield message
@@ -295,6 +363,93 @@ class AbstractSource(Source, ABC):
                     if self._limit_reached(internal_config, total_records_counter):
                         return
 
+        if self._slice_limit_reached(slices_counter, internal_config):
+            yield self._slice_limit_reached_message(configured_stream.stream.name, internal_config)
+
+    @staticmethod
+    def _limit_slices(
+        slices: Iterator[Optional[Mapping[str, Any]]], internal_config: InternalConfig
+    ) -> Iterator[Optional[Mapping[str, Any]]]:
+        if internal_config.slice_limit:
+            return itertools.islice(slices, internal_config.slice_limit)
+        return slices
+
+    @staticmethod
+    def _slice_limit_reached(slices_counter: int, internal_config: InternalConfig) -> bool:
+        """
+        :return: True if the slice limit was reached. The slice following the limit is never pulled, as getting it can send requests
+        (e.g. to read a parent stream), so the limit is reported as reached even when no slice was left
+        """
+        return bool(internal_config.slice_limit) and slices_counter >= internal_config.slice_limit
+
+    @staticmethod
+    def _slice_limit_reached_message(stream_name: str, internal_config: InternalConfig) -> AirbyteMessage:
+        return limit_reached_message(f"Stopped reading stream {stream_name} after {internal_config.slice_limit} slices")
+
+    @staticmethod
+    def _batch_slices(slices: Iterable[Optional[Mapping[str, Any]]], batch_size: int) -> Iterator[List[Optional[Mapping[str, Any]]]]:
+        """
+        Groups slices in lists of batch_size slices, the last one possibly being shorter.
+        """
+        slice_iterator = iter(slices)
+        while True:
+            batch = list(itertools.islice(slice_iterator, batch_size))
+            if not batch:
+                return
+            yield batch
+
+    @staticmethod
+    def _copy_state(stream: Stream, stream_state: Mapping[str, Any]) -> Tuple[Optional[Mapping[str, Any]], Mapping[str, Any]]:
+        """
+        :return: a copy of the state property of the stream, None if it doesn't have one, and a copy of the state built by
+        get_updated_state
+        """
+        try:
+            state = copy.deepcopy(stream.state)
+        except AttributeError:
+            state = None
+        return state, copy.deepcopy(stream_state)
+
+    @staticmethod
+    def _restore_state(stream: Stream, saved_state: Tuple[Optional[Mapping[str, Any]], Mapping[str, Any]]) -> Mapping[str, Any]:
+        """
+        Restores the state property of the stream saved by _copy_state
+        :return: the saved state built by get_updated_state
+        """
+        state, stream_state = saved_state
+        if state is not None:
+            stream.state = state
+        return stream_state
+
+    @staticmethod
+    def _read_slices(
+        logger: logging.Logger,
+        stream_instance: Stream,
+        slices: Iterable[Optional[Mapping[str, Any]]],
+        concurrency: int,
+        sync_mode: SyncMode,
+        cursor_field: Optional[List[str]],
+        stream_state: Optional[Mapping[str, Any]] = None,
+    ) -> Iterator[Tuple[Optional[Mapping[str, Any]], Iterable[StreamData]]]:
+        """
+        Reads the records of each slice, on a pool of concurrency threads if it is greater than 1.
+        :return: Iterator of (slice, records of the slice) in the order of the slices
+        """
+
+        def read_slice(_slice: Optional[Mapping[str, Any]]) -> Iterable[StreamData]:
+            logger.debug("Processing stream slice", extra={"slice": _slice})
+            if sync_mode == SyncMode.incremental:
+                return stream_instance.read_records(
+                    sync_mode=sync_mode, stream_slice=_slice, stream_state=stream_state, cursor_field=cursor_field
+                )
+            return stream_instance.read_records(stream_slice=_slice, sync_mode=sync_mode, cursor_field=cursor_field)
+
+        if concurrency > 1:
+            yield from read_partitions_concurrently(slices, read_slice, max_workers=concurrency)
+        else:
+            for _slice in slices:
+                yield _slice, read_slice(_slice)
+
     def _checkpoint_state(self, stream: Stream, stream_state, state_manager: ConnectorStateManager):
         # First attempt to retrieve the current state using the stream's state property. We receive an AttributeError if the state
         # property is not implemented by the stream instance and as a fallback, use the stream_state retrieved from the stream
@@ -322,4 +477,4 @@ class AbstractSource(Source, ABC):
         if isinstance(record_data_or_message, AirbyteMessage):
             return record_data_or_message
         else:
-            return stream_data_to_airbyte_message(stream.name, record_data_or_message, stream.transformer, stream.get_json_schema())
+            return stream_data_to_airbyte_message(stream.name, record_data_or_message, stream.transformer, stream.get_cached_json_schema())
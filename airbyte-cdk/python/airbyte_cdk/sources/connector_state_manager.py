@@ -3,6 +3,7 @@
 #
 
 import copy
+import threading
 from typing import Any, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 from airbyte_cdk.models import AirbyteMessage, AirbyteStateBlob, AirbyteStateMessage, AirbyteStateType, AirbyteStreamState, StreamDescriptor
@@ -41,18 +42,33 @@ class ConnectorStateManager:
                 "STATE messages so this was not generated by this connector. This must be an orchestrator or platform error. GLOBAL "
                 "state messages with shared_state will not be processed correctly. "
             )
-        self.per_stream_states = per_stream_states
+        # States are kept as plain dicts, and only turned into pydantic objects when a state message is created, because streams can
+        # checkpoint their state much more often than it is read back
+        self._stream_states: MutableMapping[HashableStreamDescriptor, Optional[Mapping[str, Any]]] = {
+            descriptor: state.dict() if state is not None else None for descriptor, state in per_stream_states.items()
+        }
+        # Streams read concurrently update and emit their state from different threads
+        self._lock = threading.Lock()
+
+    @property
+    def per_stream_states(self) -> Mapping[HashableStreamDescriptor, Optional[AirbyteStateBlob]]:
+        """
+        :return: The current state blob of every stream, by stream descriptor
+        """
+        with self._lock:
+            stream_states = list(self._stream_states.items())
+        return {descriptor: AirbyteStateBlob.parse_obj(state) if state is not None else None for descriptor, state in stream_states}
 
     def get_stream_state(self, stream_name: str, namespace: Optional[str]) -> Mapping[str, Any]:
         """
         Retrieves the state of a given stream based on its descriptor (name + namespace).
         :param stream_name: Name of the stream being fetched
         :param namespace: Namespace of the stream being fetched
-        :return: The per-stream state for a stream
+        :return: A copy of the per-stream state for a stream
         """
-        stream_state = self.per_stream_states.get(HashableStreamDescriptor(name=stream_name, namespace=namespace))
+        stream_state = self._stream_states.get(HashableStreamDescriptor(name=stream_name, namespace=namespace))
         if stream_state:
-            return stream_state.dict()
+            return copy.deepcopy(stream_state)
         return {}
 
     def update_state_for_stream(self, stream_name: str, namespace: Optional[str], value: Mapping[str, Any]):
@@ -63,7 +79,10 @@ class ConnectorStateManager:
         :param value: A stream state mapping that is being updated for a stream
         """
         stream_descriptor = HashableStreamDescriptor(name=stream_name, namespace=namespace)
-        self.per_stream_states[stream_descriptor] = AirbyteStateBlob.parse_obj(value)
+        # A shallow copy is enough to keep the value from being replaced by the stream, the message created from it is a deep copy
+        state = dict(value)
+        with self._lock:
+            self._stream_states[stream_descriptor] = state
 
     def create_state_message(self, stream_name: str, namespace: Optional[str], send_per_stream_state: bool) -> AirbyteMessage:
         """
@@ -75,7 +94,9 @@ class ConnectorStateManager:
         """
         if send_per_stream_state:
             hashable_descriptor = HashableStreamDescriptor(name=stream_name, namespace=namespace)
-            stream_state = self.per_stream_states.get(hashable_descriptor) or AirbyteStateBlob()
+            with self._lock:
+                state = self._stream_states.get(hashable_descriptor)
+                stream_state = AirbyteStateBlob.parse_obj(copy.deepcopy(state)) if state else AirbyteStateBlob()
 
             # According to the Airbyte protocol, the StreamDescriptor namespace field is not required. However, the platform will throw
             # a validation error if it receives namespace=null. That is why if namespace is None, the field should be omitted instead.
@@ -167,7 +188,8 @@ class ConnectorStateManager:
         Using the current per-stream state, creates a mapping of all the stream states for the connector being synced
         :return: A deep copy of the mapping of stream name to stream state value
         """
-        return {descriptor.name: state.dict() if state else {} for descriptor, state in self.per_stream_states.items()}
+        with self._lock:
+            return {descriptor.name: copy.deepcopy(state) if state else {} for descriptor, state in self._stream_states.items()}
 
     @staticmethod
     def _is_legacy_dict_state(state: Union[List[AirbyteStateMessage], MutableMapping[str, Any]]):
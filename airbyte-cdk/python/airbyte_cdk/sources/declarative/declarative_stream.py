@@ -2,6 +2,7 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
+import copy
 from dataclasses import InitVar, dataclass, field
 from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
 
@@ -94,6 +95,24 @@ class DeclarativeStream(Stream, JsonSchemaMixin):
         """State setter, accept state serialized by state getter."""
         self.retriever.state = value
 
+    @property
+    def page_limit(self) -> Optional[int]:
+        """
+        Maximum number of pages read per slice by the retriever, if it supports pagination
+        """
+        return getattr(self.retriever, "page_limit", None)
+
+    @page_limit.setter
+    def page_limit(self, value: Optional[int]):
+        self.retriever.page_limit = value
+
+    @property
+    def slice_concurrency(self) -> int:
+        """
+        Number of slices read at the same time, if the retriever supports it. Each slice is then read with its own copy of the retriever
+        """
+        return getattr(self.retriever, "slice_concurrency", 1)
+
     def get_updated_state(self, current_stream_state: MutableMapping[str, Any], latest_record: Mapping[str, Any]):
         return self.state
 
@@ -112,7 +131,9 @@ class DeclarativeStream(Stream, JsonSchemaMixin):
         stream_slice: Mapping[str, Any] = None,
         stream_state: Mapping[str, Any] = None,
     ) -> Iterable[Mapping[str, Any]]:
-        for record in self.retriever.read_records(sync_mode, cursor_field, stream_slice, stream_state):
+        # Slices read concurrently don't share the pagination state of the retriever
+        retriever = self.retriever.copy_for_concurrent_read() if self.slice_concurrency > 1 else self.retriever
+        for record in retriever.read_records(sync_mode, cursor_field, stream_slice, stream_state):
             yield self._apply_transformations(record, self.config, stream_slice)
 
     def _apply_transformations(self, record: Mapping[str, Any], config: Config, stream_slice: StreamSlice):
@@ -131,6 +152,15 @@ class DeclarativeStream(Stream, JsonSchemaMixin):
         """
         return self._schema_loader.get_json_schema()
 
+    def copy_for_concurrent_read(self) -> "DeclarativeStream":
+        """
+        :return: A copy of the stream whose reads don't share any mutable state with the reads of this stream, see
+        Retriever.copy_for_concurrent_read
+        """
+        stream = copy.copy(self)
+        stream.retriever = self.retriever.copy_for_concurrent_read()
+        return stream
+
     def stream_slices(
         self, *, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None
     ) -> Iterable[Optional[Mapping[str, Any]]]:
@@ -3,12 +3,15 @@
 #
 
 from dataclasses import InitVar, dataclass
-from typing import Any, Mapping, Optional, Union
+from typing import Any, Final, Mapping, Optional, Tuple, Union
 
 from airbyte_cdk.sources.declarative.interpolation.jinja import JinjaInterpolation
 from airbyte_cdk.sources.declarative.types import Config
 from dataclasses_jsonschema import JsonSchemaMixin
 
+# Evaluated values of plain literals are only reused if they are immutable so callers can't alter each other's results
+_STATIC_VALUE_TYPES: Final[Tuple[type, ...]] = (str, int, float, bool, type(None))
+
 
 @dataclass
 class InterpolatedString(JsonSchemaMixin):
@@ -29,6 +32,14 @@ class InterpolatedString(JsonSchemaMixin):
         self.default = self.default or self.string
         self._interpolation = JinjaInterpolation()
         self._options = options
+        self._is_static = False
+        self._static_value = None
+        if self._is_literal(self.string) and self._is_literal(self.default):
+            # The string doesn't depend on the config or the runtime parameters so it is evaluated once instead of on every call
+            static_value = self._interpolation.eval(self.string, {}, self.default)
+            if isinstance(static_value, _STATIC_VALUE_TYPES):
+                self._is_static = True
+                self._static_value = static_value
 
     def eval(self, config: Config, **kwargs):
         """
@@ -38,8 +49,14 @@ class InterpolatedString(JsonSchemaMixin):
         :param kwargs: Optional parameters used for interpolation
         :return: The interpolated string
         """
+        if self._is_static:
+            return self._static_value
         return self._interpolation.eval(self.string, config, self.default, options=self._options, **kwargs)
 
+    @staticmethod
+    def _is_literal(value: Any) -> bool:
+        return isinstance(value, str) and not JinjaInterpolation.is_templated(value)
+
     def __eq__(self, other):
         if not isinstance(other, InterpolatedString):
             return False
@@ -3,15 +3,38 @@
 #
 
 import ast
-from typing import Optional
+from functools import lru_cache
+from typing import Final, Optional, Tuple
 
 from airbyte_cdk.sources.declarative.interpolation.filters import filters
 from airbyte_cdk.sources.declarative.interpolation.interpolation import Interpolation
 from airbyte_cdk.sources.declarative.interpolation.macros import macros
 from airbyte_cdk.sources.declarative.types import Config
-from jinja2 import Environment
+from jinja2 import Environment, Template
 from jinja2.exceptions import UndefinedError
 
+# Delimiters that mark the start of a jinja block, expression or comment. Strings without any of them are rendered verbatim by jinja
+TEMPLATE_DELIMITERS: Final[Tuple[str, ...]] = ("{{", "{%", "{#")
+
+# Maximum number of compiled templates kept in memory by the process-wide template cache
+COMPILED_TEMPLATE_CACHE_SIZE: Final[int] = 1024
+
+
+def _create_environment() -> Environment:
+    environment = Environment()
+    environment.filters.update(**filters)
+    environment.globals.update(**macros)
+    return environment
+
+
+# A single environment is shared by every JinjaInterpolation so that compiled templates can be reused across components
+_environment = _create_environment()
+
+
+@lru_cache(maxsize=COMPILED_TEMPLATE_CACHE_SIZE)
+def _compile(s: str) -> Template:
+    return _environment.from_string(s)
+
 
 class JinjaInterpolation(Interpolation):
     """
@@ -28,13 +51,24 @@ class JinjaInterpolation(Interpolation):
     For example,
     "{{ max(2, 3) }}" will return 3
 
+    Templates are compiled once per process and cached by their source string, so evaluating the same string repeatedly only pays
+    for rendering.
+
     Additional information on jinja templating can be found at https://jinja.palletsprojects.com/en/3.1.x/templates/#
     """
 
     def __init__(self):
-        self._environment = Environment()
-        self._environment.filters.update(**filters)
-        self._environment.globals.update(**macros)
+        self._environment = _environment
+
+    @staticmethod
+    def is_templated(input_str: str) -> bool:
+        """
+        Returns True if the string contains jinja syntax and has to be rendered, False if it is a plain literal.
+
+        :param input_str: The string to inspect
+        :return: Whether the string needs to go through the template engine
+        """
+        return any(delimiter in input_str for delimiter in TEMPLATE_DELIMITERS)
 
     def eval(self, input_str: str, config: Config, default: Optional[str] = None, **additional_options):
         context = {"config": config, **additional_options}
@@ -59,7 +93,7 @@ class JinjaInterpolation(Interpolation):
 
     def _eval(self, s: str, context):
         try:
-            return self._environment.from_string(s).render(context)
+            return _compile(s).render(context)
         except TypeError:
             # The string is a static value, not a jinja template
             # It can be returned as is
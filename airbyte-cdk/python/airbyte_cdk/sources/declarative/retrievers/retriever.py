@@ -36,6 +36,16 @@ class Retriever(JsonSchemaMixin):
         :return: The records read from the API source
         """
 
+    @abstractmethod
+    def copy_for_concurrent_read(self) -> "Retriever":
+        """
+        Returns a retriever reading the same data whose reads don't share any per-read state (e.g. pagination) with the reads of this
+        retriever, so that slices can be read from several threads at the same time. The stream state is still shared, so updating it
+        must be thread safe.
+
+        :return: The retriever to read a slice with, concurrently with other slices
+        """
+
     @abstractmethod
     def stream_slices(self, *, sync_mode: SyncMode, stream_state: Optional[StreamState] = None) -> Iterable[Optional[StreamSlice]]:
         """Returns the stream slices"""
@@ -2,8 +2,10 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
+import copy
 import json
 import logging
+import threading
 from dataclasses import InitVar, dataclass, field
 from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
 
@@ -26,6 +28,10 @@ from airbyte_cdk.sources.streams.http import HttpStream
 from airbyte_cdk.utils.airbyte_secrets_utils import filter_secrets
 from dataclasses_jsonschema import JsonSchemaMixin
 
+# Guards the cursor updates of stream slicers, which happen from several threads when slices are read concurrently. It isn't an attribute
+# of the retriever as retrievers are deep copied when building declarative components
+_cursor_lock = threading.Lock()
+
 
 @dataclass
 class SimpleRetriever(Retriever, HttpStream, JsonSchemaMixin):
@@ -374,14 +380,29 @@ class SimpleRetriever(Retriever, HttpStream, JsonSchemaMixin):
         for record in records_generator:
             # Only record messages should be parsed to update the cursor which is indicated by the Mapping type
             if isinstance(record, Mapping):
-                self.stream_slicer.update_cursor(stream_slice, last_record=record)
+                self._update_cursor(stream_slice, last_record=record)
             yield record
         else:
             last_record = self._last_records[-1] if self._last_records else None
             if last_record and isinstance(last_record, Mapping):
-                self.stream_slicer.update_cursor(stream_slice, last_record=last_record)
+                self._update_cursor(stream_slice, last_record=last_record)
             yield from []
 
+    def _update_cursor(self, stream_slice: StreamSlice, last_record: Optional[Record] = None):
+        with _cursor_lock:
+            self.stream_slicer.update_cursor(stream_slice, last_record=last_record)
+
+    def copy_for_concurrent_read(self) -> "SimpleRetriever":
+        """
+        The paginator, the last response and the last records are updated while a slice is read, so the copy gets its own. The requester,
+        the session and the stream slicer are shared, the cursor of the stream slicer being the stream state, which is updated under a lock.
+        """
+        retriever = copy.copy(self)
+        retriever.paginator = copy.deepcopy(self.paginator)
+        retriever._last_response = None
+        retriever._last_records = None
+        return retriever
+
     def stream_slices(
         self, *, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Optional[StreamState] = None
     ) -> Iterable[Optional[Mapping[str, Any]]]:
@@ -403,7 +424,14 @@ class SimpleRetriever(Retriever, HttpStream, JsonSchemaMixin):
     @state.setter
     def state(self, value: StreamState):
         """State setter, accept state serialized by state getter."""
-        self.stream_slicer.update_cursor(value)
+        self._update_cursor(value)
+
+    @property
+    def slice_concurrency(self) -> int:
+        """
+        Number of slices read at the same time, as configured on the stream slicer (e.g. SubstreamSlicer.concurrency)
+        """
+        return getattr(self.stream_slicer, "concurrency", 1)
 
     def parse_records_and_emit_request_and_responses(self, request, response, stream_slice, stream_state) -> Iterable[StreamData]:
         # Only emit requests and responses when running in debug mode
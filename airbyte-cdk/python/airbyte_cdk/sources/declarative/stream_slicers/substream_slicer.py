@@ -2,6 +2,7 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
+import functools
 from dataclasses import InitVar, dataclass
 from typing import Any, Iterable, List, Mapping, Optional
 
@@ -10,6 +11,7 @@ from airbyte_cdk.sources.declarative.requesters.request_option import RequestOpt
 from airbyte_cdk.sources.declarative.stream_slicers.stream_slicer import StreamSlicer
 from airbyte_cdk.sources.declarative.types import Record, StreamSlice, StreamState
 from airbyte_cdk.sources.streams.core import Stream
+from airbyte_cdk.sources.utils.concurrency import read_partitions_concurrently, read_partitions_interleaved
 from dataclasses_jsonschema import JsonSchemaMixin
 
 
@@ -22,6 +24,8 @@ class ParentStreamConfig(JsonSchemaMixin):
     parent_key: The key of the parent stream's records that will be the stream slice key
     stream_slice_field: The stream slice key
     request_option: How to inject the slice value on an outgoing HTTP request
+    batch_size: Number of parent keys grouped in a single stream slice, for APIs filtering on several ids at once (e.g. ids=a,b,c)
+    batch_separator: The separator the parent keys of a batch are joined with
     """
 
     stream: Stream
@@ -29,6 +33,8 @@ class ParentStreamConfig(JsonSchemaMixin):
     stream_slice_field: str
     options: InitVar[Mapping[str, Any]]
     request_option: Optional[RequestOption] = None
+    batch_size: int = 1
+    batch_separator: str = ","
 
 
 @dataclass
@@ -39,14 +45,26 @@ class SubstreamSlicer(StreamSlicer, JsonSchemaMixin):
 
     Attributes:
         parent_stream_configs (List[ParentStreamConfig]): parent streams to iterate over and their config
+        concurrency (int): Number of parent stream slices read at the same time, and of slices of the stream itself read at the same time
+        (see DeclarativeStream.slice_concurrency). The parent streams are then read from several threads: declarative parent streams read
+        each slice with their own copy_for_concurrent_read, other parent streams must have a thread safe read_records
+        ordered (bool): Whether slices are emitted in the order of the parent stream slices when they are read concurrently, or as soon as
+        their parent record is read
     """
 
     parent_stream_configs: List[ParentStreamConfig]
     options: InitVar[Mapping[str, Any]]
+    concurrency: int = 1
+    ordered: bool = True
 
     def __post_init__(self, options: Mapping[str, Any]):
         if not self.parent_stream_configs:
             raise ValueError("SubstreamSlicer needs at least 1 parent stream")
+        if self.concurrency < 1:
+            raise ValueError(f"SubstreamSlicer concurrency must be at least 1, got {self.concurrency}")
+        for parent_stream_config in self.parent_stream_configs:
+            if parent_stream_config.batch_size < 1:
+                raise ValueError(f"ParentStreamConfig batch_size must be at least 1, got {parent_stream_config.batch_size}")
         self._cursor = None
         self._options = options
 
@@ -123,30 +141,62 @@ class SubstreamSlicer(StreamSlicer, JsonSchemaMixin):
         - parent_stream_slice: mapping representing the parent's stream slice
         - parent_record: mapping representing the parent record
         - parent_stream_name: string representing the parent stream name
+
+        If the parent stream config has a batch_size, the keys of up to batch_size records of the same parent slice are joined in a
+        single stream slice.
         """
         if not self.parent_stream_configs:
             yield from []
         else:
             for parent_stream_config in self.parent_stream_configs:
-                parent_stream = parent_stream_config.stream
-                parent_field = parent_stream_config.parent_key
-                stream_state_field = parent_stream_config.stream_slice_field
-                for parent_stream_slice in parent_stream.stream_slices(sync_mode=sync_mode, cursor_field=None, stream_state=stream_state):
-                    empty_parent_slice = True
-                    parent_slice = parent_stream_slice
-
-                    for parent_record in parent_stream.read_records(
-                        sync_mode=SyncMode.full_refresh, cursor_field=None, stream_slice=parent_stream_slice, stream_state=None
-                    ):
-                        # Skip non-records (eg AirbyteLogMessage)
-                        if isinstance(parent_record, AirbyteMessage):
-                            if parent_record.type == Type.RECORD:
-                                parent_record = parent_record.record.data
-                            else:
-                                continue
-                        empty_parent_slice = False
-                        stream_state_value = parent_record.get(parent_field)
-                        yield {stream_state_field: stream_state_value, "parent_slice": parent_slice}
-                    # If the parent slice contains no records,
-                    if empty_parent_slice:
-                        yield from []
+                parent_stream_slices = parent_stream_config.stream.stream_slices(
+                    sync_mode=sync_mode, cursor_field=None, stream_state=stream_state
+                )
+                read_parent_slice = functools.partial(
+                    self._stream_slices_from_parent_slice, parent_stream_config, concurrent_read=self.concurrency > 1
+                )
+                if self.concurrency == 1:
+                    for parent_stream_slice in parent_stream_slices:
+                        yield from read_parent_slice(parent_stream_slice)
+                elif self.ordered:
+                    for _, stream_slices in read_partitions_concurrently(parent_stream_slices, read_parent_slice, self.concurrency):
+                        yield from stream_slices
+                else:
+                    for _, stream_slice in read_partitions_interleaved(parent_stream_slices, read_parent_slice, self.concurrency):
+                        yield stream_slice
+
+    @staticmethod
+    def _stream_slices_from_parent_slice(
+        parent_stream_config: ParentStreamConfig, parent_stream_slice: StreamSlice, concurrent_read: bool = False
+    ) -> Iterable[StreamSlice]:
+        parent_stream = parent_stream_config.stream
+        if concurrent_read and hasattr(parent_stream, "copy_for_concurrent_read"):
+            # Declarative streams keep pagination state while reading a slice, so each slice is read with its own copy
+            parent_stream = parent_stream.copy_for_concurrent_read()
+        parent_field = parent_stream_config.parent_key
+        stream_state_field = parent_stream_config.stream_slice_field
+        batch: List[Any] = []
+        for parent_record in parent_stream.read_records(
+            sync_mode=SyncMode.full_refresh, cursor_field=None, stream_slice=parent_stream_slice, stream_state=None
+        ):
+            # Skip non-records (eg AirbyteLogMessage)
+            if isinstance(parent_record, AirbyteMessage):
+                if parent_record.type == Type.RECORD:
+                    parent_record = parent_record.record.data
+                else:
+                    continue
+            stream_state_value = parent_record.get(parent_field)
+            if parent_stream_config.batch_size == 1:
+                yield {stream_state_field: stream_state_value, "parent_slice": parent_stream_slice}
+                continue
+            batch.append(stream_state_value)
+            if len(batch) == parent_stream_config.batch_size:
+                yield {stream_state_field: _join_batch(parent_stream_config, batch), "parent_slice": parent_stream_slice}
+                batch = []
+        # If the parent slice contains no records, no stream slice is emitted for it
+        if batch:
+            yield {stream_state_field: _join_batch(parent_stream_config, batch), "parent_slice": parent_stream_slice}
+
+
+def _join_batch(parent_stream_config: ParentStreamConfig, batch: List[Any]) -> str:
+    return parent_stream_config.batch_separator.join(str(value) for value in batch)
@@ -13,7 +13,7 @@ import airbyte_cdk.sources.utils.casing as casing
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteStream, AirbyteTraceMessage, SyncMode
 
 # list of all possible HTTP methods which can be used for sending of request bodies
-from airbyte_cdk.sources.utils.schema_helpers import ResourceSchemaLoader
+from airbyte_cdk.sources.utils.schema_helpers import ResourceSchemaLoader, schema_loads
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 from deprecated.classic import deprecated
 
@@ -120,6 +120,26 @@ class Stream(ABC):
         # TODO show an example of using pydantic to define the JSON schema, or reading an OpenAPI spec
         return ResourceSchemaLoader(package_name_from_class(self.__class__)).get_schema(self.name)
 
+    def get_cached_json_schema(self) -> Mapping[str, Any]:
+        """
+        :return: The JSON schema of the stream, as returned by get_json_schema the first time this is called.
+
+        Used when emitting records so that schemas which are expensive to compute (e.g. discovered from the API) are only computed once
+        per sync. Streams whose schema can change while they are read should call invalidate_json_schema when it does.
+        """
+        schema = self.__dict__.get("_cached_json_schema")
+        if schema is None:
+            schema_loads[self.name] += 1
+            schema = self.get_json_schema()
+            self._cached_json_schema = schema
+        return schema
+
+    def invalidate_json_schema(self):
+        """
+        Forgets the schema cached by get_cached_json_schema, so that get_json_schema is called again when the next record is emitted.
+        """
+        self.__dict__.pop("_cached_json_schema", None)
+
     def as_airbyte_stream(self) -> AirbyteStream:
         stream = AirbyteStream(name=self.name, json_schema=dict(self.get_json_schema()), supported_sync_modes=[SyncMode.full_refresh])
 
@@ -205,6 +225,33 @@ class Stream(ABC):
         """
         return None
 
+    @property
+    def state_checkpoint_interval_seconds(self) -> Optional[float]:
+        """
+        Decides how often to checkpoint state based on time rather than on a number of records. E.g: if this returns a value of 60, then
+        state is persisted after reading a record if it wasn't persisted in the last 60 seconds. Can be combined with
+        state_checkpoint_interval, in which case state is persisted as soon as either of them is reached.
+
+        Useful for streams whose records arrive at an uneven pace, for which a record count is either too frequent or too rare. Like
+        state_checkpoint_interval, it requires records to be returned in ascending order of their cursor, and is not applied when slices
+        are read concurrently.
+        """
+        return None
+
+    @property
+    def slice_concurrency(self) -> int:
+        """
+        Decides how many stream slices are read at the same time. By default slices are read one after the other.
+
+        When this returns a value greater than 1, slices are read in batches of that size on a pool of threads. Records are still emitted
+        in the order of the slices, and state is only checkpointed once every slice of a batch has been read, so a checkpoint never covers
+        a slice which hasn't been fully read. state_checkpoint_interval is not applied in this mode.
+
+        Only enable it if read_records is thread safe and the stream state doesn't depend on the order records are read in, e.g. it keeps
+        the maximum cursor value.
+        """
+        return 1
+
     @deprecated(version="0.1.49", reason="You should use explicit state property instead, see IncrementalMixin docs.")
     def get_updated_state(self, current_stream_state: MutableMapping[str, Any], latest_record: Mapping[str, Any]):
         """Override to extract state from the latest record. Needed to implement incremental sync.
@@ -0,0 +1,186 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import asyncio
+from abc import ABC
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, List, Mapping, Optional, Tuple, Union
+
+import requests
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.core import StreamData
+
+from .http import HttpStream
+
+# Number of records read ahead of the consumer across all the slices read by read_slices_async
+DEFAULT_BUFFER_SIZE = 1000
+
+StreamSlice = Optional[Mapping[str, Any]]
+
+
+class _SliceDone:
+    """Marks the end of the records of a slice"""
+
+
+class _SliceFailure:
+    """Wraps an exception raised while reading a slice, to be re-raised by the consumer"""
+
+    def __init__(self, exception: Exception):
+        self.exception = exception
+
+
+async def _iterate(items: Union[Iterable[Any], AsyncIterable[Any]]) -> AsyncIterator[Any]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+class AsyncHttpStream(HttpStream, ABC):
+    """
+    HttpStream which can also be read from asyncio code, so that the requests of many slices are in flight at the same time while a
+    single thread parses the responses.
+
+    The stream is defined exactly like an HttpStream (path, request_params, next_page_token, parse_response, should_retry, backoff_time,
+    etc.) and keeps working when read synchronously. Requests are still sent with requests, on the default executor of the event loop,
+    so every hook receives the same requests objects and the backoff policy is unchanged.
+
+    read_records_async and read_slices_async are building blocks for connectors driving their own event loop: AbstractSource never
+    calls them and reads the stream with read_records, like any other stream (see slice_concurrency to read its slices concurrently).
+    Like HttpStream.read_records, read_records_async only depends on the slice and the state, sync_mode and cursor_field are unused.
+    A stream overriding read_records has to override read_records_async accordingly.
+
+    Reading the slices of a substream while the parent records are being read only requires passing the parent records as an async
+    iterable of slices:
+
+        parent_records = parent.read_slices_async(SyncMode.full_refresh, parent.stream_slices(sync_mode=SyncMode.full_refresh))
+        child_slices = ({"parent": record} async for _, record in parent_records)
+        async for stream_slice, record in child.read_slices_async(SyncMode.full_refresh, child_slices):
+            ...
+    """
+
+    @property
+    def max_concurrent_requests(self) -> int:
+        """
+        Override if needed. Maximum number of slices read at the same time by read_slices_async, and so of requests in flight. Requests
+        are sent on the default executor of the event loop, whose number of workers bounds them as well.
+        """
+        return 10
+
+    @property
+    def pool_size(self) -> int:
+        return max(super().pool_size, self.max_concurrent_requests)
+
+    async def read_records_async(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: List[str] = None,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> AsyncIterator[StreamData]:
+        """
+        Asynchronous version of HttpStream.read_records: reads the pages of a slice without blocking the event loop while waiting for
+        responses. sync_mode and cursor_field are unused, as in HttpStream.read_records.
+        """
+        async for record in self._read_pages_async(
+            lambda req, res, state, _slice: self.parse_response(res, stream_slice=_slice, stream_state=state), stream_slice, stream_state
+        ):
+            yield record
+
+    async def read_slices_async(
+        self,
+        sync_mode: SyncMode,
+        stream_slices: Union[Iterable[StreamSlice], AsyncIterable[StreamSlice]],
+        cursor_field: List[str] = None,
+        stream_state: Mapping[str, Any] = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> AsyncIterator[Tuple[StreamSlice, StreamData]]:
+        """
+        Reads up to max_concurrent_requests slices at the same time, yielding their records as soon as they are parsed.
+
+        Records of a given slice keep their order while records of different slices are interleaved. A new slice is pulled from
+        stream_slices whenever one is fully read, so slices can be produced while the first ones are read. The first exception raised
+        while reading a slice is re-raised and the other slices are cancelled.
+
+        :param sync_mode: The sync mode the slices are read with
+        :param stream_slices: The slices to read, e.g. the output of stream_slices or an async iterable of parent records
+        :param cursor_field: The cursor field the slices are read with
+        :param stream_state: The state the slices are read with
+        :param buffer_size: Maximum number of records waiting to be consumed, across all the slices
+        :return: Async iterator of (slice, record)
+        """
+        buffer: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+
+        async def read_slice(stream_slice: StreamSlice):
+            try:
+                async for record in self.read_records_async(sync_mode, cursor_field, stream_slice, stream_state):
+                    await buffer.put((stream_slice, record))
+                await buffer.put(_SliceDone())
+            except Exception as e:
+                await buffer.put(_SliceFailure(e))
+
+        slice_iterator = _iterate(stream_slices).__aiter__()
+        tasks = set()
+
+        async def start_next_slice() -> bool:
+            try:
+                stream_slice = await slice_iterator.__anext__()
+            except StopAsyncIteration:
+                return False
+            task = asyncio.ensure_future(read_slice(stream_slice))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            return True
+
+        try:
+            in_flight = 0
+            while in_flight < self.max_concurrent_requests and await start_next_slice():
+                in_flight += 1
+            while in_flight:
+                item = await buffer.get()
+                if isinstance(item, _SliceDone):
+                    in_flight -= 1
+                    if await start_next_slice():
+                        in_flight += 1
+                elif isinstance(item, _SliceFailure):
+                    raise item.exception
+                else:
+                    yield item
+        finally:
+            for task in list(tasks):
+                task.cancel()
+
+    async def _read_pages_async(
+        self,
+        records_generator_fn: Callable[
+            [requests.PreparedRequest, requests.Response, Mapping[str, Any], Mapping[str, Any]], Iterable[StreamData]
+        ],
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> AsyncIterator[StreamData]:
+        stream_state = stream_state or {}
+        pagination_complete = False
+        next_page_token = None
+        page_count = 0
+        while not pagination_complete:
+            request, response = await self._fetch_next_page_async(stream_slice, stream_state, next_page_token)
+            for record in records_generator_fn(request, response, stream_state, stream_slice):
+                yield record
+            page_count += 1
+
+            next_page_token = self.next_page_token(response)
+            if not next_page_token:
+                pagination_complete = True
+            elif self._page_limit_reached(page_count):
+                yield self._page_limit_reached_message(stream_slice)
+                pagination_complete = True
+
+    async def _fetch_next_page_async(
+        self, stream_slice: Mapping[str, Any] = None, stream_state: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
+    ) -> Tuple[requests.PreparedRequest, requests.Response]:
+        request, request_kwargs = self._create_next_page_request(stream_slice, stream_state, next_page_token)
+        # _send_request blocks, including while backing off, so it runs on the default executor of the loop
+        response = await asyncio.get_running_loop().run_in_executor(None, self._send_request, request, request_kwargs)
+        return request, response
@@ -0,0 +1,107 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import socket
+import threading
+from typing import Any, List, MutableMapping, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+# Maximum number of connections kept open to a single host, requests' own default
+DEFAULT_POOL_SIZE = DEFAULT_POOLSIZE
+# Idle time after which the OS starts probing a connection kept alive, and interval between the probes, in seconds
+TCP_KEEPALIVE_IDLE = 60
+TCP_KEEPALIVE_INTERVAL = 30
+
+
+def _tcp_keepalive_socket_options() -> List[Tuple[int, int, int]]:
+    options = list(HTTPConnection.default_socket_options) + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    # Not every platform exposes the tuning options
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, TCP_KEEPALIVE_IDLE))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, TCP_KEEPALIVE_INTERVAL))
+    return options
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose connections can be kept alive with TCP keep-alive probes, so that connections idle between two pages (e.g. while
+    records are being processed) aren't silently dropped by a firewall or a load balancer.
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, tcp_keepalive: bool = False):
+        self.pool_size = pool_size
+        self.tcp_keepalive = tcp_keepalive
+        super().__init__(pool_connections=pool_size, pool_maxsize=pool_size)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any):
+        if self.tcp_keepalive:
+            kwargs["socket_options"] = _tcp_keepalive_socket_options()
+        super().init_poolmanager(*args, **kwargs)
+
+
+class ConnectionPoolRegistry:
+    """
+    Holds one HTTPAdapter, and thus one pool of connections, per host and pool settings.
+
+    requests.Session instances each come with their own connection pools, so streams reaching the same API would otherwise each do their
+    own TLS handshakes. Mounting the adapter of the registry on their session lets them reuse each other's connections while keeping their
+    own session state (authentication, headers, cookies). Adapters are thread safe so they can be shared by streams read concurrently.
+    """
+
+    def __init__(self):
+        self._adapters: MutableMapping[Tuple[str, int, bool], PooledHTTPAdapter] = {}
+        self._lock = threading.Lock()
+
+    def get_adapter(self, url: str, pool_size: int = DEFAULT_POOL_SIZE, tcp_keepalive: bool = False) -> PooledHTTPAdapter:
+        """
+        :param url: Any URL of the host
+        :param pool_size: Maximum number of connections kept open to the host
+        :param tcp_keepalive: Whether TCP keep-alive probes are sent on idle connections
+        :return: The adapter shared by all the sessions reaching the host of the url with the same settings
+        """
+        key = (host_prefix(url), pool_size, tcp_keepalive)
+        with self._lock:
+            adapter = self._adapters.get(key)
+            if adapter is None:
+                adapter = PooledHTTPAdapter(pool_size=pool_size, tcp_keepalive=tcp_keepalive)
+                self._adapters[key] = adapter
+            return adapter
+
+    def mount(self, session: requests.Session, url: str, pool_size: int = DEFAULT_POOL_SIZE, tcp_keepalive: bool = False) -> str:
+        """
+        Mounts the shared adapter of the host of the url on the session.
+
+        :return: The prefix the adapter was mounted on
+        """
+        prefix = host_prefix(url)
+        session.mount(prefix, self.get_adapter(url, pool_size=pool_size, tcp_keepalive=tcp_keepalive))
+        return prefix
+
+    def clear(self):
+        """
+        Closes all the connections of the registry and forgets about its adapters.
+        """
+        with self._lock:
+            adapters = list(self._adapters.values())
+            self._adapters.clear()
+        for adapter in adapters:
+            adapter.close()
+
+
+def host_prefix(url: str) -> str:
+    """
+    :return: The scheme and network location of the url with a trailing slash, e.g. "https://api.example.com/", which is the prefix
+    requests matches adapters against
+    """
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}/".lower()
+
+
+# Registry used by HttpStream, shared by all the streams of the process
+connection_pools = ConnectionPoolRegistry()
@@ -7,19 +7,22 @@ import logging
 import os
 from abc import ABC, abstractmethod
 from contextlib import suppress
-from typing import Any, Callable, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
 from urllib.parse import urljoin
 
 import requests
 import requests_cache
-from airbyte_cdk.models import SyncMode
+from airbyte_cdk.models import AirbyteMessage, SyncMode
 from airbyte_cdk.sources.streams.core import Stream, StreamData
+from airbyte_cdk.sources.utils.concurrency import read_partitions_concurrently
+from airbyte_cdk.sources.utils.schema_helpers import limit_reached_message
 from requests.auth import AuthBase
 from requests_cache.session import CachedSession
 
 from .auth.core import HttpAuthenticator, NoAuth
+from .connection_pool import DEFAULT_POOL_SIZE, connection_pools, host_prefix
 from .exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
-from .rate_limiting import default_backoff_handler, user_defined_backoff_handler
+from .rate_limiting import RateLimiter, default_backoff_handler, user_defined_backoff_handler
 
 # list of all possible HTTP methods which can be used for sending of request bodies
 BODY_REQUEST_METHODS = ("GET", "POST", "PUT", "PATCH")
@@ -32,6 +35,9 @@ class HttpStream(Stream, ABC):
 
     source_defined_cursor = True  # Most HTTP streams use a source defined cursor (i.e: the user can't configure it like on a SQL table)
     page_size: Optional[int] = None  # Use this variable to define page size for API http requests with pagination support
+    page_limit: Optional[int] = None  # Maximum number of pages read per slice, set from the internal config e.g. for test reads
+    # RateLimiter pacing the requests of the stream, shared by all the streams it is set on (e.g. on the base class of a source's streams)
+    rate_limiter: Optional[RateLimiter] = None
 
     # TODO: remove legacy HttpAuthenticator authenticator references
     def __init__(self, authenticator: Union[AuthBase, HttpAuthenticator] = None):
@@ -39,12 +45,17 @@ class HttpStream(Stream, ABC):
             self._session = self.request_cache()
         else:
             self._session = requests.Session()
+        # Adapters the session comes with, the shared connection pools only replace these ones and not the adapters mounted by the
+        # connector itself (e.g. to configure retries)
+        self._default_adapters = list(self._session.adapters.values())
 
         self._authenticator: HttpAuthenticator = NoAuth()
         if isinstance(authenticator, AuthBase):
             self._session.auth = authenticator
         elif authenticator:
             self._authenticator = authenticator
+        # Hosts whose shared connection pool is mounted on the session, mounted lazily as url_base may depend on the config
+        self._pooled_hosts = set()
 
     @property
     def cache_filename(self):
@@ -109,6 +120,34 @@ class HttpStream(Stream, ABC):
         """
         return 5
 
+    @property
+    def pool_size(self) -> int:
+        """
+        Override if needed. Maximum number of connections kept open to a host. Connection pools are shared by all the streams reaching the
+        same host with the same pool settings, so they reuse each other's connections instead of doing new TLS handshakes.
+        """
+        return max(DEFAULT_POOL_SIZE, self.slice_concurrency)
+
+    @property
+    def tcp_keepalive(self) -> bool:
+        """
+        Override if needed. If True, TCP keep-alive probes are sent on idle connections so that connections kept open between requests
+        aren't dropped by a firewall or a load balancer.
+        """
+        return False
+
+    @property
+    def page_prefetch_depth(self) -> int:
+        """
+        Override if needed. If greater than 0, pages are fetched on a background thread while the records of the previous pages are
+        parsed and emitted. Fetching pauses once this many pages are waiting to be parsed.
+
+        The next page token is then computed as soon as a response arrives, before its records are parsed, and the requests are built
+        and sent from the background thread. Only enable it if next_page_token and the request hooks (request_params, path, etc.) don't
+        depend on state updated while parsing records, e.g. for cursor-paginated APIs returning the next cursor in the response.
+        """
+        return 0
+
     @property
     def authenticator(self) -> HttpAuthenticator:
         return self._authenticator
@@ -295,7 +334,12 @@ class HttpStream(Stream, ABC):
         self.logger.debug(
             "Making outbound API request", extra={"headers": request.headers, "url": request.url, "request_body": request.body}
         )
+        self._mount_connection_pool(request.url)
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
         response: requests.Response = self._session.send(request, **request_kwargs)
+        if self.rate_limiter:
+            self.rate_limiter.update_from_response(response)
 
         # Evaluation of response.text can be heavy, for example, if streaming a large response
         # Do it only in debug mode
@@ -321,6 +365,16 @@ class HttpStream(Stream, ABC):
                 raise exc
         return response
 
+    def _mount_connection_pool(self, url: str):
+        if not url or not url.startswith(("http://", "https://")):
+            return
+        prefix = host_prefix(url)
+        if prefix not in self._pooled_hosts:
+            # requests uses the adapter mounted on the longest matching prefix, so mounting on the host would shadow a custom adapter
+            if any(self._session.get_adapter(url) is adapter for adapter in self._default_adapters):
+                connection_pools.mount(self._session, url, pool_size=self.pool_size, tcp_keepalive=self.tcp_keepalive)
+            self._pooled_hosts.add(prefix)
+
     def _send_request(self, request: requests.PreparedRequest, request_kwargs: Mapping[str, Any]) -> requests.Response:
         """
         Creates backoff wrappers which are responsible for retry logic
@@ -423,22 +477,75 @@ class HttpStream(Stream, ABC):
         stream_state: Mapping[str, Any] = None,
     ) -> Iterable[StreamData]:
         stream_state = stream_state or {}
+        if self.page_prefetch_depth > 0:
+            yield from self._read_prefetched_pages(records_generator_fn, stream_slice, stream_state)
+            return
         pagination_complete = False
         next_page_token = None
+        page_count = 0
         while not pagination_complete:
             request, response = self._fetch_next_page(stream_slice, stream_state, next_page_token)
             yield from records_generator_fn(request, response, stream_state, stream_slice)
+            page_count += 1
 
             next_page_token = self.next_page_token(response)
             if not next_page_token:
                 pagination_complete = True
+            elif self._page_limit_reached(page_count):
+                yield self._page_limit_reached_message(stream_slice)
+                pagination_complete = True
 
         # Always return an empty generator just in case no records were ever yielded
         yield from []
 
+    def _read_prefetched_pages(
+        self,
+        records_generator_fn: Callable[
+            [requests.PreparedRequest, requests.Response, Mapping[str, Any], Mapping[str, Any]], Iterable[StreamData]
+        ],
+        stream_slice: Mapping[str, Any],
+        stream_state: Mapping[str, Any],
+    ) -> Iterable[StreamData]:
+        def fetch_pages(_slice: Mapping[str, Any]) -> Iterator[Optional[Tuple[requests.PreparedRequest, requests.Response]]]:
+            next_page_token = None
+            page_count = 0
+            while True:
+                request, response = self._fetch_next_page(_slice, stream_state, next_page_token)
+                yield request, response
+                page_count += 1
+                next_page_token = self.next_page_token(response)
+                if not next_page_token:
+                    return
+                if self._page_limit_reached(page_count):
+                    # Tells the consumer that pages were left unread
+                    yield None
+                    return
+
+        # A single slice is read on a single worker: its pages are fetched one after the other, ahead of the records being parsed
+        for _slice, pages in read_partitions_concurrently([stream_slice], fetch_pages, max_workers=1, buffer_size=self.page_prefetch_depth):
+            for page in pages:
+                if page is None:
+                    yield self._page_limit_reached_message(_slice)
+                else:
+                    request, response = page
+                    yield from records_generator_fn(request, response, stream_state, _slice)
+
+    def _page_limit_reached(self, page_count: int) -> bool:
+        return bool(self.page_limit) and page_count >= self.page_limit
+
+    def _page_limit_reached_message(self, stream_slice: Mapping[str, Any]) -> AirbyteMessage:
+        return limit_reached_message(f"Stopped reading slice {stream_slice} of stream {self.name} after {self.page_limit} pages")
+
     def _fetch_next_page(
         self, stream_slice: Mapping[str, Any] = None, stream_state: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
     ) -> Tuple[requests.PreparedRequest, requests.Response]:
+        request, request_kwargs = self._create_next_page_request(stream_slice, stream_state, next_page_token)
+        response = self._send_request(request, request_kwargs)
+        return request, response
+
+    def _create_next_page_request(
+        self, stream_slice: Mapping[str, Any] = None, stream_state: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
+    ) -> Tuple[requests.PreparedRequest, Mapping[str, Any]]:
         request_headers = self.request_headers(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
         request = self._create_prepared_request(
             path=self.path(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
@@ -448,9 +555,7 @@ class HttpStream(Stream, ABC):
             data=self.request_body_data(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
         )
         request_kwargs = self.request_kwargs(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
-
-        response = self._send_request(request, request_kwargs)
-        return request, response
+        return request, request_kwargs
 
 
 class HttpSubStream(HttpStream, ABC):
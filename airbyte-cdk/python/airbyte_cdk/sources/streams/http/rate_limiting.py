@@ -4,10 +4,13 @@
 
 import logging
 import sys
+import threading
 import time
-from typing import Optional
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
 
 import backoff
+import requests
 from requests import codes, exceptions
 
 from .exceptions import DefaultBackoffException, UserDefinedBackoffException
@@ -75,3 +78,107 @@ def user_defined_backoff_handler(max_tries: Optional[int], **kwargs):
         max_tries=max_tries,
         **kwargs,
     )
+
+
+class RateLimiter(ABC):
+    """
+    Paces the requests sent by HttpStreams on the client side, so that they stay under the quota of an API instead of being rejected
+    and backed off. A rate limiter is thread safe and can be shared by all the streams of a source, e.g. by setting it as the rate_limiter
+    class attribute of their base class.
+    """
+
+    @abstractmethod
+    def acquire(self):
+        """
+        Blocks until a request can be sent. Called before every request, retries included.
+        """
+
+    def update_from_response(self, response: requests.Response):
+        """
+        Called with every response received, e.g. to adjust the pace to the quota the API reports. Does nothing by default.
+        """
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    """
+    Token bucket allowing `rate` requests per second on average, with bursts of up to `capacity` requests.
+
+    If the API reports how many requests are left in its response headers (e.g. X-RateLimit-Remaining), the bucket never holds more
+    tokens than that, which accounts for the quota used by other clients. Once no request is left, requests are held until the quota
+    resets, as reported by reset_header, or at the pace of the bucket otherwise.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        remaining_header: Optional[str] = None,
+        reset_header: Optional[str] = None,
+        reset_header_is_timestamp: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        :param rate: Number of requests allowed per second
+        :param capacity: Maximum number of requests sent in a burst, defaults to rate (and at least 1)
+        :param remaining_header: Response header holding the number of requests left in the current quota window
+        :param reset_header: Response header holding when the quota resets, in seconds from now
+        :param reset_header_is_timestamp: Whether reset_header holds a UNIX timestamp instead (e.g. GitHub)
+        :param clock: Monotonic clock, in seconds
+        :param sleep: Function used to wait, in seconds
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.remaining_header = remaining_header
+        self.reset_header = reset_header
+        self.reset_header_is_timestamp = reset_header_is_timestamp
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated_at = clock()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            # Each request takes its token right away, even if that leaves the bucket in debt, so concurrent callers wait in turn
+            self._tokens -= 1
+            wait = max(-self._tokens / self.rate, self._blocked_until - now, 0.0)
+        if wait > 0:
+            logger.debug(f"Rate limit reached, waiting {wait:.3f} seconds")
+            self._sleep(wait)
+
+    def update_from_response(self, response: requests.Response):
+        if not self.remaining_header:
+            return
+        remaining = _header_as_float(response, self.remaining_header)
+        if remaining is None:
+            return
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens = min(self._tokens, remaining)
+            if remaining <= 0 and self.reset_header:
+                reset = _header_as_float(response, self.reset_header)
+                if reset is not None:
+                    reset_in = reset - time.time() if self.reset_header_is_timestamp else reset
+                    self._blocked_until = max(self._blocked_until, now + reset_in)
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+
+def _header_as_float(response: requests.Response, header: str) -> Optional[float]:
+    value = response.headers.get(header)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(f"Ignoring invalid value of rate limit header {header}: {value}")
+        return None
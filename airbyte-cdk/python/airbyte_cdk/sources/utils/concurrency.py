@@ -0,0 +1,183 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Iterable, Iterator, Tuple, TypeVar
+
+Partition = TypeVar("Partition")
+Output = TypeVar("Output")
+
+# Number of outputs a worker can produce ahead of the consumer before it blocks, which bounds the memory used by buffered partitions
+DEFAULT_BUFFER_SIZE = 1000
+# How often a blocked worker checks whether the consumer is gone, in seconds
+_POLL_INTERVAL = 0.1
+
+
+class _Done:
+    """Marks the end of the outputs of a partition"""
+
+
+class _Failure:
+    """Wraps an exception raised while reading a partition, to be re-raised by the consumer"""
+
+    def __init__(self, exception: BaseException):
+        self.exception = exception
+
+
+def _put(buffer: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    while not stop.is_set():
+        try:
+            buffer.put(item, timeout=_POLL_INTERVAL)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _produce(read: Callable[[Partition], Iterable[Output]], partition: Partition, buffer: queue.Queue, stop: threading.Event):
+    try:
+        for output in read(partition):
+            if not _put(buffer, output, stop):
+                return
+        _put(buffer, _Done(), stop)
+    except BaseException as e:
+        _put(buffer, _Failure(e), stop)
+
+
+def _consume(buffer: queue.Queue) -> Iterator[Output]:
+    while True:
+        item = buffer.get()
+        if isinstance(item, _Done):
+            return
+        if isinstance(item, _Failure):
+            raise item.exception
+        yield item
+
+
+def read_partitions_concurrently(
+    partitions: Iterable[Partition],
+    read: Callable[[Partition], Iterable[Output]],
+    max_workers: int,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> Iterator[Tuple[Partition, Iterator[Output]]]:
+    """
+    Reads partitions (e.g. stream slices) on a pool of threads while preserving their order.
+
+    Up to max_workers partitions are read at the same time. Partitions are yielded in the order of the input along with an iterator
+    over their outputs, which yields outputs as soon as they are produced for the first partition and buffered outputs for the
+    following ones. A new partition is only pulled from the input once a previous one has been fully consumed, so the input iterable
+    is only ever iterated from the calling thread.
+
+    Exceptions raised while reading a partition are re-raised when its outputs are consumed. Closing the returned iterator stops
+    the workers once they try to produce their next output.
+
+    :param partitions: The partitions to read
+    :param read: Function returning the outputs of a partition. It is called from worker threads so it must be thread safe
+    :param max_workers: Maximum number of partitions read at the same time
+    :param buffer_size: Maximum number of outputs buffered per partition
+    :return: Iterator of (partition, outputs of the partition)
+    """
+    stop = threading.Event()
+    partition_iterator = iter(partitions)
+    pending: Deque[Tuple[Partition, queue.Queue]] = deque()
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="partition_reader") as executor:
+
+        def submit_next_partition() -> bool:
+            try:
+                partition = next(partition_iterator)
+            except StopIteration:
+                return False
+            buffer: queue.Queue = queue.Queue(maxsize=buffer_size)
+            executor.submit(_produce, read, partition, buffer, stop)
+            pending.append((partition, buffer))
+            return True
+
+        try:
+            while len(pending) < max_workers and submit_next_partition():
+                pass
+            while pending:
+                partition, buffer = pending.popleft()
+                outputs = _consume(buffer)
+                yield partition, outputs
+                # Whatever the consumer didn't read has to be drained to release the worker
+                for _ in outputs:
+                    pass
+                submit_next_partition()
+        finally:
+            stop.set()
+
+
+class _PartitionDone:
+    """Marks the end of the outputs of a partition read by read_partitions_interleaved"""
+
+    def __init__(self, partition: Any):
+        self.partition = partition
+
+
+def _produce_interleaved(read: Callable[[Partition], Iterable[Output]], partition: Partition, buffer: queue.Queue, stop: threading.Event):
+    try:
+        for output in read(partition):
+            if not _put(buffer, (partition, output), stop):
+                return
+        _put(buffer, _PartitionDone(partition), stop)
+    except BaseException as e:
+        _put(buffer, _Failure(e), stop)
+
+
+def read_partitions_interleaved(
+    partitions: Iterable[Partition],
+    read: Callable[[Partition], Iterable[Output]],
+    max_workers: int,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> Iterator[Tuple[Partition, Output]]:
+    """
+    Reads partitions (e.g. streams) on a pool of threads, yielding outputs as soon as they are produced by any of them.
+
+    Up to max_workers partitions are read at the same time and their outputs go through a single queue of buffer_size outputs, so the
+    outputs of a given partition keep their order while outputs of different partitions are interleaved. A new partition is pulled from
+    the input, from the calling thread, whenever one is fully read.
+
+    The first exception raised while reading a partition is re-raised by the returned iterator, which stops the other workers once they
+    try to produce their next output. Closing the returned iterator stops the workers as well.
+
+    :param partitions: The partitions to read
+    :param read: Function returning the outputs of a partition. It is called from worker threads so it must be thread safe
+    :param max_workers: Maximum number of partitions read at the same time
+    :param buffer_size: Maximum number of outputs waiting to be consumed, across all partitions
+    :return: Iterator of (partition, output)
+    """
+    stop = threading.Event()
+    partition_iterator = iter(partitions)
+    buffer: queue.Queue = queue.Queue(maxsize=buffer_size)
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="partition_reader") as executor:
+
+        def submit_next_partition() -> bool:
+            try:
+                partition = next(partition_iterator)
+            except StopIteration:
+                return False
+            executor.submit(_produce_interleaved, read, partition, buffer, stop)
+            return True
+
+        try:
+            in_flight = 0
+            while in_flight < max_workers and submit_next_partition():
+                in_flight += 1
+            while in_flight:
+                item = buffer.get()
+                if isinstance(item, _PartitionDone):
+                    in_flight -= 1
+                    if submit_next_partition():
+                        in_flight += 1
+                elif isinstance(item, _Failure):
+                    raise item.exception
+                else:
+                    yield item
+        finally:
+            stop.set()
@@ -2,7 +2,7 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
-import datetime
+import time
 from typing import Any, Mapping
 
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, AirbyteRecordMessage, AirbyteTraceMessage
@@ -11,25 +11,43 @@ from airbyte_cdk.sources.streams.core import StreamData
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 
 
+def now_millis() -> int:
+    """
+    :return: The current time as an epoch in milliseconds, the format of the emitted_at field of records
+    """
+    return time.time_ns() // 1_000_000
+
+
 def stream_data_to_airbyte_message(
     stream_name: str,
     data_or_message: StreamData,
     transformer: TypeTransformer = TypeTransformer(TransformConfig.NoTransform),
     schema: Mapping[str, Any] = None,
 ) -> AirbyteMessage:
+    """
+    Converts the output of a stream to an AirbyteMessage.
+
+    Record messages are created without pydantic validation since their fields are known to be valid, which saves a significant
+    amount of CPU on large syncs. Log and trace messages are wrapped in fully validated models.
+
+    :param stream_name: The name of the stream the data belongs to
+    :param data_or_message: A record or a log/trace message emitted by the stream
+    :param transformer: The transformer to apply to records
+    :param schema: The JSON schema of the stream used by the transformer
+    :return: The AirbyteMessage wrapping the data
+    """
     if schema is None:
         schema = {}
 
     if isinstance(data_or_message, dict):
         data = data_or_message
-        now_millis = int(datetime.datetime.now().timestamp() * 1000)
         # Transform object fields according to config. Most likely you will
         # need it to normalize values against json schema. By default no action
         # taken unless configured. See
         # docs/connector-development/cdk-python/schemas.md for details.
         transformer.transform(data, schema)  # type: ignore
-        message = AirbyteRecordMessage(stream=stream_name, data=data, emitted_at=now_millis)
-        return AirbyteMessage(type=MessageType.RECORD, record=message)
+        message = AirbyteRecordMessage.construct(stream=stream_name, data=data, emitted_at=now_millis())
+        return AirbyteMessage.construct(type=MessageType.RECORD, record=message)
     elif isinstance(data_or_message, AirbyteTraceMessage):
         return AirbyteMessage(type=MessageType.TRACE, trace=data_or_message)
     elif isinstance(data_or_message, AirbyteLogMessage):
@@ -3,19 +3,26 @@
 #
 
 
+import copy
 import importlib
 import json
 import os
 import pkgutil
+from collections import Counter
+from functools import lru_cache
 from typing import Any, ClassVar, Dict, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 import jsonref
-from airbyte_cdk.models import ConnectorSpecification, FailureType
+from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, ConnectorSpecification, FailureType, Level, Type
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 from jsonschema import RefResolver, validate
 from jsonschema.exceptions import ValidationError
 from pydantic import BaseModel, Field
 
+# Number of times a schema was actually loaded, by schema file ("<package>/schemas/<name>.json") or by stream name for the schemas loaded
+# when emitting records. Schemas are cached so these are expected to be loaded once per sync, which benchmarks can assert on.
+schema_loads: Counter = Counter()
+
 
 class JsonFileLoader:
     """
@@ -118,32 +125,48 @@ class ResourceSchemaLoader:
         schemas/shared/<shared_definition>.json
         schemas/<name>.json # contains a $ref to shared_definition
         schemas/<name2>.json # contains a $ref to shared_definition
+
+        Schema files are read and resolved once per package and name, and every call returns a copy of the resolved schema so callers
+        can modify it. Call clear_cache if the files change while the process is running.
         """
+        return copy.deepcopy(_load_resource_schema(self.package_name, name))
 
-        schema_filename = f"schemas/{name}.json"
-        raw_file = pkgutil.get_data(self.package_name, schema_filename)
-        if not raw_file:
-            raise IOError(f"Cannot find file {schema_filename}")
-        try:
-            raw_schema = json.loads(raw_file)
-        except ValueError as err:
-            raise RuntimeError(f"Invalid JSON file format for file {schema_filename}") from err
+    @staticmethod
+    def clear_cache():
+        """
+        Forgets every schema loaded from package resources, so they are read again on the next call to get_schema.
+        """
+        _load_resource_schema.cache_clear()
 
-        return self.__resolve_schema_references(raw_schema)
 
-    def __resolve_schema_references(self, raw_schema: dict) -> dict:
-        """
-        Resolve links to external references and move it to local "definitions" map.
+@lru_cache(maxsize=None)
+def _load_resource_schema(package_name: str, name: str) -> dict:
+    schema_filename = f"schemas/{name}.json"
+    schema_loads[f"{package_name}/{schema_filename}"] += 1
+    raw_file = pkgutil.get_data(package_name, schema_filename)
+    if not raw_file:
+        raise IOError(f"Cannot find file {schema_filename}")
+    try:
+        raw_schema = json.loads(raw_file)
+    except ValueError as err:
+        raise RuntimeError(f"Invalid JSON file format for file {schema_filename}") from err
 
-        :param raw_schema jsonschema to lookup for external links.
-        :return JSON serializable object with references without external dependencies.
-        """
+    return _resolve_schema_references(package_name, raw_schema)
 
-        package = importlib.import_module(self.package_name)
-        base = os.path.dirname(package.__file__) + "/"
-        resolved = jsonref.JsonRef.replace_refs(raw_schema, loader=JsonFileLoader(base, "schemas/shared"), base_uri=base)
-        resolved = resolve_ref_links(resolved)
-        return resolved
+
+def _resolve_schema_references(package_name: str, raw_schema: dict) -> dict:
+    """
+    Resolve links to external references and move it to local "definitions" map.
+
+    :param raw_schema jsonschema to lookup for external links.
+    :return JSON serializable object with references without external dependencies.
+    """
+
+    package = importlib.import_module(package_name)
+    base = os.path.dirname(package.__file__) + "/"
+    resolved = jsonref.JsonRef.replace_refs(raw_schema, loader=JsonFileLoader(base, "schemas/shared"), base_uri=base)
+    resolved = resolve_ref_links(resolved)
+    return resolved
 
 
 def check_config_against_spec_or_exit(config: Mapping[str, Any], spec: ConnectorSpecification):
@@ -165,10 +188,17 @@ def check_config_against_spec_or_exit(config: Mapping[str, Any], spec: Connector
         ) from None  # required to prevent logging config secrets from the ValidationError's stacktrace
 
 
+# Prefix of the log messages emitted when a read stops before the end of the data because of the page or slice limit of the InternalConfig
+LIMIT_REACHED_LOG_PREFIX = "limit_reached:"
+
+
 class InternalConfig(BaseModel):
-    KEYWORDS: ClassVar[set] = {"_limit", "_page_size"}
+    KEYWORDS: ClassVar[set] = {"_limit", "_page_size", "_page_limit", "_slice_limit"}
     limit: int = Field(None, alias="_limit")
     page_size: int = Field(None, alias="_page_size")
+    # Maximum number of pages read per slice and of slices read per stream, e.g. to keep test reads short
+    page_limit: int = Field(None, alias="_page_limit")
+    slice_limit: int = Field(None, alias="_slice_limit")
 
     def dict(self, *args, **kwargs):
         kwargs["by_alias"] = True
@@ -176,6 +206,13 @@ class InternalConfig(BaseModel):
         return super().dict(*args, **kwargs)
 
 
+def limit_reached_message(description: str) -> AirbyteMessage:
+    """
+    :return: The log message telling that a read stopped before the end of the data because of a limit of the InternalConfig
+    """
+    return AirbyteMessage(type=Type.LOG, log=AirbyteLogMessage(level=Level.INFO, message=f"{LIMIT_REACHED_LOG_PREFIX} {description}"))
+
+
 def split_config(config: Mapping[str, Any]) -> Tuple[dict, InternalConfig]:
     """
     Break config map object into 2 instances: first is a dict with user defined
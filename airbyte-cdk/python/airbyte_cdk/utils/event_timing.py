@@ -4,6 +4,7 @@
 
 import datetime
 import logging
+import threading
 import time
 from contextlib import contextmanager
 from dataclasses import dataclass, field
@@ -23,25 +24,37 @@ class EventTimer:
         self.events = {}
         self.count = 0
         self.stack = []
+        self._lock = threading.Lock()
 
     def start_event(self, name):
         """
         Start a new event and push it to the stack.
         """
-        self.events[name] = Event(name=name)
-        self.count += 1
-        self.stack.insert(0, self.events[name])
+        with self._lock:
+            self.events[name] = Event(name=name)
+            self.count += 1
+            self.stack.insert(0, self.events[name])
 
-    def finish_event(self):
+    def finish_event(self, name: Optional[str] = None):
         """
         Finish the current event and pop it from the stack.
+        :param name: name of the event to finish instead of the current one, for events which don't follow a LIFO pattern (e.g. streams
+        read concurrently)
         """
 
-        if self.stack:
-            event = self.stack.pop(0)
-            event.finish()
-        else:
-            logger.warning(f"{self.name} finish_event called without start_event")
+        with self._lock:
+            if name is not None:
+                event = self.events.get(name)
+                if event is None or event not in self.stack:
+                    logger.warning(f"{self.name} finish_event called for {name} without start_event")
+                    return
+                self.stack.remove(event)
+                event.finish()
+            elif self.stack:
+                event = self.stack.pop(0)
+                event.finish()
+            else:
+                logger.warning(f"{self.name} finish_event called without start_event")
 
     def report(self, order_by="name"):
         """
@@ -70,6 +83,9 @@ class Event:
         return float("+inf")
 
     def __str__(self):
+        if self.end is None:
+            # e.g. a stream still being read while another one, read concurrently, reports the timer
+            return f"{self.name} in progress"
         return f"{self.name} {datetime.timedelta(seconds=self.duration)}"
 
     def finish(self):
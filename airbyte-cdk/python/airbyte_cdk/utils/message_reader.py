@@ -0,0 +1,60 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import json
+from typing import Any, Union
+
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage
+from airbyte_cdk.models import Type as MessageType
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class InvalidMessageError(ValueError):
+    """Raised when a line can't be deserialized as an Airbyte message"""
+
+
+def _loads(line: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def parse_message(line: Union[bytes, str]) -> AirbyteMessage:
+    """
+    Deserializes a line of the Airbyte protocol into an AirbyteMessage.
+
+    Record messages are by far the most frequent message type, so only their envelope (stream, emitted_at and namespace) is checked
+    and the record data is handed through as the decoded dict, without pydantic validating every value it contains. Every other
+    message type is fully validated.
+
+    :param line: A serialized message, as bytes or str
+    :return: The deserialized message
+    :raises InvalidMessageError: if the line is not a valid Airbyte message
+    """
+    try:
+        obj = _loads(line)
+    except ValueError as e:
+        raise InvalidMessageError(f"Invalid JSON: {e}") from e
+    if not isinstance(obj, dict):
+        raise InvalidMessageError(f"Expected a JSON object, got {type(obj).__name__}")
+
+    if obj.get("type") == MessageType.RECORD.value:
+        record = obj.get("record")
+        if (
+            isinstance(record, dict)
+            and isinstance(record.get("stream"), str)
+            and isinstance(record.get("data"), dict)
+            and isinstance(record.get("emitted_at"), int)
+            and isinstance(record.get("namespace", ""), (str, type(None)))
+        ):
+            return AirbyteMessage.construct(type=MessageType.RECORD, record=AirbyteRecordMessage.construct(**record))
+        # Let pydantic describe what is wrong with the record
+    try:
+        return AirbyteMessage.parse_obj(obj)
+    except ValueError as e:
+        raise InvalidMessageError(str(e)) from e
@@ -0,0 +1,143 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import math
+import sys
+from typing import Any, BinaryIO, Final, List, Mapping, Optional, Union
+
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage
+from airbyte_cdk.models import Type as MessageType
+from pydantic.json import pydantic_encoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Number of bytes accumulated before the buffer is written to the output
+DEFAULT_BUFFER_SIZE: Final[int] = 1024 * 1024
+
+OutputMessage = Union[AirbyteMessage, str]
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        try:
+            # orjson doesn't know how to encode some types (e.g. Decimal) so they go through the same encoder pydantic uses
+            data = orjson.dumps(obj, default=pydantic_encoder)
+        except TypeError:
+            # orjson can't encode integers beyond 64 bits, json can (orjson.JSONEncodeError is a TypeError)
+            pass
+        else:
+            # orjson writes NaN and infinite floats as null, pydantic writes them as NaN/Infinity like json does
+            if b"null" not in data or not _has_non_finite_float(obj):
+                return data
+    return json.dumps(obj, default=pydantic_encoder).encode("utf-8")
+
+
+def _has_non_finite_float(obj: Any) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, Mapping):
+        return any(_has_non_finite_float(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite_float(value) for value in obj)
+    return False
+
+
+def _record_to_dict(record: AirbyteRecordMessage) -> Mapping[str, Any]:
+    # Equivalent to record.dict(exclude_unset=True) without pydantic deep copying the record data
+    return {field_name: getattr(record, field_name) for field_name in record.__fields_set__}
+
+
+def serialize_message(message: OutputMessage) -> bytes:
+    """
+    Serializes a message to the bytes of a single line of the Airbyte protocol, without the trailing newline.
+
+    Records are by far the most frequent message type, so they are encoded with a fast JSON encoder (orjson if it is installed)
+    instead of pydantic's `.json()`. Every other message type is serialized by pydantic.
+
+    :param message: The message to serialize. Strings are assumed to be already serialized messages
+    :return: The serialized message
+    """
+    if isinstance(message, str):
+        return message.encode("utf-8")
+    if message.type == MessageType.RECORD and message.record is not None:
+        return _dumps({"type": MessageType.RECORD.value, "record": _record_to_dict(message.record)})
+    return message.json(exclude_unset=True).encode("utf-8")
+
+
+class AirbyteMessageWriter:
+    """
+    Writes Airbyte messages to stdout through a byte buffer instead of printing them one line at a time.
+
+    Messages are accumulated until the buffer holds at least `buffer_size` bytes, and written to the output in a single call.
+    Any message other than a record (e.g. a state message) flushes the buffer right away so that a checkpoint is never emitted
+    later than the records it covers, and so that the platform receives it as soon as possible.
+
+    Usage:
+        with AirbyteMessageWriter() as writer:
+            for message in messages:
+                writer.write(message)
+    """
+
+    def __init__(self, output: Optional[BinaryIO] = None, buffer_size: int = DEFAULT_BUFFER_SIZE):
+        """
+        :param output: Binary stream to write the messages to. Defaults to the binary buffer behind sys.stdout
+        :param buffer_size: Number of bytes accumulated before they are written to the output
+        """
+        self._output = output
+        self._buffer_size = buffer_size
+        self._buffer: List[bytes] = []
+        self._buffered_bytes = 0
+
+    def write(self, message: OutputMessage):
+        """
+        Serializes the message and adds it to the buffer, flushing the buffer if needed.
+
+        :param message: The message to write. Strings are assumed to be already serialized messages
+        """
+        line = serialize_message(message)
+        self._buffer.append(line)
+        self._buffer.append(b"\n")
+        self._buffered_bytes += len(line) + 1
+        is_record = not isinstance(message, str) and message.type == MessageType.RECORD
+        if not is_record or self._buffered_bytes >= self._buffer_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes all the buffered messages to the output.
+        """
+        if not self._buffer:
+            return
+        data = b"".join(self._buffer)
+        self._buffer = []
+        self._buffered_bytes = 0
+        if self._output is not None:
+            self._output.write(data)
+            self._output.flush()
+        else:
+            self._write_to_stdout(data)
+
+    @staticmethod
+    def _write_to_stdout(data: bytes):
+        # sys.stdout is resolved on every flush because it can be swapped at runtime (e.g. when output is captured).
+        # The text layer is flushed first so that the messages written through it (e.g. logs) keep their order relative to ours
+        stdout = sys.stdout
+        stdout.flush()
+        binary_stdout = getattr(stdout, "buffer", None)
+        if binary_stdout is None:
+            stdout.write(data.decode("utf-8"))
+            stdout.flush()
+        else:
+            binary_stdout.write(data)
+            binary_stdout.flush()
+
+    def __enter__(self) -> "AirbyteMessageWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.flush()
@@ -185,7 +185,9 @@ class TestRun:
         # verify output was correct
         assert _wrapped(expected_check_result) == returned_check_result
 
-    def test_run_write(self, mocker, destination: Destination, tmp_path, monkeypatch):
+    @pytest.mark.parametrize("fast_input_parsing", [False, True])
+    def test_run_write(self, mocker, destination: Destination, tmp_path, monkeypatch, fast_input_parsing):
+        destination.fast_input_parsing = fast_input_parsing
         config_path, dummy_config = tmp_path / "config.json", {"user": "sherif"}
         write_file(config_path, dummy_config)
 
@@ -23,3 +23,22 @@ kwargs = {"c": "airbyte"}
 def test_interpolated_string(test_name, input_string, expected_value):
     s = InterpolatedString.create(input_string, options=options)
     assert s.eval(config, **{"kwargs": kwargs}) == expected_value
+
+
+@pytest.mark.parametrize(
+    "test_name, input_string, default, expected_value",
+    [
+        ("test_static_string", "HELLO WORLD", None, "HELLO WORLD"),
+        ("test_static_number", "10", None, 10),
+        ("test_static_empty_string_with_default", "", "default", "default"),
+    ],
+)
+def test_static_string_is_not_rendered_on_eval(mocker, test_name, input_string, default, expected_value):
+    s = InterpolatedString(input_string, default=default, options=options)
+    mocker.patch.object(s._interpolation, "eval", side_effect=AssertionError("static strings should not be interpolated"))
+    assert s.eval(config) == expected_value
+
+
+def test_templated_default_is_interpolated():
+    s = InterpolatedString("", default="{{ config['field'] }}", options=options)
+    assert s.eval(config) == "value"
@@ -5,6 +5,7 @@
 import datetime
 
 import pytest
+from airbyte_cdk.sources.declarative.interpolation import jinja
 from airbyte_cdk.sources.declarative.interpolation.jinja import JinjaInterpolation
 
 interpolation = JinjaInterpolation()
@@ -78,3 +79,29 @@ def test_macros(test_name, s, expected_value):
     config = {}
     val = interpolation.eval(s, config)
     assert val == expected_value
+
+
+@pytest.mark.parametrize(
+    "test_name, s, expected_is_templated",
+    [
+        ("test_plain_string", "hello world", False),
+        ("test_plain_number", "10", False),
+        ("test_single_brace", "{not_a_template}", False),
+        ("test_expression", "{{ config['field'] }}", True),
+        ("test_statement", "{% if true %}a{% endif %}", True),
+        ("test_comment", "a{# comment #}", True),
+    ],
+)
+def test_is_templated(test_name, s, expected_is_templated):
+    assert JinjaInterpolation.is_templated(s) == expected_is_templated
+
+
+def test_compiled_templates_are_shared_across_instances():
+    s = "{{ config['cache_test'] }}"
+    first_interpolation = JinjaInterpolation()
+    second_interpolation = JinjaInterpolation()
+    assert first_interpolation.eval(s, {"cache_test": "first"}) == "first"
+
+    hits_before = jinja._compile.cache_info().hits
+    assert second_interpolation.eval(s, {"cache_test": "second"}) == "second"
+    assert jinja._compile.cache_info().hits == hits_before + 1
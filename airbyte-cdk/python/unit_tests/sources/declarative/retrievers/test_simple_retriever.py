@@ -27,6 +27,12 @@ request_response_logs = [
 config = {}
 
 
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep the requests-cache files created by cached streams out of the working directory"""
+    monkeypatch.chdir(tmp_path)
+
+
 @patch.object(HttpStream, "_read_pages", return_value=[])
 def test_simple_retriever_full(mock_http_stream):
     requester = MagicMock()
@@ -433,3 +439,25 @@ def test_path(test_name, requester_path, paginator_path, expected_path):
 
     actual_path = retriever.path(stream_state=None, stream_slice=None, next_page_token=None)
     assert expected_path == actual_path
+
+
+def test_copy_for_concurrent_read():
+    stream_slicer = MagicMock(concurrency=4)
+    retriever = SimpleRetriever(
+        name="stream_name",
+        primary_key=primary_key,
+        requester=MagicMock(use_cache=False),
+        record_selector=MagicMock(),
+        paginator=MagicMock(),
+        stream_slicer=stream_slicer,
+        options={},
+        config={},
+    )
+
+    copy = retriever.copy_for_concurrent_read()
+
+    assert retriever.slice_concurrency == 4
+    assert copy.paginator is not retriever.paginator
+    assert copy.stream_slicer is retriever.stream_slicer
+    copy.state = {"date": "2021-01-01"}
+    stream_slicer.update_cursor.assert_called_once_with({"date": "2021-01-01"}, last_record=None)
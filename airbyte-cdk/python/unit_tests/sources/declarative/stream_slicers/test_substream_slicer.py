@@ -2,11 +2,20 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
+import time
 from typing import Any, Iterable, List, Mapping, Optional, Union
 
 import pytest as pytest
 from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
+from airbyte_cdk.sources.declarative.extractors.dpath_extractor import DpathExtractor
+from airbyte_cdk.sources.declarative.extractors.record_selector import RecordSelector
+from airbyte_cdk.sources.declarative.requesters.http_requester import HttpRequester
+from airbyte_cdk.sources.declarative.requesters.paginators.default_paginator import DefaultPaginator
+from airbyte_cdk.sources.declarative.requesters.paginators.strategies.page_increment import PageIncrement
 from airbyte_cdk.sources.declarative.requesters.request_option import RequestOption, RequestOptionType
+from airbyte_cdk.sources.declarative.retrievers.simple_retriever import SimpleRetriever
+from airbyte_cdk.sources.declarative.stream_slicers.list_stream_slicer import ListStreamSlicer
 from airbyte_cdk.sources.declarative.stream_slicers.substream_slicer import ParentStreamConfig, SubstreamSlicer
 from airbyte_cdk.sources.streams.core import Stream
 
@@ -262,3 +271,134 @@ def test_request_option(
     assert expected_headers == slicer.get_request_headers(stream_slice=stream_slice)
     assert expected_body_json == slicer.get_request_body_json(stream_slice=stream_slice)
     assert expected_body_data == slicer.get_request_body_data(stream_slice=stream_slice)
+
+
+@pytest.mark.parametrize(
+    "test_name, ordered",
+    [
+        ("test_ordered", True),
+        ("test_unordered", False),
+    ],
+)
+def test_concurrent_parent_slices(test_name, ordered):
+    slices = [{"slice": f"slice_{i}"} for i in range(6)]
+    records = [{"id": f"{i}-{j}", "slice": f"slice_{i}"} for i in range(6) for j in range(3)]
+    parent_stream_config = ParentStreamConfig(
+        stream=MockStream(slices, records, "first_stream"), parent_key="id", stream_slice_field="first_stream_id", options={}
+    )
+    sequential_slices = list(
+        SubstreamSlicer(parent_stream_configs=[parent_stream_config], options={}).stream_slices(SyncMode.incremental, stream_state=None)
+    )
+
+    slicer = SubstreamSlicer(parent_stream_configs=[parent_stream_config], options={}, concurrency=3, ordered=ordered)
+    concurrent_slices = list(slicer.stream_slices(SyncMode.incremental, stream_state=None))
+
+    if ordered:
+        assert concurrent_slices == sequential_slices
+    else:
+        assert sorted(concurrent_slices, key=lambda s: s["first_stream_id"]) == sequential_slices
+        for parent_slice in slices:
+            # Slices of a given parent slice keep their order
+            assert [s for s in concurrent_slices if s["parent_slice"] == parent_slice] == [
+                s for s in sequential_slices if s["parent_slice"] == parent_slice
+            ]
+
+
+def test_parent_keys_are_batched():
+    slicer = SubstreamSlicer(
+        parent_stream_configs=[
+            ParentStreamConfig(
+                stream=MockStream(parent_slices, all_parent_data + [{"id": 3, "slice": "first"}], "first_stream"),
+                parent_key="id",
+                stream_slice_field="first_stream_ids",
+                options={},
+                batch_size=2,
+                request_option=RequestOption(inject_into=RequestOptionType.request_parameter, options={}, field_name="first_stream_ids"),
+            )
+        ],
+        options={},
+    )
+
+    slices = list(slicer.stream_slices(SyncMode.incremental, stream_state=None))
+
+    # Batches don't span parent slices, and parent slices without records don't produce a slice
+    assert slices == [
+        {"first_stream_ids": "0,1", "parent_slice": {"slice": "first"}},
+        {"first_stream_ids": "3", "parent_slice": {"slice": "first"}},
+        {"first_stream_ids": "2", "parent_slice": {"slice": "second"}},
+    ]
+    assert slicer.get_request_params(stream_slice=slices[0]) == {"first_stream_ids": "0,1"}
+
+
+@pytest.mark.parametrize(
+    "test_name, slicer_kwargs, parent_config_kwargs",
+    [
+        ("test_concurrency_below_one", {"concurrency": 0}, {}),
+        ("test_batch_size_below_one", {}, {"batch_size": 0}),
+    ],
+)
+def test_invalid_concurrency_settings(test_name, slicer_kwargs, parent_config_kwargs):
+    parent_stream_config = ParentStreamConfig(
+        stream=MockStream([{}], parent_records, "first_stream"),
+        parent_key="id",
+        stream_slice_field="first_stream_id",
+        options={},
+        **parent_config_kwargs,
+    )
+    with pytest.raises(ValueError):
+        SubstreamSlicer(parent_stream_configs=[parent_stream_config], options={}, **slicer_kwargs)
+
+
+def paginated_declarative_stream(url_base: str) -> DeclarativeStream:
+    config = {}
+    retriever = SimpleRetriever(
+        name="parent",
+        primary_key="id",
+        requester=HttpRequester(name="parent", url_base=url_base, path="parent", config=config, options={}),
+        record_selector=RecordSelector(extractor=DpathExtractor(field_pointer=["data"], config=config, options={}), options={}),
+        paginator=DefaultPaginator(
+            pagination_strategy=PageIncrement(page_size=2, options={}),
+            page_token_option=RequestOption(inject_into=RequestOptionType.request_parameter, field_name="page", options={}),
+            url_base=url_base,
+            config=config,
+            options={},
+        ),
+        stream_slicer=ListStreamSlicer(
+            slice_values=["a", "b", "c"],
+            cursor_field="slice",
+            config=config,
+            request_option=RequestOption(inject_into=RequestOptionType.request_parameter, field_name="slice", options={}),
+            options={},
+        ),
+        config=config,
+        options={},
+    )
+    return DeclarativeStream(name="parent", primary_key="id", retriever=retriever, config=config, options={})
+
+
+def test_concurrent_reads_of_paginated_declarative_parent(requests_mock):
+    url_base = "https://api.test.com/"
+
+    def parent_page(request, context):
+        # Slow responses so that the pages of the parent slices are read at the same time
+        time.sleep(0.05)
+        parent_slice, page = request.qs["slice"][0], int(request.qs.get("page", ["0"])[0])
+        ids = [f"{parent_slice}{i}" for i in range(page * 2, min(page * 2 + 2, 3))]
+        return {"data": [{"id": record_id} for record_id in ids]}
+
+    requests_mock.get(f"{url_base}parent", json=parent_page)
+    parent_stream_config = ParentStreamConfig(
+        stream=paginated_declarative_stream(url_base), parent_key="id", stream_slice_field="parent_id", options={}
+    )
+    sequential_slices = list(
+        SubstreamSlicer(parent_stream_configs=[parent_stream_config], options={}).stream_slices(SyncMode.full_refresh, {})
+    )
+    requests_mock.reset_mock()
+
+    slicer = SubstreamSlicer(parent_stream_configs=[parent_stream_config], options={}, concurrency=3)
+    concurrent_slices = list(slicer.stream_slices(SyncMode.full_refresh, {}))
+
+    assert [s["parent_id"] for s in sequential_slices] == ["a0", "a1", "a2", "b0", "b1", "b2", "c0", "c1", "c2"]
+    assert concurrent_slices == sequential_slices
+    requested_pages = sorted((request.qs["slice"][0], request.qs.get("page", ["0"])[0]) for request in requests_mock.request_history)
+    assert requested_pages == [("a", "0"), ("a", "1"), ("b", "0"), ("b", "1"), ("c", "0"), ("c", "1")]
@@ -37,6 +37,7 @@ def test_declarative_stream():
     retriever.state = state
     retriever.read_records.return_value = records
     retriever.stream_slices.return_value = stream_slices
+    retriever.slice_concurrency = 1
 
     no_op_transform = mock.create_autospec(spec=RecordTransformation)
     no_op_transform.transform = MagicMock(side_effect=lambda record, config, stream_slice, stream_state: record)
@@ -71,3 +72,18 @@ def test_declarative_stream():
             call(record, config=config, stream_slice=input_slice, stream_state=state) for record in records if isinstance(record, dict)
         ]
         transformation.transform.assert_has_calls(expected_calls, any_order=False)
+
+
+def test_concurrent_slices_are_read_with_retriever_copies():
+    records = [{"pk": 1234, "field": "value"}]
+    retriever = MagicMock()
+    retriever.slice_concurrency = 4
+    retriever.copy_for_concurrent_read.return_value.read_records.return_value = records
+
+    stream = DeclarativeStream(
+        name="stream", primary_key="pk", schema_loader=MagicMock(), retriever=retriever, config={}, transformations=[], options={}
+    )
+
+    assert stream.slice_concurrency == 4
+    assert list(stream.read_records(SyncMode.full_refresh, None, {"date": "2021-01-01"}, None)) == records
+    retriever.read_records.assert_not_called()
@@ -0,0 +1,115 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import asyncio
+import threading
+from typing import Any, Iterable, Mapping, Optional
+
+import pytest
+import requests
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.http import AsyncHttpStream
+
+
+class StubAsyncHttpStream(AsyncHttpStream):
+    url_base = "https://test_base_url.com/"
+    primary_key = ""
+    max_concurrent_requests = 3
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        next_page = response.json().get("next_page")
+        return {"page": next_page} if next_page else None
+
+    def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
+        return stream_slice["path"] if stream_slice else ""
+
+    def request_params(self, next_page_token: Mapping[str, Any] = None, **kwargs) -> Mapping[str, Any]:
+        return next_page_token or {}
+
+    def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
+        yield from response.json()["records"]
+
+
+def _collect(async_iterator):
+    async def collect():
+        return [item async for item in async_iterator]
+
+    return asyncio.run(collect())
+
+
+def _register_pages(requests_mock, path, pages):
+    for page_number, records in enumerate(pages):
+        next_page = page_number + 1 if page_number + 1 < len(pages) else None
+        query = f"?page={page_number}" if page_number else ""
+        requests_mock.register_uri(
+            "GET", f"https://test_base_url.com/{path}{query}", json={"records": records, "next_page": next_page}, complete_qs=True
+        )
+
+
+def test_read_records_async_reads_all_pages(requests_mock):
+    _register_pages(requests_mock, "items", [[{"id": 1}, {"id": 2}], [{"id": 3}]])
+    stream = StubAsyncHttpStream()
+
+    records = _collect(stream.read_records_async(SyncMode.full_refresh, stream_slice={"path": "items"}))
+
+    assert records == [{"id": 1}, {"id": 2}, {"id": 3}]
+    # The synchronous read path is unchanged
+    assert list(stream.read_records(SyncMode.full_refresh, stream_slice={"path": "items"})) == records
+
+
+def test_read_slices_async_keeps_the_order_of_each_slice(requests_mock):
+    slices = [{"path": f"items_{i}"} for i in range(5)]
+    for i in range(5):
+        _register_pages(requests_mock, f"items_{i}", [[{"id": f"{i}-0"}], [{"id": f"{i}-1"}], [{"id": f"{i}-2"}]])
+    stream = StubAsyncHttpStream()
+
+    results = _collect(stream.read_slices_async(SyncMode.full_refresh, slices))
+
+    assert len(results) == 15
+    for i, stream_slice in enumerate(slices):
+        assert [record for _slice, record in results if _slice == stream_slice] == [{"id": f"{i}-{page}"} for page in range(3)]
+
+
+def test_read_slices_async_sends_requests_concurrently(mocker):
+    stream = StubAsyncHttpStream()
+    barrier = threading.Barrier(stream.max_concurrent_requests, timeout=5)
+
+    def send_request(request, request_kwargs):
+        # Only passes if max_concurrent_requests requests are in flight at the same time
+        barrier.wait()
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"records": [{"id": 1}]}'
+        return response
+
+    mocker.patch.object(stream, "_send_request", side_effect=send_request)
+    slices = [{"path": f"items_{i}"} for i in range(stream.max_concurrent_requests)]
+
+    results = _collect(stream.read_slices_async(SyncMode.full_refresh, slices))
+
+    assert [stream_slice for stream_slice, _ in sorted(results, key=lambda result: result[0]["path"])] == slices
+
+
+def test_read_slices_async_accepts_async_slices(requests_mock):
+    _register_pages(requests_mock, "parent", [[{"id": 1}, {"id": 2}]])
+    _register_pages(requests_mock, "child_1", [[{"child": 1}]])
+    _register_pages(requests_mock, "child_2", [[{"child": 2}]])
+    parent = StubAsyncHttpStream()
+    child = StubAsyncHttpStream()
+
+    async def read_child():
+        parent_records = parent.read_slices_async(SyncMode.full_refresh, [{"path": "parent"}])
+        child_slices = ({"path": f"child_{record['id']}"} async for _, record in parent_records)
+        return [record async for _, record in child.read_slices_async(SyncMode.full_refresh, child_slices)]
+
+    assert sorted(asyncio.run(read_child()), key=lambda record: record["child"]) == [{"child": 1}, {"child": 2}]
+
+
+def test_read_slices_async_raises_slice_errors(requests_mock):
+    _register_pages(requests_mock, "items_0", [[{"id": 1}]])
+    requests_mock.register_uri("GET", "https://test_base_url.com/items_1", status_code=404)
+    stream = StubAsyncHttpStream()
+
+    with pytest.raises(requests.HTTPError):
+        _collect(stream.read_slices_async(SyncMode.full_refresh, [{"path": "items_0"}, {"path": "items_1"}]))
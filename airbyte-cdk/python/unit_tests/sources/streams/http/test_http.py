@@ -4,18 +4,28 @@
 
 
 import json
+import socket
+import threading
+import time
 from http import HTTPStatus
 from typing import Any, Iterable, Mapping, Optional
 from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 import requests
-from airbyte_cdk.models import SyncMode
+from airbyte_cdk.models import AirbyteMessage, SyncMode, Type
 from airbyte_cdk.sources.streams.http import HttpStream, HttpSubStream
 from airbyte_cdk.sources.streams.http.auth import NoAuth
 from airbyte_cdk.sources.streams.http.auth import TokenAuthenticator as HttpTokenAuthenticator
 from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
 from airbyte_cdk.sources.streams.http.requests_native_auth import TokenAuthenticator
+from airbyte_cdk.sources.utils.schema_helpers import LIMIT_REACHED_LOG_PREFIX
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep the requests-cache files created by cached streams out of the working directory"""
+    monkeypatch.chdir(tmp_path)
 
 
 class StubBasicReadHttpStream(HttpStream):
@@ -122,6 +132,81 @@ def test_next_page_token_is_input_to_other_methods(mocker):
     assert expected == records
 
 
+class StubPrefetchingHttpStream(StubNextPageTokenHttpStream):
+    page_prefetch_depth = 2
+
+
+def test_prefetched_pages_are_read_in_order(mocker):
+    stream = StubPrefetchingHttpStream(pages=5)
+    mocker.patch.object(StubPrefetchingHttpStream, "_send_request", return_value={})
+    mocker.patch.object(stream, "request_params", wraps=stream.request_params)
+
+    records = list(stream.read_records(SyncMode.full_refresh))
+
+    assert records == [{"data": i} for i in range(1, 7)]
+    assert [call.kwargs["next_page_token"] for call in stream.request_params.call_args_list] == [None] + [{"page": i} for i in range(5)]
+
+
+def test_pages_are_fetched_ahead_up_to_prefetch_depth(mocker):
+    stream = StubPrefetchingHttpStream(pages=10)
+    fetched = threading.Semaphore(0)
+
+    def send_request(request, request_kwargs):
+        fetched.release()
+        return {}
+
+    mocker.patch.object(StubPrefetchingHttpStream, "_send_request", side_effect=send_request)
+    records = stream.read_records(SyncMode.full_refresh)
+    assert next(records) == {"data": 1}
+
+    # The page being parsed, the pages waiting to be parsed and the page the background thread holds until one of them is consumed
+    for _ in range(1 + stream.page_prefetch_depth + 1):
+        assert fetched.acquire(timeout=5)
+    time.sleep(0.1)
+    assert not fetched.acquire(blocking=False)
+    assert list(records) == [{"data": i} for i in range(2, 12)]
+
+
+def test_prefetch_errors_are_raised(mocker):
+    stream = StubPrefetchingHttpStream(pages=5)
+    mocker.patch.object(StubPrefetchingHttpStream, "_send_request", side_effect=[{}, {}, requests.HTTPError("page 3 failed")])
+
+    records = stream.read_records(SyncMode.full_refresh)
+
+    assert next(records) == {"data": 1}
+    assert next(records) == {"data": 2}
+    with pytest.raises(requests.HTTPError, match="page 3 failed"):
+        next(records)
+
+
+@pytest.mark.parametrize("stream_class", [StubNextPageTokenHttpStream, StubPrefetchingHttpStream])
+@pytest.mark.parametrize(
+    "page_limit, expected_records, expect_limit_message",
+    [
+        (2, [{"data": 1}, {"data": 2}], True),
+        # The last page has no next page token so no page is left unread
+        (6, [{"data": i} for i in range(1, 7)], False),
+    ],
+)
+def test_page_limit(mocker, stream_class, page_limit, expected_records, expect_limit_message):
+    stream = stream_class(pages=5)
+    stream.page_limit = page_limit
+    send_request = mocker.patch.object(stream_class, "_send_request", return_value={})
+
+    output = list(stream.read_records(SyncMode.full_refresh))
+
+    records = [record for record in output if isinstance(record, Mapping)]
+    messages = [message for message in output if isinstance(message, AirbyteMessage)]
+    assert records == expected_records
+    assert send_request.call_count == len(expected_records)
+    if expect_limit_message:
+        assert len(messages) == 1
+        assert messages[0].type == Type.LOG
+        assert messages[0].log.message.startswith(LIMIT_REACHED_LOG_PREFIX)
+    else:
+        assert messages == []
+
+
 class StubBadUrlHttpStream(StubBasicReadHttpStream):
     url_base = "bad_url"
 
@@ -509,3 +594,65 @@ def test_default_get_error_display_message_handles_http_error(mocker):
 
     http_err_msg = stream.get_error_display_message(requests.HTTPError())
     assert http_err_msg == "my custom message"
+
+
+def test_streams_reaching_the_same_host_share_connections(requests_mock):
+    requests_mock.register_uri("GET", StubBasicReadHttpStream.url_base)
+    first_stream = StubBasicReadHttpStream()
+    second_stream = StubBasicReadHttpStream(authenticator=TokenAuthenticator("test-token"))
+
+    list(first_stream.read_records(SyncMode.full_refresh))
+    list(second_stream.read_records(SyncMode.full_refresh))
+
+    first_adapter = first_stream._session.adapters["https://test_base_url.com/"]
+    assert first_adapter is second_stream._session.adapters["https://test_base_url.com/"]
+    assert first_adapter._pool_maxsize == first_stream.pool_size
+    # Sessions are not shared so each stream keeps its own authentication
+    assert first_stream._session.auth is None
+    assert isinstance(second_stream._session.auth, TokenAuthenticator)
+
+
+def test_connection_pool_settings_are_not_shared(requests_mock):
+    class KeepAliveHttpStream(StubBasicReadHttpStream):
+        pool_size = 32
+        tcp_keepalive = True
+
+    requests_mock.register_uri("GET", StubBasicReadHttpStream.url_base)
+    stream = StubBasicReadHttpStream()
+    keep_alive_stream = KeepAliveHttpStream()
+
+    list(stream.read_records(SyncMode.full_refresh))
+    list(keep_alive_stream.read_records(SyncMode.full_refresh))
+
+    adapter = keep_alive_stream._session.adapters["https://test_base_url.com/"]
+    assert adapter is not stream._session.adapters["https://test_base_url.com/"]
+    assert adapter._pool_maxsize == 32
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in adapter.poolmanager.connection_pool_kw["socket_options"]
+
+
+def test_connector_mounted_adapter_is_not_replaced():
+    class RetryingAdapter(requests.adapters.HTTPAdapter):
+        def __init__(self):
+            super().__init__(max_retries=3)
+            self.sent = []
+
+        def send(self, request, **kwargs):
+            self.sent.append(request.url)
+            response = requests.Response()
+            response.status_code = 200
+            response.request = request
+            response._content = b"{}"
+            return response
+
+    class RetryingHttpStream(StubBasicReadHttpStream):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.adapter = RetryingAdapter()
+            self._session.mount("https://", self.adapter)
+
+    stream = RetryingHttpStream()
+    records = list(stream.read_records(SyncMode.full_refresh))
+
+    assert records == [{"data": 1}]
+    assert stream.adapter.sent == ["https://test_base_url.com/"]
+    assert "https://test_base_url.com/" not in stream._session.adapters
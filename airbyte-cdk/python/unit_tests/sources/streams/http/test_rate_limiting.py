@@ -0,0 +1,125 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+
+import pytest
+import requests
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.http import TokenBucketRateLimiter
+
+from .test_http import StubBasicReadHttpStream
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _response(headers):
+    response = requests.Response()
+    response.status_code = 200
+    response.headers.update(headers)
+    return response
+
+
+def test_requests_are_paced_once_the_burst_is_used():
+    clock = FakeClock()
+    limiter = TokenBucketRateLimiter(rate=2, capacity=2, clock=clock, sleep=clock.sleep)
+
+    for _ in range(4):
+        limiter.acquire()
+
+    assert clock.sleeps == [0.5, 0.5]
+
+
+def test_tokens_are_refilled_over_time():
+    clock = FakeClock()
+    limiter = TokenBucketRateLimiter(rate=2, capacity=2, clock=clock, sleep=clock.sleep)
+    limiter.acquire()
+    limiter.acquire()
+
+    clock.now += 10
+    for _ in range(2):
+        limiter.acquire()
+
+    # The bucket never holds more than its capacity
+    assert clock.sleeps == []
+    limiter.acquire()
+    assert clock.sleeps == [0.5]
+
+
+def test_remaining_header_caps_the_bucket():
+    clock = FakeClock()
+    limiter = TokenBucketRateLimiter(rate=1, capacity=10, remaining_header="X-RateLimit-Remaining", clock=clock, sleep=clock.sleep)
+
+    limiter.update_from_response(_response({"X-RateLimit-Remaining": "1"}))
+    limiter.acquire()
+    limiter.acquire()
+
+    assert clock.sleeps == [1.0]
+
+
+def test_requests_wait_for_the_quota_to_reset():
+    clock = FakeClock()
+    limiter = TokenBucketRateLimiter(
+        rate=100, remaining_header="X-RateLimit-Remaining", reset_header="X-RateLimit-Reset", clock=clock, sleep=clock.sleep
+    )
+
+    limiter.update_from_response(_response({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "30"}))
+    limiter.acquire()
+
+    assert clock.sleeps == [30]
+
+
+def test_invalid_headers_are_ignored():
+    clock = FakeClock()
+    limiter = TokenBucketRateLimiter(rate=1, remaining_header="X-RateLimit-Remaining", clock=clock, sleep=clock.sleep)
+
+    limiter.update_from_response(_response({"X-RateLimit-Remaining": "unknown"}))
+    limiter.acquire()
+
+    assert clock.sleeps == []
+
+
+def test_rate_must_be_positive():
+    with pytest.raises(ValueError):
+        TokenBucketRateLimiter(rate=0)
+
+
+def test_concurrent_callers_wait_in_turn():
+    clock = FakeClock()
+    limiter = TokenBucketRateLimiter(rate=1, capacity=1, clock=clock, sleep=lambda seconds: clock.sleeps.append(seconds))
+
+    threads = [threading.Thread(target=limiter.acquire) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Without time passing, each caller waits one more second than the previous one
+    assert sorted(clock.sleeps) == [1.0, 2.0, 3.0]
+
+
+def test_rate_limiter_is_shared_by_streams(mocker, requests_mock):
+    limiter = mocker.MagicMock()
+
+    class RateLimitedHttpStream(StubBasicReadHttpStream):
+        rate_limiter = limiter
+
+    requests_mock.register_uri("GET", StubBasicReadHttpStream.url_base, headers={"X-RateLimit-Remaining": "5"})
+
+    for stream in [RateLimitedHttpStream(), RateLimitedHttpStream()]:
+        list(stream.read_records(SyncMode.full_refresh))
+
+    assert limiter.acquire.call_count == 2
+    assert [call.args[0].headers["X-RateLimit-Remaining"] for call in limiter.update_from_response.call_args_list] == ["5", "5"]
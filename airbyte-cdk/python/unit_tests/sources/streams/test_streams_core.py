@@ -9,6 +9,7 @@ from unittest import mock
 import pytest
 from airbyte_cdk.models import AirbyteStream, SyncMode
 from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.utils.schema_helpers import schema_loads
 
 
 class StreamStubFullRefresh(Stream):
@@ -182,3 +183,18 @@ def test_get_json_schema_is_cached(mocked_method):
     for i in range(5):
         stream.get_json_schema()
     assert mocked_method.call_count == 1
+
+
+def test_cached_json_schema_is_computed_once_until_invalidated(mocker):
+    stream = StreamStubFullRefresh()
+    get_json_schema = mocker.patch.object(StreamStubFullRefresh, "get_json_schema", side_effect=[{"v": 1}, {"v": 2}])
+    loads = schema_loads[stream.name]
+
+    assert [stream.get_cached_json_schema() for _ in range(5)] == [{"v": 1}] * 5
+    assert get_json_schema.call_count == 1
+
+    stream.invalidate_json_schema()
+
+    assert stream.get_cached_json_schema() == {"v": 2}
+    assert get_json_schema.call_count == 2
+    assert schema_loads[stream.name] == loads + 2
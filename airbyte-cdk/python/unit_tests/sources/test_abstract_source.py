@@ -4,6 +4,8 @@
 
 import copy
 import logging
+import threading
+import time
 from collections import defaultdict
 from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 from unittest.mock import call
@@ -481,6 +483,41 @@ class TestIncrementalRead:
 
         assert expected == messages
 
+    def test_with_checkpoint_interval_seconds(self, mocker):
+        """Tests that an incremental read with a time based checkpoint interval outputs a STATE message once the interval has elapsed"""
+        stream_output = [{"k1": "v1"}, {"k2": "v2"}, {"k3": "v3"}]
+        stream_1 = MockStream(
+            [({"sync_mode": SyncMode.incremental, "stream_state": {}}, stream_output)],
+            name="s1",
+        )
+        state = {"cursor": "value"}
+        now = [0]
+
+        def get_updated_state(current_stream_state, latest_record):
+            # Reading a record takes 40 seconds
+            now[0] += 40
+            return state
+
+        mocker.patch("airbyte_cdk.sources.abstract_source.time.monotonic", side_effect=lambda: now[0])
+        mocker.patch.object(MockStream, "get_updated_state", side_effect=get_updated_state)
+        mocker.patch.object(MockStream, "supports_incremental", return_value=True)
+        mocker.patch.object(MockStream, "get_json_schema", return_value={})
+        mocker.patch.object(MockStream, "state_checkpoint_interval_seconds", new_callable=mocker.PropertyMock, return_value=60)
+
+        src = MockSource(streams=[stream_1])
+        catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream_1, SyncMode.incremental)])
+
+        expected = [
+            _as_record("s1", stream_output[0]),
+            _as_record("s1", stream_output[1]),
+            _as_state({"s1": state}, "s1", state),
+            _as_record("s1", stream_output[2]),
+            _as_state({"s1": state}, "s1", state),
+        ]
+        messages = _fix_emitted_at(list(src.read(logger, {}, catalog, state=[])))
+
+        assert expected == messages
+
     @pytest.mark.parametrize(
         "use_legacy",
         [
@@ -938,3 +975,138 @@ def test_checkpoint_state_from_stream_instance():
     assert actual_message == _as_state(
         {"teams": {"updated_at": "2022-09-11"}, "managers": {"updated": "expected_here"}}, "managers", {"updated": "expected_here"}
     )
+
+
+class MockConcurrentStream(MockStream):
+    def __init__(self, slices: List[Mapping[str, Any]], name: str, concurrency: int):
+        super().__init__(name=name)
+        self._slices = slices
+        self._concurrency = concurrency
+        self._state = {}
+        self._lock = threading.Lock()
+
+    cursor_field = "cursor"
+
+    @property
+    def slice_concurrency(self) -> int:
+        return self._concurrency
+
+    @property
+    def state(self) -> MutableMapping[str, Any]:
+        return dict(self._state)
+
+    @state.setter
+    def state(self, value: MutableMapping[str, Any]):
+        self._state = value
+
+    def stream_slices(self, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
+        return self._slices
+
+    def read_records(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
+        # The first slices take longer to be read so that they complete after the following ones
+        time.sleep(0.01 * (len(self._slices) - stream_slice["cursor"]))
+        yield from [{"cursor": stream_slice["cursor"], "index": 0}, {"cursor": stream_slice["cursor"], "index": 1}]
+        with self._lock:
+            self._state = {"cursor": max(self._state.get("cursor", 0), stream_slice["cursor"])}
+
+    def get_json_schema(self) -> Mapping[str, Any]:
+        return {}
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+def test_concurrent_full_refresh_read_with_slices(concurrency):
+    slices = [{"cursor": i} for i in range(5)]
+    stream = MockConcurrentStream(slices, name="s1", concurrency=concurrency)
+    src = MockSource(streams=[stream])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.full_refresh)])
+
+    messages = _fix_emitted_at(list(src.read(logger, {}, catalog)))
+
+    assert messages == _as_records("s1", [{"cursor": i, "index": j} for i in range(5) for j in range(2)])
+
+
+@pytest.mark.parametrize(
+    "concurrency, expected_checkpoints",
+    [
+        pytest.param(1, [0, 1, 2, 3, 4], id="test_sequential_checkpoints_every_slice"),
+        pytest.param(2, [1, 3, 4], id="test_concurrent_checkpoints_every_batch"),
+    ],
+)
+def test_concurrent_incremental_read_only_checkpoints_completed_slices(concurrency, expected_checkpoints):
+    slices = [{"cursor": i} for i in range(5)]
+    stream = MockConcurrentStream(slices, name="s1", concurrency=concurrency)
+    src = MockSource(streams=[stream])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.incremental)])
+
+    messages = _fix_emitted_at(list(src.read(logger, {}, catalog)))
+
+    records = [message.record.data for message in messages if message.type == Type.RECORD]
+    assert records == [{"cursor": i, "index": j} for i in range(5) for j in range(2)]
+    checkpoints = [message.state.stream.stream_state.dict()["cursor"] for message in messages if message.type == Type.STATE]
+    assert checkpoints == expected_checkpoints
+    # Every checkpoint comes after all the records it covers
+    for index, message in enumerate(messages):
+        if message.type == Type.STATE:
+            cursor = message.state.stream.stream_state.dict()["cursor"]
+            assert all(m.record.data["cursor"] > cursor for m in messages[index:] if m.type == Type.RECORD)
+
+
+def test_concurrent_incremental_read_limit_does_not_checkpoint_unemitted_slices():
+    slices = [{"cursor": i} for i in range(5)]
+    stream = MockConcurrentStream(slices, name="s1", concurrency=2)
+    stream.state = {"cursor": -1}
+    src = MockSource(streams=[stream])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.incremental)])
+
+    messages = _fix_emitted_at(list(src.read(logger, {"_limit": 3}, catalog)))
+
+    records = [message.record.data for message in messages if message.type == Type.RECORD]
+    assert records == [{"cursor": 0, "index": 0}, {"cursor": 0, "index": 1}, {"cursor": 1, "index": 0}]
+    # The second slice was fully read by a worker thread but only partially emitted, so the state from before the batch is checkpointed
+    checkpoints = [message.state.stream.stream_state.dict() for message in messages if message.type == Type.STATE]
+    assert checkpoints == [{"cursor": -1}]
+    assert stream.state == {"cursor": -1}
+
+
+class MockConcurrentSource(MockSource):
+    @property
+    def stream_concurrency(self) -> int:
+        return 3
+
+
+def test_concurrent_streams_read_keeps_the_order_of_each_stream():
+    slices = [{"cursor": i} for i in range(3)]
+    streams = [MockConcurrentStream(slices, name=f"s{i}", concurrency=1) for i in range(4)]
+    src = MockConcurrentSource(streams=streams)
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.incremental) for stream in streams])
+
+    messages = _fix_emitted_at(list(src.read(logger, {}, catalog)))
+
+    for stream in streams:
+        stream_messages = [
+            message
+            for message in messages
+            if (message.type == Type.RECORD and message.record.stream == stream.name)
+            or (message.type == Type.STATE and message.state.stream.stream_descriptor.name == stream.name)
+        ]
+        expected = []
+        for i in range(3):
+            expected += _as_records(stream.name, [{"cursor": i, "index": 0}, {"cursor": i, "index": 1}])
+            expected.append(Type.STATE)
+        assert [message if message.type == Type.RECORD else message.type for message in stream_messages] == expected
+        assert [m.state.stream.stream_state.dict() for m in stream_messages if m.type == Type.STATE] == [{"cursor": i} for i in range(3)]
+
+
+def test_concurrent_streams_read_raises_stream_error(mocker):
+    slices = [{"cursor": i} for i in range(3)]
+    failing_stream = MockStream(name="failing_stream")
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    mocker.patch.object(MockStream, "read_records", side_effect=RuntimeError("oh no!"))
+    mocker.patch.object(MockStream, "get_error_display_message", return_value="my message")
+    streams = [MockConcurrentStream(slices, name="s1", concurrency=1), failing_stream]
+    src = MockConcurrentSource(streams=streams)
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.full_refresh) for stream in streams])
+
+    with pytest.raises(AirbyteTracedException, match="oh no!") as exc:
+        list(src.read(logger, {}, catalog))
+    assert exc.value.message == "my message"
@@ -590,3 +590,19 @@ def test_do_not_set_stream_descriptor_namespace_when_none():
     actual_state_message = state_manager.create_state_message(stream_name="episodes", namespace=None, send_per_stream_state=True)
 
     assert actual_state_message.state.stream.stream_descriptor.dict(exclude_unset=True) == expected_stream_state_descriptor
+
+
+def test_state_messages_are_not_affected_by_later_updates():
+    state_manager = ConnectorStateManager({}, [])
+    stream_state = {"cursor": {"updated_at": 1}}
+
+    state_manager.update_state_for_stream("actors", None, stream_state)
+    first_message = state_manager.create_state_message("actors", None, send_per_stream_state=True)
+    stream_state["cursor"]["updated_at"] = 2
+    state_manager.update_state_for_stream("actors", None, stream_state)
+    second_message = state_manager.create_state_message("actors", None, send_per_stream_state=True)
+
+    assert first_message.state.stream.stream_state == AirbyteStateBlob.parse_obj({"cursor": {"updated_at": 1}})
+    assert first_message.state.data == {"actors": {"cursor": {"updated_at": 1}}}
+    assert second_message.state.stream.stream_state == AirbyteStateBlob.parse_obj({"cursor": {"updated_at": 2}})
+    assert state_manager.get_stream_state("actors", None) == {"cursor": {"updated_at": 2}}
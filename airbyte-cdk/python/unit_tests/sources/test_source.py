@@ -25,6 +25,7 @@ from airbyte_cdk.models import (
 from airbyte_cdk.sources import AbstractSource, Source
 from airbyte_cdk.sources.streams.core import Stream
 from airbyte_cdk.sources.streams.http.http import HttpStream
+from airbyte_cdk.sources.utils.schema_helpers import LIMIT_REACHED_LOG_PREFIX
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 from pydantic import ValidationError
 
@@ -412,6 +413,51 @@ def test_internal_config_limit(abstract_source, catalog):
     assert read_log_record[0].startswith(f"Read {STREAM_LIMIT} ")
 
 
+@pytest.mark.parametrize("sync_mode", [SyncMode.full_refresh, SyncMode.incremental])
+def test_internal_config_slice_and_page_limits(abstract_source, catalog, sync_mode):
+    logger_mock = MagicMock()
+    logger_mock.level = logging.DEBUG
+    del catalog.streams[1]
+    catalog.streams[0].sync_mode = sync_mode
+    http_stream = abstract_source.streams(None)[0]
+    pulled_slices = []
+
+    def stream_slices(**kwargs):
+        for stream_slice in [{"slice": 1}, {"slice": 2}, {"slice": 3}]:
+            pulled_slices.append(stream_slice)
+            yield stream_slice
+
+    http_stream.stream_slices = MagicMock(side_effect=stream_slices)
+    http_stream.read_records.return_value = [{"value": 1}]
+    internal_config = {"some_config": 100, "_slice_limit": 2, "_page_limit": 3}
+
+    messages = list(abstract_source.read(logger=logger_mock, config=internal_config, catalog=catalog, state={}))
+
+    assert "_slice_limit" not in abstract_source.streams_config
+    assert "_page_limit" not in abstract_source.streams_config
+    assert http_stream.page_limit == 3
+    assert [call.kwargs["stream_slice"] for call in http_stream.read_records.call_args_list] == [{"slice": 1}, {"slice": 2}]
+    # the slice past the limit is never generated, as generating it could send requests
+    assert pulled_slices == [{"slice": 1}, {"slice": 2}]
+    assert len([message for message in messages if message.type == Type.RECORD]) == 2
+    limit_messages = [message for message in messages if message.type == Type.LOG]
+    assert len(limit_messages) == 1
+    assert limit_messages[0].log.message.startswith(LIMIT_REACHED_LOG_PREFIX)
+
+
+def test_internal_config_slice_limit_not_reached(abstract_source, catalog):
+    logger_mock = MagicMock()
+    logger_mock.level = logging.DEBUG
+    del catalog.streams[1]
+    http_stream = abstract_source.streams(None)[0]
+    http_stream.stream_slices = MagicMock(return_value=[None])
+    http_stream.read_records.return_value = [{"value": 1}]
+
+    messages = list(abstract_source.read(logger=logger_mock, config={"_slice_limit": 2}, catalog=catalog, state={}))
+
+    assert [message.type for message in messages] == [Type.RECORD]
+
+
 SCHEMA = {"type": "object", "properties": {"value": {"type": "string"}}}
 
 
@@ -425,8 +471,9 @@ def test_source_config_no_transform(abstract_source, catalog):
     records = [r for r in abstract_source.read(logger=logger_mock, config={}, catalog=catalog, state={})]
     assert len(records) == 2 * 5
     assert [r.record.data for r in records] == [{"value": 23}] * 2 * 5
-    assert http_stream.get_json_schema.call_count == 5
-    assert non_http_stream.get_json_schema.call_count == 5
+    # The schema is loaded once per stream, not for every record
+    assert http_stream.get_json_schema.call_count == 1
+    assert non_http_stream.get_json_schema.call_count == 1
 
 
 def test_source_config_transform(abstract_source, catalog):
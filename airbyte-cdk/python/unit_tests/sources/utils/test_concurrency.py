@@ -0,0 +1,136 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+import time
+
+import pytest
+from airbyte_cdk.sources.utils.concurrency import read_partitions_concurrently, read_partitions_interleaved
+
+
+def _read_with_delay(partition):
+    # Later partitions are faster, so results have to be reordered
+    time.sleep(0.01 * (5 - partition))
+    for i in range(3):
+        yield f"{partition}-{i}"
+
+
+def test_outputs_are_emitted_in_partition_order():
+    results = [(partition, list(outputs)) for partition, outputs in read_partitions_concurrently(range(5), _read_with_delay, max_workers=3)]
+
+    assert results == [(partition, [f"{partition}-{i}" for i in range(3)]) for partition in range(5)]
+
+
+def test_partitions_are_read_concurrently():
+    max_workers = 3
+    barrier = threading.Barrier(max_workers, timeout=5)
+
+    def read(partition):
+        # Only passes if max_workers partitions are being read at the same time
+        barrier.wait()
+        yield partition
+
+    outputs = [
+        output for _, outputs in read_partitions_concurrently(range(max_workers), read, max_workers=max_workers) for output in outputs
+    ]
+
+    assert outputs == list(range(max_workers))
+
+
+def test_no_more_than_max_workers_partitions_are_in_flight():
+    lock = threading.Lock()
+    in_flight = []
+    max_in_flight = []
+
+    def read(partition):
+        with lock:
+            in_flight.append(partition)
+            max_in_flight.append(len(in_flight))
+        time.sleep(0.01)
+        with lock:
+            in_flight.remove(partition)
+        yield partition
+
+    for _, outputs in read_partitions_concurrently(range(10), read, max_workers=2):
+        list(outputs)
+
+    assert max(max_in_flight) <= 2
+
+
+def test_unconsumed_outputs_are_drained():
+    partitions = [partition for partition, _ in read_partitions_concurrently(range(4), _read_with_delay, max_workers=2, buffer_size=1)]
+
+    assert partitions == list(range(4))
+
+
+def test_exception_is_raised_when_partition_is_consumed():
+    def read(partition):
+        if partition == 1:
+            raise ValueError("failure")
+        yield partition
+
+    reads = read_partitions_concurrently(range(3), read, max_workers=3)
+    partition, outputs = next(reads)
+    assert list(outputs) == [0]
+
+    partition, outputs = next(reads)
+    with pytest.raises(ValueError, match="failure"):
+        list(outputs)
+
+
+def test_workers_stop_when_reads_are_closed():
+    produced = []
+
+    def read(partition):
+        for i in range(1000):
+            produced.append(i)
+            yield i
+
+    reads = read_partitions_concurrently(range(2), read, max_workers=2, buffer_size=1)
+    _, outputs = next(reads)
+    next(outputs)
+    reads.close()
+
+    # Workers are blocked on their buffer and stop instead of reading every partition to the end
+    assert len(produced) < 2000
+
+
+def test_interleaved_outputs_keep_their_order_within_a_partition():
+    outputs = list(read_partitions_interleaved(range(5), _read_with_delay, max_workers=3))
+
+    assert sorted(outputs) == [(partition, f"{partition}-{i}") for partition in range(5) for i in range(3)]
+    for partition in range(5):
+        assert [output for p, output in outputs if p == partition] == [f"{partition}-{i}" for i in range(3)]
+
+
+def test_interleaved_outputs_are_emitted_as_soon_as_produced():
+    slow_partition_can_finish = threading.Event()
+
+    def read(partition):
+        if partition == 0:
+            slow_partition_can_finish.wait(timeout=5)
+        yield partition
+
+    reads = read_partitions_interleaved(range(2), read, max_workers=2)
+    # The second partition isn't blocked behind the first one
+    assert next(reads) == (1, 1)
+    slow_partition_can_finish.set()
+    assert list(reads) == [(0, 0)]
+
+
+def test_interleaved_exception_stops_the_other_partitions():
+    produced = []
+
+    def read(partition):
+        if partition == 0:
+            raise ValueError("failure")
+        for i in range(1000):
+            produced.append(i)
+            yield i
+
+    with pytest.raises(ValueError, match="failure"):
+        for _ in read_partitions_interleaved(range(2), read, max_workers=2, buffer_size=1):
+            time.sleep(0.001)
+
+    assert len(produced) < 1000
@@ -14,7 +14,7 @@ from pathlib import Path
 import jsonref
 from airbyte_cdk.logger import AirbyteLogger
 from airbyte_cdk.models.airbyte_protocol import ConnectorSpecification, FailureType
-from airbyte_cdk.sources.utils.schema_helpers import ResourceSchemaLoader, check_config_against_spec_or_exit
+from airbyte_cdk.sources.utils.schema_helpers import ResourceSchemaLoader, check_config_against_spec_or_exit, schema_loads
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 from pytest import fixture
 from pytest import raises as pytest_raises
@@ -35,6 +35,13 @@ def create_and_teardown_schemas_dir():
     shutil.rmtree(SCHEMAS_ROOT)
 
 
+@fixture(autouse=True)
+def clear_schema_cache():
+    # Tests write different schemas with the same name
+    ResourceSchemaLoader.clear_cache()
+    yield
+
+
 def create_schema(name: str, content: Mapping):
     with open(SCHEMAS_ROOT / f"{name}.json", "w") as f:
         f.write(json.dumps(content))
@@ -189,3 +196,21 @@ class TestResourceSchemaLoader:
         # Make sure generated schema is JSON serializable
         assert json.dumps(actual_schema)
         assert jsonref.JsonRef.replace_refs(actual_schema)
+
+    @staticmethod
+    def test_schema_is_loaded_once():
+        create_schema("cached_schema", {"type": "object", "properties": {"str": {"type": "string"}}})
+        schema_file = f"{MODULE_NAME}/schemas/cached_schema.json"
+        loads = schema_loads[schema_file]
+
+        first_schema = ResourceSchemaLoader(MODULE_NAME).get_schema("cached_schema")
+        first_schema["properties"]["added"] = {"type": "integer"}
+        second_schema = ResourceSchemaLoader(MODULE_NAME).get_schema("cached_schema")
+
+        assert schema_loads[schema_file] == loads + 1
+        # Callers get copies so they can't alter the cached schema
+        assert second_schema == {"type": "object", "properties": {"str": {"type": "string"}}}
+
+        ResourceSchemaLoader.clear_cache()
+        ResourceSchemaLoader(MODULE_NAME).get_schema("cached_schema")
+        assert schema_loads[schema_file] == loads + 2
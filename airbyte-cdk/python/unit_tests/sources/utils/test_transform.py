@@ -2,6 +2,7 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
+import copy
 import json
 
 import pytest
@@ -205,8 +206,9 @@ VERY_NESTED_SCHEMA = {
         ),
     ],
 )
-def test_transform(schema, actual, expected, expected_warns, caplog):
-    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+@pytest.mark.parametrize("compile_schema", [False, True])
+def test_transform(schema, actual, expected, expected_warns, compile_schema, caplog):
+    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization, compile_schema=compile_schema)
     t.transform(actual, schema)
     assert json.dumps(actual) == json.dumps(expected)
     if expected_warns:
@@ -232,9 +234,10 @@ def test_transform_wrong_config():
                 pass
 
 
-def test_custom_transform():
+@pytest.mark.parametrize("compile_schema", [False, True])
+def test_custom_transform(compile_schema):
     class NotAStream:
-        transformer = TypeTransformer(TransformConfig.CustomSchemaNormalization)
+        transformer = TypeTransformer(TransformConfig.CustomSchemaNormalization, compile_schema=compile_schema)
 
         @transformer.registerCustomTransform
         def transform_cb(instance, schema):
@@ -249,9 +252,12 @@ def test_custom_transform():
     assert obj == {"value": "transformed"}
 
 
-def test_custom_transform_with_default_normalization():
+@pytest.mark.parametrize("compile_schema", [False, True])
+def test_custom_transform_with_default_normalization(compile_schema):
     class NotAStream:
-        transformer = TypeTransformer(TransformConfig.CustomSchemaNormalization | TransformConfig.DefaultSchemaNormalization)
+        transformer = TypeTransformer(
+            TransformConfig.CustomSchemaNormalization | TransformConfig.DefaultSchemaNormalization, compile_schema=compile_schema
+        )
 
         @transformer.registerCustomTransform
         def transform_cb(instance, schema):
@@ -264,3 +270,69 @@ def test_custom_transform_with_default_normalization():
     obj = {"value": 12}
     s.transformer.transform(obj, SIMPLE_SCHEMA)
     assert obj == {"value": "transformed"}
+
+
+RECURSIVE_SCHEMA = {
+    "type": "object",
+    "properties": {"node": {"$ref": "#/definitions/node"}},
+    "definitions": {
+        "node": {
+            "type": ["null", "object"],
+            "properties": {"value": {"type": "integer"}, "child": {"$ref": "#/definitions/node"}},
+        }
+    },
+}
+
+
+def test_compiled_transform_recursive_schema():
+    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization, compile_schema=True)
+    record = {"node": {"value": "1", "child": {"value": "2", "child": None}}}
+    t.transform(record, RECURSIVE_SCHEMA)
+    assert record == {"node": {"value": 1, "child": {"value": 2, "child": None}}}
+
+
+def test_compiled_transform_reuses_plan(mocker):
+    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization, compile_schema=True)
+    compile_spy = mocker.spy(t, "_compile")
+    for i in range(3):
+        record = {"value": i}
+        t.transform(record, SIMPLE_SCHEMA)
+        assert record == {"value": str(i)}
+    # A schema equal to a compiled one, e.g. reloaded from disk, doesn't need to be compiled again
+    t.transform({"value": 1}, json.loads(json.dumps(SIMPLE_SCHEMA)))
+    assert compile_spy.call_count == 1
+
+
+def test_compiled_transform_falls_back_to_validator_for_unsupported_schema(caplog):
+    schema = {"type": "object", "properties": {"value": {"type": "array", "items": [{"type": "string"}, {"type": "integer"}]}}}
+    t = TypeTransformer(TransformConfig.NoTransform, compile_schema=True)
+    t._config = TransformConfig.CustomSchemaNormalization
+    record = {"value": ["a", 1]}
+    t.transform(record, schema)
+    assert record == {"value": ["a", 1]}
+    assert t._compiled_schemas == [(schema, None)]
+
+
+def test_compiled_transform_of_wide_schema():
+    """
+    The compiled plan and the validator based traversal must produce the same records on a wide schema.
+    """
+    types = ["string", "integer", "number", "boolean"]
+    schema = {
+        "type": "object",
+        "properties": {
+            **{f"field_{i}": {"type": ["null", types[i % len(types)]]} for i in range(200)},
+            "nested": {"type": "object", "properties": {"values": {"type": "array", "items": {"type": "string"}}}},
+        },
+    }
+    record = {**{f"field_{i}": i for i in range(200)}, "nested": {"values": [1, 2, 3]}}
+
+    results = {}
+    for compile_schema in [False, True]:
+        transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization, compile_schema=compile_schema)
+        records = [copy.deepcopy(record) for _ in range(200)]
+        for r in records:
+            transformer.transform(r, schema)
+        results[compile_schema] = records
+
+    assert results[True] == results[False]
@@ -53,3 +53,15 @@ def test_double_finish_is_safely_ignored():
         timer.finish_event()
         timer.finish_event()
         assert timer.count == 1
+
+
+def test_finish_named_event_out_of_order():
+    with create_timer("Source Counter") as timer:
+        timer.start_event("first")
+        timer.start_event("second")
+        timer.finish_event("first")
+        report = timer.report().split("\n")[1:]
+        assert report[0].startswith("first 0:00")
+        assert report[1] == "second in progress"
+        timer.finish_event()
+        assert timer.events["second"].end is not None
@@ -0,0 +1,66 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import pytest
+from airbyte_cdk.models import (
+    AirbyteMessage,
+    AirbyteRecordMessage,
+    AirbyteStateMessage,
+    AirbyteStateType,
+    AirbyteStreamState,
+    StreamDescriptor,
+    Type,
+)
+from airbyte_cdk.utils import message_reader
+from airbyte_cdk.utils.message_reader import InvalidMessageError, parse_message
+
+RECORD = AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="users", data={"id": 1, "tags": ["a"]}, emitted_at=1))
+RECORD_WITH_NAMESPACE = AirbyteMessage(
+    type=Type.RECORD, record=AirbyteRecordMessage(stream="users", namespace="public", data={"id": 1}, emitted_at=1)
+)
+STATE = AirbyteMessage(
+    type=Type.STATE,
+    state=AirbyteStateMessage(
+        type=AirbyteStateType.STREAM,
+        stream=AirbyteStreamState(stream_descriptor=StreamDescriptor(name="users"), stream_state={"updated_at": "2022-01-01"}),
+    ),
+)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+@pytest.mark.parametrize("as_bytes", [True, False])
+@pytest.mark.parametrize("message", [RECORD, RECORD_WITH_NAMESPACE, STATE])
+def test_parse_message(mocker, use_orjson, as_bytes, message):
+    if not use_orjson:
+        mocker.patch.object(message_reader, "orjson", None)
+    line = message.json(exclude_unset=True)
+
+    parsed = parse_message(line.encode("utf-8") if as_bytes else line)
+
+    assert parsed == message
+    assert parsed.json(exclude_unset=True) == line
+
+
+def test_record_data_is_not_validated(mocker):
+    parse_obj = mocker.spy(AirbyteMessage, "parse_obj")
+
+    parse_message(RECORD.json(exclude_unset=True))
+    assert not parse_obj.called
+
+    parse_message(STATE.json(exclude_unset=True))
+    assert parse_obj.called
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        pytest.param("not json", id="test_invalid_json"),
+        pytest.param("[1, 2]", id="test_not_an_object"),
+        pytest.param('{"type": "UNKNOWN"}', id="test_unknown_type"),
+        pytest.param('{"type": "RECORD", "record": {"stream": "users", "data": [1]}}', id="test_invalid_record"),
+    ],
+)
+def test_parse_invalid_message(line):
+    with pytest.raises(InvalidMessageError):
+        parse_message(line)
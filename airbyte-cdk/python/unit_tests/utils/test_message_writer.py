@@ -0,0 +1,133 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import io
+import json
+from decimal import Decimal
+
+import pytest
+from airbyte_cdk.models import (
+    AirbyteLogMessage,
+    AirbyteMessage,
+    AirbyteRecordMessage,
+    AirbyteStateMessage,
+    AirbyteStateType,
+    AirbyteStreamState,
+    Level,
+    StreamDescriptor,
+    Type,
+)
+from airbyte_cdk.utils import message_writer
+from airbyte_cdk.utils.message_writer import AirbyteMessageWriter, serialize_message
+
+
+def _record(data, namespace=None) -> AirbyteMessage:
+    record = AirbyteRecordMessage(stream="stream", data=data, emitted_at=1)
+    if namespace:
+        record.namespace = namespace
+    return AirbyteMessage(type=Type.RECORD, record=record)
+
+
+def _state() -> AirbyteMessage:
+    return AirbyteMessage(
+        type=Type.STATE,
+        state=AirbyteStateMessage(
+            type=AirbyteStateType.STREAM, stream=AirbyteStreamState(stream_descriptor=StreamDescriptor(name="stream"))
+        ),
+    )
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+@pytest.mark.parametrize(
+    "message",
+    [
+        pytest.param(_record({"id": 1, "name": "airbyte", "nested": {"values": [1.5, None, True]}}), id="test_record"),
+        pytest.param(_record({"id": 1}, namespace="public"), id="test_record_with_namespace"),
+        pytest.param(_state(), id="test_state"),
+        pytest.param(AirbyteMessage(type=Type.LOG, log=AirbyteLogMessage(level=Level.INFO, message="hello")), id="test_log"),
+    ],
+)
+def test_serialize_message_is_equivalent_to_pydantic(mocker, use_orjson, message):
+    if not use_orjson:
+        mocker.patch.object(message_writer, "orjson", None)
+    assert json.loads(serialize_message(message)) == json.loads(message.json(exclude_unset=True))
+
+
+def test_serialize_record_with_non_json_types():
+    message = _record({"amount": Decimal("1.5")})
+    assert json.loads(serialize_message(message)) == {
+        "type": "RECORD",
+        "record": {"stream": "stream", "data": {"amount": 1.5}, "emitted_at": 1},
+    }
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_serialize_record_with_integer_beyond_64_bits(mocker, use_orjson):
+    if not use_orjson:
+        mocker.patch.object(message_writer, "orjson", None)
+    message = _record({"id": 2**64 + 1, "nested": [-(2**70)]})
+    assert json.loads(serialize_message(message)) == json.loads(message.json(exclude_unset=True))
+    assert json.loads(serialize_message(message))["record"]["data"] == {"id": 2**64 + 1, "nested": [-(2**70)]}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+@pytest.mark.parametrize(
+    "data, expected_json",
+    [
+        pytest.param({"value": float("nan"), "other": None}, b'"value": NaN', id="test_nan"),
+        pytest.param({"values": [float("inf"), None]}, b"[Infinity, null]", id="test_infinity"),
+        pytest.param({"nested": {"value": float("-inf")}, "other": None}, b'"value": -Infinity', id="test_nested_negative_infinity"),
+    ],
+)
+def test_serialize_record_with_non_finite_numbers_like_pydantic(mocker, use_orjson, data, expected_json):
+    if not use_orjson:
+        mocker.patch.object(message_writer, "orjson", None)
+    message = _record(data)
+    serialized = serialize_message(message)
+    assert expected_json in serialized
+    assert expected_json in message.json(exclude_unset=True).encode("utf-8")
+
+
+def test_serialize_already_serialized_message():
+    assert serialize_message('{"type": "LOG"}') == b'{"type": "LOG"}'
+
+
+def test_records_are_buffered_until_the_buffer_is_full():
+    output = io.BytesIO()
+    writer = AirbyteMessageWriter(output=output, buffer_size=100)
+
+    writer.write(_record({"id": 1}))
+    assert output.getvalue() == b""
+
+    writer.write(_record({"id": 2, "padding": "x" * 100}))
+    lines = output.getvalue().splitlines()
+    assert [json.loads(line)["record"]["data"]["id"] for line in lines] == [1, 2]
+
+
+def test_state_message_flushes_the_buffer():
+    output = io.BytesIO()
+    writer = AirbyteMessageWriter(output=output)
+
+    writer.write(_record({"id": 1}))
+    writer.write(_state())
+
+    assert [json.loads(line)["type"] for line in output.getvalue().splitlines()] == ["RECORD", "STATE"]
+
+
+def test_buffer_is_flushed_on_exit_even_on_failure():
+    output = io.BytesIO()
+    with pytest.raises(ValueError):
+        with AirbyteMessageWriter(output=output) as writer:
+            writer.write(_record({"id": 1}))
+            raise ValueError("failure")
+
+    assert json.loads(output.getvalue())["record"]["data"] == {"id": 1}
+
+
+def test_write_to_stdout(capsys):
+    with AirbyteMessageWriter() as writer:
+        writer.write(_record({"id": 1}))
+        writer.write(_state())
+
+    assert [json.loads(line)["type"] for line in capsys.readouterr().out.splitlines()] == ["RECORD", "STATE"]
@@ -65,6 +65,15 @@ class DefaultApi(ABC):
         Reads a specific stream in the source. TODO in a later phase - only read a single slice of data.
         """
 
+    @abstractmethod
+    async def read_stream_pages(
+        self, 
+        stream_read_request_body: StreamReadRequestBody = Body(None, description=""),
+    ) -> StreamRead:
+        """
+        Reads a specific stream in the source, sending the pages as soon as they are read
+        """
+
 
 def _assert_signature_is_set(method: Callable) -> None:
     """
@@ -121,6 +130,7 @@ def initialize_router(api: DefaultApi) -> APIRouter:
         responses={
             200: {"model": StreamsListRead, "description": "Successful operation"},
             400: {"model": KnownExceptionInfo, "description": "Exception occurred; see message for details."},
+            408: {"model": KnownExceptionInfo, "description": "The operation did not complete in time."},
             422: {"model": InvalidInputExceptionInfo, "description": "Input failed validation"},
         },
         tags=["default"],
@@ -136,6 +146,7 @@ def initialize_router(api: DefaultApi) -> APIRouter:
         responses={
             200: {"model": StreamRead, "description": "Successful operation"},
             400: {"model": KnownExceptionInfo, "description": "Exception occurred; see message for details."},
+            408: {"model": KnownExceptionInfo, "description": "The operation did not complete in time."},
             422: {"model": InvalidInputExceptionInfo, "description": "Input failed validation"},
         },
         tags=["default"],
@@ -143,5 +154,20 @@ def initialize_router(api: DefaultApi) -> APIRouter:
         response_model_by_alias=True,
     )
 
+    _assert_signature_is_set(api.read_stream_pages)
+    router.add_api_route(
+        "/v1/stream/read/pages",
+        endpoint=api.read_stream_pages,
+        methods=["POST"],
+        responses={
+            200: {"model": StreamRead, "description": "Successful operation"},
+            400: {"model": KnownExceptionInfo, "description": "Exception occurred; see message for details."},
+            422: {"model": InvalidInputExceptionInfo, "description": "Input failed validation"},
+        },
+        tags=["default"],
+        summary="Reads a specific stream in the source, sending the pages as soon as they are read",
+        response_model_by_alias=True,
+    )
+
     
     return router
@@ -19,9 +19,11 @@ class StreamRead(BaseModel):
 
         logs: The logs of this StreamRead.
         slices: The slices of this StreamRead.
+        test_read_limit_reached: The test_read_limit_reached of this StreamRead.
     """
 
     logs: List[object]
     slices: List[StreamReadSlices]
+    test_read_limit_reached: bool
 
 StreamRead.update_forward_refs()
@@ -0,0 +1,109 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Tuple
+
+from connector_builder.impl.low_code_cdk_adapter import LowCodeSourceAdapter
+
+# Maximum number of adapters kept in memory
+DEFAULT_MAX_SIZE = 100
+# Time after which an adapter is built again even if its manifest didn't change, in seconds
+DEFAULT_TTL_SECONDS = 15 * 60
+
+
+def manifest_key(manifest: Dict[str, Any]) -> str:
+    """
+    :return: A hash of the manifest which doesn't depend on the order of its keys
+    """
+    serialized_manifest = json.dumps(manifest, sort_keys=True, default=str)
+    return hashlib.sha256(serialized_manifest.encode("utf-8")).hexdigest()
+
+
+class LowCodeSourceAdapterCache:
+    """
+    LRU cache of LowCodeSourceAdapters keyed by a hash of their manifest.
+
+    Building an adapter resolves the references of the manifest and creates and validates all of its components, which the builder
+    UI would otherwise trigger on every test read even though the manifest rarely changes between two of them. Adapters don't depend on
+    the config, which is passed on every call, so editing the config doesn't evict them.
+
+    Entries are evicted once the cache holds more than max_size of them, least recently used first, or ttl_seconds after they were built.
+    Adapters which can't be built aren't cached so the error is raised again for the same manifest.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        adapter_factory: Callable[[Dict[str, Any]], LowCodeSourceAdapter] = LowCodeSourceAdapter,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param max_size: Maximum number of adapters kept in the cache
+        :param ttl_seconds: Time after which a cached adapter is built again
+        :param adapter_factory: Builds the adapter of a manifest
+        :param clock: Returns the current time in seconds, used to expire entries
+        """
+        if max_size < 1:
+            raise ValueError(f"The cache size must be at least 1, got {max_size}")
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._adapter_factory = adapter_factory
+        self._clock = clock
+        self._adapters: "OrderedDict[str, Tuple[float, LowCodeSourceAdapter]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, manifest: Dict[str, Any]) -> LowCodeSourceAdapter:
+        """
+        :param manifest: The low code manifest of the source
+        :return: The cached adapter of the manifest, built if there is none or it expired
+        """
+        key = manifest_key(manifest)
+        with self._lock:
+            entry = self._adapters.get(key)
+            if entry is not None:
+                created_at, adapter = entry
+                if self._clock() - created_at < self._ttl_seconds:
+                    self._adapters.move_to_end(key)
+                    self.hits += 1
+                    return adapter
+                del self._adapters[key]
+            self.misses += 1
+
+        # Building an adapter can take a while so it happens outside of the lock. Concurrent misses on the same manifest may each build
+        # an adapter, the last one built is kept
+        adapter = self._adapter_factory(manifest)
+        with self._lock:
+            self._adapters[key] = (self._clock(), adapter)
+            self._adapters.move_to_end(key)
+            while len(self._adapters) > self._max_size:
+                self._adapters.popitem(last=False)
+        return adapter
+
+    def clear(self):
+        """
+        Removes all the adapters from the cache and resets its metrics.
+        """
+        with self._lock:
+            self._adapters.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        :return: The share of lookups served from the cache, 0 if there was none
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self) -> int:
+        return len(self._adapters)
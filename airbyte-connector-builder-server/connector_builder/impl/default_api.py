@@ -2,14 +2,19 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
+import asyncio
+import itertools
 import json
 import logging
+import threading
 from json import JSONDecodeError
-from typing import Any, Dict, Iterable, Optional, Union
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, Union
 from urllib.parse import parse_qs, urljoin, urlparse
 
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Type
+from airbyte_cdk.sources.utils.schema_helpers import LIMIT_REACHED_LOG_PREFIX
 from fastapi import Body, HTTPException
+from fastapi.responses import StreamingResponse
 from jsonschema import ValidationError
 
 from connector_builder.generated.apis.default_api_interface import DefaultApi
@@ -22,12 +27,33 @@ from connector_builder.generated.models.stream_read_slices import StreamReadSlic
 from connector_builder.generated.models.streams_list_read import StreamsListRead
 from connector_builder.generated.models.streams_list_read_streams import StreamsListReadStreams
 from connector_builder.generated.models.streams_list_request_body import StreamsListRequestBody
-from connector_builder.impl.low_code_cdk_adapter import LowCodeSourceAdapter
+from connector_builder.impl.adapter_cache import LowCodeSourceAdapterCache
+from connector_builder.impl.low_code_cdk_adapter import LowCodeSourceAdapter, ReadLimits
+from connector_builder.impl.read_executor import ReadExecutor
+
+# Caps on the data read by a test read. Requests can only lower them
+DEFAULT_MAX_READ_LIMITS = ReadLimits(record_limit=1000, page_limit=5, slice_limit=5)
 
 
 class DefaultApiImpl(DefaultApi):
     logger = logging.getLogger("airbyte.connector-builder")
 
+    def __init__(
+        self,
+        adapter_cache: Optional[LowCodeSourceAdapterCache] = None,
+        read_executor: Optional[ReadExecutor] = None,
+        max_read_limits: ReadLimits = DEFAULT_MAX_READ_LIMITS,
+    ):
+        """
+        :param adapter_cache: Cache of the adapters built from the manifests of the requests, so that consecutive requests on the same
+        manifest don't parse it again
+        :param read_executor: Runs the blocking operations of the requests (building sources, reading streams) outside of the event loop
+        :param max_read_limits: Caps on the records, pages per slice and slices read by a test read, whatever the request asks for
+        """
+        self._adapter_cache = adapter_cache or LowCodeSourceAdapterCache()
+        self._read_executor = read_executor or ReadExecutor()
+        self._max_read_limits = max_read_limits
+
     async def get_manifest_template(self) -> str:
         return """version: "0.1.0"
 definitions:
@@ -85,6 +111,12 @@ spec:
         :param streams_list_request_body: Input parameters to retrieve the list of available streams
         :return: Stream objects made up of a stream name and the HTTP URL it will send requests to
         """
+        try:
+            return await self._read_executor.run(self._list_streams, streams_list_request_body)
+        except asyncio.TimeoutError:
+            raise self._timeout_exception("list streams")
+
+    def _list_streams(self, streams_list_request_body: StreamsListRequestBody) -> StreamsListRead:
         adapter = self._create_low_code_adapter(manifest=streams_list_request_body.manifest)
 
         stream_list_read = []
@@ -107,23 +139,102 @@ spec:
         :param stream_read_request_body: Input parameters to trigger the read operation for a stream
         :return: Airbyte record messages produced by the sync grouped by slice and page
         """
-        adapter = self._create_low_code_adapter(manifest=stream_read_request_body.manifest)
+        limits = self._get_read_limits(stream_read_request_body)
+        try:
+            adapter = await self._read_executor.run(self._create_low_code_adapter, stream_read_request_body.manifest)
+        except asyncio.TimeoutError:
+            raise self._timeout_exception("read")
 
         single_slice = StreamReadSlices(pages=[])
         log_messages = []
+        record_count = 0
+        test_read_limit_reached = False
         try:
-            for message_group in self._get_message_groups(
-                    adapter.read_stream(stream_read_request_body.stream, stream_read_request_body.config)
-            ):
+            async for message_group in self._read_message_groups(adapter, stream_read_request_body, limits):
                 if isinstance(message_group, AirbyteLogMessage):
                     log_messages.append({"message": message_group.message})
                 else:
                     single_slice.pages.append(message_group)
+                    record_count += len(message_group.records)
+                test_read_limit_reached = test_read_limit_reached or self._is_limit_reached(message_group, record_count, limits)
+        except asyncio.TimeoutError:
+            raise self._timeout_exception("read")
         except Exception as error:
             # TODO: We're temporarily using FastAPI's default exception model. Ideally we should use exceptions defined in the OpenAPI spec
             raise HTTPException(status_code=400, detail=f"Could not perform read with with error: {error.args[0]}")
 
-        return StreamRead(logs=log_messages, slices=[single_slice])
+        return StreamRead(logs=log_messages, slices=[single_slice], test_read_limit_reached=test_read_limit_reached)
+
+    async def read_stream_pages(self, stream_read_request_body: StreamReadRequestBody = Body(None, description="")) -> StreamingResponse:
+        """
+        Same as read_stream, except that the pages are sent to the client as soon as they are read, as newline delimited StreamReads
+        each holding the logs and pages produced since the previous one. Errors occurring once the response started are sent as logs
+        :param stream_read_request_body: Input parameters to trigger the read operation for a stream
+        :return: Streaming response of StreamReads
+        """
+        limits = self._get_read_limits(stream_read_request_body)
+        try:
+            adapter = await self._read_executor.run(self._create_low_code_adapter, stream_read_request_body.manifest)
+        except asyncio.TimeoutError:
+            raise self._timeout_exception("read")
+        return StreamingResponse(self._stream_read_lines(adapter, stream_read_request_body, limits), media_type="application/x-ndjson")
+
+    async def _stream_read_lines(
+        self, adapter: LowCodeSourceAdapter, stream_read_request_body: StreamReadRequestBody, limits: ReadLimits
+    ) -> AsyncIterator[str]:
+        record_count = 0
+        test_read_limit_reached = False
+        try:
+            async for message_group in self._read_message_groups(adapter, stream_read_request_body, limits):
+                if isinstance(message_group, AirbyteLogMessage):
+                    logs, slices = [{"message": message_group.message}], []
+                else:
+                    logs, slices = [], [StreamReadSlices(pages=[message_group])]
+                    record_count += len(message_group.records)
+                test_read_limit_reached = test_read_limit_reached or self._is_limit_reached(message_group, record_count, limits)
+                yield StreamRead(logs=logs, slices=slices, test_read_limit_reached=test_read_limit_reached).json() + "\n"
+        except asyncio.TimeoutError:
+            message = self._timeout_exception("read").detail
+            yield StreamRead(logs=[{"message": message}], slices=[], test_read_limit_reached=test_read_limit_reached).json() + "\n"
+        except Exception as error:
+            message = f"Could not perform read with with error: {error}"
+            yield StreamRead(logs=[{"message": message}], slices=[], test_read_limit_reached=test_read_limit_reached).json() + "\n"
+
+    def _get_read_limits(self, stream_read_request_body: StreamReadRequestBody) -> ReadLimits:
+        """
+        :return: The limits requested, lowered to the maximum limits of the server, or the maximum limits when none is requested
+        """
+        limits = {}
+        for name in ("record_limit", "page_limit", "slice_limit"):
+            requested, maximum = getattr(stream_read_request_body, name), getattr(self._max_read_limits, name)
+            if requested is not None and requested < 1:
+                raise HTTPException(status_code=400, detail=f"Invalid {name} {requested}, it should be at least 1")
+            candidates = [limit for limit in (requested, maximum) if limit is not None]
+            limits[name] = min(candidates) if candidates else None
+        return ReadLimits(**limits)
+
+    @staticmethod
+    def _is_limit_reached(message_group: Union[StreamReadPages, AirbyteLogMessage], record_count: int, limits: ReadLimits) -> bool:
+        """
+        The CDK reports the pages and slices left unread because of the limits with a log message. There is no such message for the
+        records, so the record limit is considered reached once as many records as the limit were read
+        """
+        if isinstance(message_group, AirbyteLogMessage):
+            return message_group.message.startswith(LIMIT_REACHED_LOG_PREFIX)
+        return limits.record_limit is not None and record_count >= limits.record_limit
+
+    def _read_message_groups(
+        self, adapter: LowCodeSourceAdapter, stream_read_request_body: StreamReadRequestBody, limits: ReadLimits
+    ) -> AsyncIterator[Union[StreamReadPages, AirbyteLogMessage]]:
+        def read(cancelled: threading.Event) -> Iterable[Union[StreamReadPages, AirbyteLogMessage]]:
+            messages = adapter.read_stream(stream_read_request_body.stream, stream_read_request_body.config, limits)
+            # Stop reading, and so sending requests, as soon as nobody is waiting for the messages anymore
+            return self._get_message_groups(itertools.takewhile(lambda _: not cancelled.is_set(), messages))
+
+        return self._read_executor.iterate(read)
+
+    def _timeout_exception(self, operation: str) -> HTTPException:
+        return HTTPException(status_code=408, detail=f"Could not {operation} within {self._read_executor.timeout_seconds} seconds")
 
     def _get_message_groups(self, messages: Iterable[AirbyteMessage]) -> Iterable[Union[StreamReadPages, AirbyteLogMessage]]:
         """
@@ -195,10 +306,13 @@ spec:
             self.logger.warning(f"Failed to parse log message into response object with error: {error}")
             return None
 
-    @staticmethod
-    def _create_low_code_adapter(manifest: Dict[str, Any]) -> LowCodeSourceAdapter:
+    def _create_low_code_adapter(self, manifest: Dict[str, Any]) -> LowCodeSourceAdapter:
         try:
-            return LowCodeSourceAdapter(manifest=manifest)
+            adapter = self._adapter_cache.get(manifest)
         except ValidationError as error:
             # TODO: We're temporarily using FastAPI's default exception model. Ideally we should use exceptions defined in the OpenAPI spec
             raise HTTPException(status_code=400, detail=f"Invalid connector manifest with error: {error.message}")
+        self.logger.debug(
+            f"Adapter cache: {self._adapter_cache.hits} hits, {self._adapter_cache.misses} misses, hit rate {self._adapter_cache.hit_rate:.2f}"
+        )
+        return adapter
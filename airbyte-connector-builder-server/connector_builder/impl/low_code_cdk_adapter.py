@@ -2,19 +2,36 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
-from typing import Any, Dict, Iterable, List
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
 
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level
 from airbyte_cdk.models import ConfiguredAirbyteCatalog
 from airbyte_cdk.models import Type as MessageType
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
-from airbyte_cdk.sources.declarative.yaml_declarative_source import \
-    ManifestDeclarativeSource
+from airbyte_cdk.sources.declarative.yaml_declarative_source import ManifestDeclarativeSource
 from airbyte_cdk.sources.streams.http import HttpStream
 
 
-class LowCodeSourceAdapter:
+@dataclass(frozen=True)
+class ReadLimits:
+    """
+    Caps on the data read from a stream, None meaning no cap
+    """
+
+    record_limit: Optional[int] = None
+    page_limit: Optional[int] = None
+    slice_limit: Optional[int] = None
+
+    def to_internal_config(self) -> Dict[str, int]:
+        """
+        :return: The internal config keys the CDK enforces the limits with
+        """
+        internal_config = {"_limit": self.record_limit, "_page_limit": self.page_limit, "_slice_limit": self.slice_limit}
+        return {key: value for key, value in internal_config.items() if value is not None}
 
+
+class LowCodeSourceAdapter:
     def __init__(self, manifest: Dict[str, Any]):
         # Request and response messages are only emitted for a sources that have debug turned on
         self._source = ManifestDeclarativeSource(manifest, debug=True)
@@ -27,13 +44,19 @@ class LowCodeSourceAdapter:
                     http_streams.append(stream.retriever)
                 else:
                     raise TypeError(
-                        f"A declarative stream should only have a retriever of type HttpStream, but received: {stream.retriever.__class__}")
+                        f"A declarative stream should only have a retriever of type HttpStream, but received: {stream.retriever.__class__}"
+                    )
             else:
                 raise TypeError(
-                    f"A declarative source should only contain streams of type DeclarativeStream, but received: {stream.__class__}")
+                    f"A declarative source should only contain streams of type DeclarativeStream, but received: {stream.__class__}"
+                )
         return http_streams
 
-    def read_stream(self, stream: str, config: Dict[str, Any]) -> Iterable[AirbyteMessage]:
+    def read_stream(self, stream: str, config: Dict[str, Any], limits: ReadLimits = ReadLimits()) -> Iterable[AirbyteMessage]:
+        """
+        Reads the stream, stopping once any of the limits is reached. The limits are enforced by the CDK while reading, so no request is
+        sent for the pages and slices past them
+        """
         configured_catalog = ConfiguredAirbyteCatalog.parse_obj(
             {
                 "streams": [
@@ -49,7 +72,9 @@ class LowCodeSourceAdapter:
                 ]
             }
         )
-        generator = self._source.read(logger=self._source.logger, config=config, catalog=configured_catalog)
+        generator = self._source.read(
+            logger=self._source.logger, config={**config, **limits.to_internal_config()}, catalog=configured_catalog
+        )
 
         # the generator can raise an exception
         # iterate over the generated messages. if next raise an exception, catch it and yield it as an AirbyteLogMessage
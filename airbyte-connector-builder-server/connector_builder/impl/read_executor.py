@@ -0,0 +1,111 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, AsyncIterator, Callable, Iterable, TypeVar
+
+T = TypeVar("T")
+
+# Maximum number of blocking operations (e.g. reads) running at the same time
+DEFAULT_MAX_WORKERS = 8
+# Time after which an operation is abandoned, in seconds
+DEFAULT_TIMEOUT_SECONDS = 5 * 60
+# Number of items produced ahead of the consumer by iterate
+DEFAULT_BUFFER_SIZE = 100
+# How often a blocked producer checks whether it was cancelled, in seconds
+_POLL_INTERVAL = 0.1
+
+
+class _Done:
+    """Marks the end of the items produced by iterate"""
+
+
+class _Failure:
+    """Wraps an exception raised while producing items, to be re-raised by the consumer"""
+
+    def __init__(self, exception: Exception):
+        self.exception = exception
+
+
+class ReadExecutor:
+    """
+    Runs the blocking operations of the server (building sources, reading streams with requests) on a bounded pool of threads so that
+    they don't block the event loop, and so that one slow read doesn't stall every other request.
+
+    Every operation has to complete within timeout_seconds, otherwise asyncio.TimeoutError is raised. Threads can't be interrupted, so
+    iterate hands a threading.Event to the blocking code which is set once the consumer is gone (timeout, client disconnection or
+    cancellation) and stops pulling items from it as soon as it is set.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS):
+        """
+        :param max_workers: Maximum number of operations running at the same time. Others wait for a thread to be available
+        :param timeout_seconds: Time after which an operation is abandoned, including the time spent waiting for a thread
+        """
+        self.timeout_seconds = timeout_seconds
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="connector_builder")
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        :return: The result of func(*args), computed on the pool
+        :raises asyncio.TimeoutError: if func doesn't return in time. func keeps running until it returns but its result is ignored
+        """
+        future = asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        return await asyncio.wait_for(future, timeout=self.timeout_seconds)
+
+    async def iterate(self, produce: Callable[[threading.Event], Iterable[T]], buffer_size: int = DEFAULT_BUFFER_SIZE) -> AsyncIterator[T]:
+        """
+        Iterates on the pool over the items returned by produce(cancelled), yielding them as soon as they are produced.
+
+        :param produce: Function returning the items. It should stop producing items once the event it receives is set
+        :param buffer_size: Maximum number of items produced ahead of the consumer
+        :raises asyncio.TimeoutError: if all the items aren't produced in time
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout_seconds
+        buffer: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+        cancelled = threading.Event()
+
+        def put(item: Any) -> bool:
+            if loop.is_closed():
+                return False
+            future = asyncio.run_coroutine_threadsafe(buffer.put(item), loop)
+            while not cancelled.is_set():
+                try:
+                    future.result(timeout=_POLL_INTERVAL)
+                    return True
+                except concurrent.futures.TimeoutError:
+                    continue
+            future.cancel()
+            return False
+
+        def run_producer():
+            try:
+                for item in produce(cancelled):
+                    if not put(item):
+                        return
+                put(_Done())
+            except Exception as e:
+                put(_Failure(e))
+
+        # The producer reports through the buffer only, so it doesn't need the loop to be running once the consumer is gone
+        self._executor.submit(run_producer)
+        try:
+            while True:
+                item = await asyncio.wait_for(buffer.get(), timeout=max(deadline - loop.time(), 0))
+                if isinstance(item, _Done):
+                    return
+                if isinstance(item, _Failure):
+                    raise item.exception
+                yield item
+        finally:
+            cancelled.set()
+
+    def shutdown(self):
+        """
+        Stops accepting operations and waits for the running ones to complete.
+        """
+        self._executor.shutdown(wait=True)
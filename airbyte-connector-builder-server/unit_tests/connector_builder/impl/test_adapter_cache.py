@@ -0,0 +1,112 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+from unittest.mock import MagicMock
+
+import pytest
+from connector_builder.impl.adapter_cache import LowCodeSourceAdapterCache, manifest_key
+from connector_builder.impl.low_code_cdk_adapter import LowCodeSourceAdapter
+
+MANIFEST = {
+    "version": "0.1.0",
+    "streams": [
+        {
+            "retriever": {
+                "record_selector": {"extractor": {"field_pointer": ["items"]}},
+                "paginator": {"type": "NoPagination"},
+                "requester": {"url_base": "https://demonslayers.com/api/v1/", "http_method": "GET"},
+            },
+            "$options": {"name": "hashiras", "path": "/hashiras"},
+        }
+    ],
+    "check": {"stream_names": ["hashiras"], "class_name": "airbyte_cdk.sources.declarative.checks.check_stream.CheckStream"},
+}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def manifest_with_name(name: str) -> dict:
+    return {"version": "0.1.0", "streams": [{"$options": {"name": name}}]}
+
+
+def test_manifest_key_does_not_depend_on_key_order():
+    assert manifest_key({"a": 1, "b": {"c": 2, "d": 3}}) == manifest_key({"b": {"d": 3, "c": 2}, "a": 1})
+    assert manifest_key({"a": 1}) != manifest_key({"a": 2})
+
+
+def test_adapter_is_built_once_per_manifest():
+    cache = LowCodeSourceAdapterCache()
+
+    adapter = cache.get(MANIFEST)
+
+    assert isinstance(adapter, LowCodeSourceAdapter)
+    assert cache.get(MANIFEST) is adapter
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert cache.hit_rate == 0.5
+
+
+def test_least_recently_used_adapter_is_evicted():
+    factory = MagicMock(side_effect=lambda manifest: object())
+    cache = LowCodeSourceAdapterCache(max_size=2, adapter_factory=factory)
+
+    first = cache.get(manifest_with_name("first"))
+    cache.get(manifest_with_name("second"))
+    # Using the first adapter again makes the second one the least recently used
+    cache.get(manifest_with_name("first"))
+    cache.get(manifest_with_name("third"))
+
+    assert len(cache) == 2
+    assert cache.get(manifest_with_name("first")) is first
+    cache.get(manifest_with_name("second"))
+    assert factory.call_count == 4
+
+
+def test_expired_adapter_is_built_again():
+    clock = FakeClock()
+    factory = MagicMock(side_effect=lambda manifest: object())
+    cache = LowCodeSourceAdapterCache(ttl_seconds=60, adapter_factory=factory, clock=clock)
+
+    adapter = cache.get(MANIFEST)
+    clock.now = 59
+    assert cache.get(MANIFEST) is adapter
+    clock.now = 60
+    assert cache.get(MANIFEST) is not adapter
+    assert factory.call_count == 2
+    assert cache.hits == 1
+    assert cache.misses == 2
+
+
+def test_adapter_failing_to_build_is_not_cached():
+    factory = MagicMock(side_effect=[ValueError("invalid manifest"), object()])
+    cache = LowCodeSourceAdapterCache(adapter_factory=factory)
+
+    with pytest.raises(ValueError):
+        cache.get(MANIFEST)
+
+    assert len(cache) == 0
+    assert cache.get(MANIFEST) is not None
+    assert factory.call_count == 2
+
+
+def test_clear():
+    cache = LowCodeSourceAdapterCache(adapter_factory=lambda manifest: object())
+    cache.get(MANIFEST)
+    cache.get(MANIFEST)
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.hit_rate == 0
+
+
+def test_invalid_size():
+    with pytest.raises(ValueError):
+        LowCodeSourceAdapterCache(max_size=0)
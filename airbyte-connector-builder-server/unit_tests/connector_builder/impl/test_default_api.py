@@ -4,10 +4,14 @@
 
 import asyncio
 import json
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, AirbyteRecordMessage, Level, Type
+from airbyte_cdk.sources.declarative.yaml_declarative_source import ManifestDeclarativeSource
+from airbyte_cdk.sources.utils.schema_helpers import LIMIT_REACHED_LOG_PREFIX
 from connector_builder.generated.models.http_request import HttpRequest
 from connector_builder.generated.models.http_response import HttpResponse
 from connector_builder.generated.models.stream_read import StreamRead
@@ -17,6 +21,8 @@ from connector_builder.generated.models.streams_list_read import StreamsListRead
 from connector_builder.generated.models.streams_list_read_streams import StreamsListReadStreams
 from connector_builder.generated.models.streams_list_request_body import StreamsListRequestBody
 from connector_builder.impl.default_api import DefaultApiImpl
+from connector_builder.impl.low_code_cdk_adapter import ReadLimits
+from connector_builder.impl.read_executor import ReadExecutor
 from fastapi import HTTPException
 
 MANIFEST = {
@@ -97,6 +103,17 @@ def test_list_streams():
         assert actual_streams.streams[i] == expected_stream
 
 
+def test_manifest_is_parsed_once_across_requests():
+    api = DefaultApiImpl()
+    loop = asyncio.get_event_loop()
+
+    with patch("connector_builder.impl.low_code_cdk_adapter.ManifestDeclarativeSource", wraps=ManifestDeclarativeSource) as source_class:
+        loop.run_until_complete(api.list_streams(StreamsListRequestBody(manifest=MANIFEST, config=CONFIG)))
+        loop.run_until_complete(api.list_streams(StreamsListRequestBody(manifest=MANIFEST, config={"rank": "upper-five"})))
+
+    assert source_class.call_count == 1
+
+
 def test_list_streams_with_interpolated_urls():
     manifest = {
         "version": "0.1.0",
@@ -452,3 +469,137 @@ def test_create_response_from_log_message(log_message, expected_response):
     actual_response = api._create_response_from_log_message(airbyte_log_message)
 
     assert actual_response == expected_response
+
+
+def test_read_stream_times_out():
+    read_started = threading.Event()
+
+    def slow_read(stream, config, limits):
+        read_started.set()
+        yield request_log_message({"url": "https://demonslayers.com/api/v1/hashiras"})
+        yield response_log_message({"status_code": 200, "body": "{}"})
+        while True:
+            yield record_message("hashiras", {"name": "Tanjiro Kamado"})
+            time.sleep(0.05)
+
+    mock_source_adapter = MagicMock()
+    mock_source_adapter.read_stream.side_effect = slow_read
+
+    with patch.object(DefaultApiImpl, "_create_low_code_adapter", return_value=mock_source_adapter):
+        api = DefaultApiImpl(read_executor=ReadExecutor(timeout_seconds=0.3))
+
+        loop = asyncio.get_event_loop()
+        with pytest.raises(HTTPException) as actual_exception:
+            loop.run_until_complete(api.read_stream(StreamReadRequestBody(manifest=MANIFEST, config=CONFIG, stream="hashiras")))
+
+    assert read_started.is_set()
+    assert actual_exception.value.status_code == 408
+
+
+def test_read_stream_pages():
+    request = {"url": "https://demonslayers.com/api/v1/hashiras?era=taisho"}
+    response = {"status_code": 200, "body": '{"name": "field"}'}
+
+    mock_source_adapter = MagicMock()
+    mock_source_adapter.read_stream.return_value = [
+        request_log_message(request),
+        response_log_message(response),
+        record_message("hashiras", {"name": "Shinobu Kocho"}),
+        AirbyteMessage(type=Type.LOG, log=AirbyteLogMessage(level=Level.INFO, message="log message")),
+        request_log_message(request),
+        response_log_message(response),
+        record_message("hashiras", {"name": "Mitsuri Kanroji"}),
+    ]
+
+    async def read_lines(api):
+        streaming_response = await api.read_stream_pages(StreamReadRequestBody(manifest=MANIFEST, config=CONFIG, stream="hashiras"))
+        return [StreamRead.parse_raw(line) async for line in streaming_response.body_iterator]
+
+    with patch.object(DefaultApiImpl, "_create_low_code_adapter", return_value=mock_source_adapter):
+        api = DefaultApiImpl()
+        loop = asyncio.get_event_loop()
+        actual_lines = loop.run_until_complete(read_lines(api))
+
+    assert len(actual_lines) == 3
+    assert actual_lines[0].logs == [{"message": "log message"}]
+    assert [page.records for line in actual_lines[1:] for page in line.slices[0].pages] == [
+        [{"name": "Shinobu Kocho"}],
+        [{"name": "Mitsuri Kanroji"}],
+    ]
+
+
+def test_read_stream_pages_sends_errors_as_logs():
+    mock_source_adapter = MagicMock()
+    mock_source_adapter.read_stream.side_effect = ValueError("read failed")
+
+    async def read_lines(api):
+        streaming_response = await api.read_stream_pages(StreamReadRequestBody(manifest=MANIFEST, config=CONFIG, stream="hashiras"))
+        return [StreamRead.parse_raw(line) async for line in streaming_response.body_iterator]
+
+    with patch.object(DefaultApiImpl, "_create_low_code_adapter", return_value=mock_source_adapter):
+        api = DefaultApiImpl()
+        loop = asyncio.get_event_loop()
+        actual_lines = loop.run_until_complete(read_lines(api))
+
+    assert actual_lines == [
+        StreamRead(logs=[{"message": "Could not perform read with with error: read failed"}], slices=[], test_read_limit_reached=False)
+    ]
+
+
+def test_read_stream_passes_limits_to_adapter():
+    mock_source_adapter = MagicMock()
+    mock_source_adapter.read_stream.return_value = [
+        request_log_message({"url": "https://demonslayers.com/api/v1/hashiras"}),
+        response_log_message({"status_code": 200, "body": "{}"}),
+    ]
+
+    with patch.object(DefaultApiImpl, "_create_low_code_adapter", return_value=mock_source_adapter):
+        api = DefaultApiImpl(max_read_limits=ReadLimits(record_limit=100, page_limit=5, slice_limit=None))
+        loop = asyncio.get_event_loop()
+        loop.run_until_complete(
+            api.read_stream(
+                StreamReadRequestBody(manifest=MANIFEST, config=CONFIG, stream="hashiras", record_limit=1000, page_limit=2, slice_limit=3)
+            )
+        )
+
+    mock_source_adapter.read_stream.assert_called_once_with("hashiras", CONFIG, ReadLimits(record_limit=100, page_limit=2, slice_limit=3))
+
+
+@pytest.mark.parametrize("limit_name", ["record_limit", "page_limit", "slice_limit"])
+def test_read_stream_invalid_limit(limit_name):
+    api = DefaultApiImpl()
+    loop = asyncio.get_event_loop()
+    with pytest.raises(HTTPException) as actual_exception:
+        loop.run_until_complete(
+            api.read_stream(StreamReadRequestBody(manifest=MANIFEST, config=CONFIG, stream="hashiras", **{limit_name: 0}))
+        )
+
+    assert actual_exception.value.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "test_name, record_limit, log_message, expected_test_read_limit_reached",
+    [
+        ("test_no_limit_reached", 3, "log message", False),
+        ("test_record_limit_reached", 2, "log message", True),
+        ("test_page_limit_reached", 3, f"{LIMIT_REACHED_LOG_PREFIX} page limit of 1 reached for slice None", True),
+    ],
+)
+def test_read_stream_limit_reached(test_name, record_limit, log_message, expected_test_read_limit_reached):
+    mock_source_adapter = MagicMock()
+    mock_source_adapter.read_stream.return_value = [
+        request_log_message({"url": "https://demonslayers.com/api/v1/hashiras"}),
+        response_log_message({"status_code": 200, "body": "{}"}),
+        record_message("hashiras", {"name": "Shinobu Kocho"}),
+        record_message("hashiras", {"name": "Mitsuri Kanroji"}),
+        AirbyteMessage(type=Type.LOG, log=AirbyteLogMessage(level=Level.INFO, message=log_message)),
+    ]
+
+    with patch.object(DefaultApiImpl, "_create_low_code_adapter", return_value=mock_source_adapter):
+        api = DefaultApiImpl()
+        loop = asyncio.get_event_loop()
+        actual_response = loop.run_until_complete(
+            api.read_stream(StreamReadRequestBody(manifest=MANIFEST, config=CONFIG, stream="hashiras", record_limit=record_limit))
+        )
+
+    assert actual_response.test_read_limit_reached == expected_test_read_limit_reached
@@ -13,7 +13,7 @@ from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
 from airbyte_cdk.sources.declarative.parsers.undefined_reference_exception import UndefinedReferenceException
 from airbyte_cdk.sources.streams.http import HttpStream
 
-from connector_builder.impl.low_code_cdk_adapter import LowCodeSourceAdapter
+from connector_builder.impl.low_code_cdk_adapter import LowCodeSourceAdapter, ReadLimits
 
 
 class MockConcreteStream(HttpStream, ABC):
@@ -287,6 +287,17 @@ def test_read_streams_with_error():
         assert actual_messages[i] == expected_message
 
 
+def test_read_streams_with_limits():
+    mock_source = MagicMock()
+    mock_source.read.return_value = iter([])
+
+    adapter = LowCodeSourceAdapter(MANIFEST)
+    adapter._source = mock_source
+    list(adapter.read_stream("hashiras", {"api_key": "key"}, ReadLimits(record_limit=10, page_limit=2)))
+
+    assert mock_source.read.call_args.kwargs["config"] == {"api_key": "key", "_limit": 10, "_page_limit": 2}
+
+
 def test_read_streams_invalid_reference():
     invalid_reference_manifest = {
         "version": "0.1.0",
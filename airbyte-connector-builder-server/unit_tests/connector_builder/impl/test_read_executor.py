@@ -0,0 +1,96 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import asyncio
+import threading
+import time
+
+import pytest
+from connector_builder.impl.read_executor import ReadExecutor
+
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+
+def test_run():
+    executor = ReadExecutor()
+
+    assert asyncio.run(executor.run(lambda a, b: a + b, 1, 2)) == 3
+
+
+def test_run_does_not_block_the_event_loop():
+    executor = ReadExecutor(max_workers=2)
+    release = threading.Event()
+
+    async def run_both():
+        blocked = asyncio.ensure_future(executor.run(release.wait, 5))
+        # The loop keeps serving other operations while the first one is blocked
+        result = await executor.run(lambda: "done")
+        release.set()
+        await blocked
+        return result
+
+    assert asyncio.run(run_both()) == "done"
+
+
+def test_run_times_out():
+    executor = ReadExecutor(timeout_seconds=0.1)
+    release = threading.Event()
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(executor.run(release.wait, 5))
+    release.set()
+
+
+def test_iterate():
+    executor = ReadExecutor()
+
+    assert asyncio.run(collect(executor.iterate(lambda cancelled: range(250), buffer_size=10))) == list(range(250))
+
+
+def test_iterate_raises_the_exception_of_the_producer():
+    def produce(cancelled):
+        yield 1
+        raise ValueError("read failed")
+
+    executor = ReadExecutor()
+
+    with pytest.raises(ValueError, match="read failed"):
+        asyncio.run(collect(executor.iterate(produce)))
+
+
+@pytest.mark.parametrize(
+    "test_name, timeout_seconds, consume",
+    [
+        ("test_timeout", 0.2, collect),
+        ("test_consumer_gone", 60, lambda iterator: iterator.__anext__()),
+    ],
+)
+def test_iterate_stops_the_producer(test_name, timeout_seconds, consume):
+    stopped = threading.Event()
+
+    def produce(cancelled):
+        try:
+            while not cancelled.is_set():
+                yield "record"
+                time.sleep(0.01)
+        finally:
+            stopped.set()
+
+    async def consume_and_close():
+        iterator = executor.iterate(produce)
+        try:
+            await consume(iterator)
+        finally:
+            await iterator.aclose()
+
+    executor = ReadExecutor(timeout_seconds=timeout_seconds)
+    if timeout_seconds < 1:
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(consume_and_close())
+    else:
+        asyncio.run(consume_and_close())
+
+    assert stopped.wait(5)
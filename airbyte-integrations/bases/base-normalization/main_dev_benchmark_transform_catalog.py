@@ -0,0 +1,82 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict
+
+from normalization.destination_type import DestinationType
+from normalization.transform_catalog.catalog_processor import CatalogProcessor
+from normalization.transform_catalog.models_cache import MODELS_CACHE_FILE
+
+
+def synthetic_stream(name: str, width: int, depth: int) -> Dict[str, Any]:
+    """
+    @return a configured stream with width columns per level, nested depth levels deep in both an array and an object
+    """
+
+    def properties(level: int) -> Dict[str, Any]:
+        result = {f"{name}_field_{i}": {"type": ["null", "string"]} for i in range(width)}
+        if level < depth:
+            result["children"] = {"type": ["null", "array"], "items": {"type": "object", "properties": properties(level + 1)}}
+            result["details"] = {"type": ["null", "object"], "properties": properties(level + 1)}
+        return result
+
+    return {
+        "stream": {"name": name, "json_schema": {"type": "object", "properties": properties(0)}, "supported_sync_modes": ["incremental"]},
+        "sync_mode": "incremental",
+        "cursor_field": [f"{name}_field_0"],
+        "destination_sync_mode": "append_dedup",
+        "primary_key": [[f"{name}_field_1"]],
+    }
+
+
+def timed_process(catalog_file: str, output_directory: str, destination_type: DestinationType, **kwargs: Any) -> float:
+    processor = CatalogProcessor(output_directory=output_directory, destination_type=destination_type, **kwargs)
+    start = time.perf_counter()
+    processor.process(catalog_file=catalog_file, json_column_name="_airbyte_data", default_schema="benchmark")
+    return time.perf_counter() - start
+
+
+def main():
+    """
+    Times the generation of the models of a large synthetic catalog, serially, with a pool of processes and with the models cache.
+    Nothing is asserted, this only prints timings to compare the modes on a given machine:
+    ```
+    python3 main_dev_benchmark_transform_catalog.py --streams 200 --width 20 --depth 2 --max-workers 4
+    ```
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--streams", type=int, default=100, help="number of top level streams in the catalog")
+    parser.add_argument("--width", type=int, default=20, help="number of columns at each nesting level")
+    parser.add_argument("--depth", type=int, default=2, help="number of nesting levels under each top level stream")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1, help="number of processes of the parallel run")
+    parser.add_argument("--integration-type", type=str, default=DestinationType.POSTGRES.value, help="type of integration dialect to use")
+    args = parser.parse_args()
+    destination_type = DestinationType.from_string(args.integration_type)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        catalog_file = os.path.join(tmp_dir, "catalog.json")
+        with open(catalog_file, "w") as file:
+            json.dump({"streams": [synthetic_stream(f"stream_{i}", args.width, args.depth) for i in range(args.streams)]}, file)
+        serial = timed_process(catalog_file, os.path.join(tmp_dir, "serial"), destination_type)
+        parallel = timed_process(catalog_file, os.path.join(tmp_dir, "parallel"), destination_type, max_workers=args.max_workers)
+        models_cache_path = os.path.join(tmp_dir, MODELS_CACHE_FILE)
+        output_directory = os.path.join(tmp_dir, "cached")
+        cold = timed_process(catalog_file, output_directory, destination_type, models_cache_path=models_cache_path)
+        warm = timed_process(catalog_file, output_directory, destination_type, models_cache_path=models_cache_path)
+
+    # the processor logs every model it generates, so the timings are printed once everything ran
+    print(f"Catalog of {args.streams} streams, {args.width} columns per level, {args.depth} nesting levels")
+    print(f"serial: {serial:.2f}s")
+    print(f"{args.max_workers} processes: {parallel:.2f}s ({serial / parallel:.1f}x)")
+    print(f"models cache: first run {cold:.2f}s, unchanged catalog {warm:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,19 +3,25 @@
 #
 
 
+import copy
 import json
 import os
 import re
-from typing import Any, Dict, List, Set
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 import yaml
 from airbyte_cdk.models.airbyte_protocol import DestinationSyncMode, SyncMode
 from normalization.destination_type import DestinationType
 from normalization.transform_catalog import dbt_macro
 from normalization.transform_catalog.destination_name_transformer import DestinationNameTransformer
+from normalization.transform_catalog.models_cache import ModelsCache, stream_fingerprint
 from normalization.transform_catalog.stream_processor import StreamProcessor
 from normalization.transform_catalog.table_name_registry import TableNameRegistry
 
+# The sql_outputs and models_to_source of each stream processor, grouped by nesting level (top level stream first)
+StreamModels = List[List[Tuple[Dict[str, str], Dict[str, str]]]]
+
 
 class CatalogProcessor:
     """
@@ -26,22 +32,39 @@ class CatalogProcessor:
     targeted destination schema.
 
     This is relying on a StreamProcessor to handle the conversion of a stream to a table one at a time.
+    When max_workers is greater than 1, the models of each top level stream (and of its nested streams) are generated
+    in separate processes instead.
+
+    When a models cache is given, the models of the streams that didn't change since the previous run in the same output
+    directory are not generated again (see ModelsCache).
     """
 
-    def __init__(self, output_directory: str, destination_type: DestinationType):
+    def __init__(
+        self,
+        output_directory: str,
+        destination_type: DestinationType,
+        max_workers: int = 1,
+        models_cache_path: Optional[str] = None,
+    ):
         """
         @param output_directory is the path to the directory where this processor should write the resulting SQL files (DBT models)
         @param destination_type is the destination type of warehouse
+        @param max_workers is the number of processes generating models, models are generated in the current process if it is 1
+        @param models_cache_path is the path to the file recording the models generated in output_directory, so that only the
+        models of the streams that changed since the previous run are generated. It should be outside of the DBT models
+        directories. The models of all streams are generated when it is None.
         """
         self.output_directory: str = output_directory
         self.destination_type: DestinationType = destination_type
+        self.max_workers: int = max_workers
+        self.models_cache_path: Optional[str] = models_cache_path
         self.name_transformer: DestinationNameTransformer = DestinationNameTransformer(destination_type)
         self.models_to_source: Dict[str, str] = {}
 
     def process(self, catalog_file: str, json_column_name: str, default_schema: str):
         """
-        This method first parse and build models to handle top-level streams.
-        In a second loop will go over the substreams that were nested in a breadth-first traversal manner.
+        This method first parse and resolve the table names of all streams and substreams.
+        Then it builds the models of each top-level stream and of its substreams, in a breadth-first traversal manner.
 
         @param catalog_file input AirbyteCatalog file in JSON Schema describing the structure of the raw data
         @param json_column_name is the column name containing the JSON Blob with the raw data
@@ -51,7 +74,6 @@ class CatalogProcessor:
         schema_to_source_tables: Dict[str, Set[str]] = {}
         catalog = read_json(catalog_file)
         # print(json.dumps(catalog, separators=(",", ":")))
-        substreams = []
         stream_processors = self.build_stream_processor(
             catalog=catalog,
             json_column_name=json_column_name,
@@ -72,16 +94,84 @@ class CatalogProcessor:
             truncate = self.destination_type == DestinationType.MYSQL or self.destination_type == DestinationType.TIDB
             raw_table_name = self.name_transformer.normalize_table_name(f"_airbyte_raw_{stream_processor.stream_name}", truncate=truncate)
             add_table_to_sources(schema_to_source_tables, stream_processor.schema, raw_table_name)
+        self.write_yaml_sources_file(schema_to_source_tables)
 
-            nested_processors = stream_processor.process()
-            self.models_to_source.update(stream_processor.models_to_source)
+        models_cache = ModelsCache(self.models_cache_path, self.output_directory) if self.models_cache_path else None
+        names_by_stream = tables_registry.get_names_by_stream()
+        fingerprints = [
+            stream_fingerprint(
+                configured_stream,
+                names_by_stream.get(tables_registry.get_stream_key(stream_processor.schema, stream_processor.stream_name), {}),
+                destination_type=self.destination_type.value,
+                json_column_name=json_column_name,
+                default_schema=default_schema,
+            )
+            for configured_stream, stream_processor in zip(catalog["streams"], stream_processors)
+        ]
+        models_to_source_per_stream = [
+            models_cache.get(stream_processor.get_stream_source(), fingerprint) if models_cache else None
+            for stream_processor, fingerprint in zip(stream_processors, fingerprints)
+        ]
+        stale_streams = [index for index, models_to_source in enumerate(models_to_source_per_stream) if models_to_source is None]
+        if models_cache:
+            print(
+                f"Generating models of {len(stale_streams)} streams, {len(stream_processors) - len(stale_streams)} streams are up to date"
+            )
+        stream_models = self.generate_models([stream_processors[index] for index in stale_streams], tables_registry)
+        for index, models in zip(stale_streams, stream_models):
+            files, models_to_source_per_stream[index] = self.write_stream_models(models)
+            if models_cache:
+                models_cache.put(
+                    stream_processors[index].get_stream_source(), fingerprints[index], files, models_to_source_per_stream[index]
+                )
+        if models_cache:
+            models_cache.save()
+
+        # merge in the same order as a breadth-first traversal of all streams, so that the output doesn't depend on the cache
+        depth = max((len(models_to_source) for models_to_source in models_to_source_per_stream), default=0)
+        for level in range(depth):
+            for models_to_source in models_to_source_per_stream:
+                if level < len(models_to_source):
+                    self.models_to_source.update(models_to_source[level])
+
+    def generate_models(self, stream_processors: List[StreamProcessor], tables_registry: TableNameRegistry) -> Iterator[StreamModels]:
+        """
+        Generate the models of each top level stream and of its nested streams, in a pool of processes when max_workers is
+        greater than 1.
 
-            if nested_processors and len(nested_processors) > 0:
-                substreams += nested_processors
-            for file in stream_processor.sql_outputs:
-                output_sql_file(os.path.join(self.output_directory, file), stream_processor.sql_outputs[file])
-        self.write_yaml_sources_file(schema_to_source_tables)
-        self.process_substreams(substreams, tables_registry)
+        Table names are already resolved in tables_registry at this point, so streams don't depend on each other anymore.
+        The registry is sent once to each process rather than with every stream, and the models are returned in the order of
+        stream_processors so that the output doesn't depend on max_workers.
+        """
+        if self.max_workers <= 1 or not stream_processors:
+            yield from map(generate_stream_models, stream_processors)
+            return
+        detached_processors = []
+        for stream_processor in stream_processors:
+            detached_processor = copy.copy(stream_processor)
+            detached_processor.tables_registry = None
+            detached_processors.append(detached_processor)
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers, initializer=set_worker_tables_registry, initargs=(tables_registry,)
+        ) as executor:
+            yield from executor.map(generate_detached_stream_models, detached_processors)
+
+    def write_stream_models(self, stream_models: StreamModels) -> Tuple[List[str], List[Dict[str, str]]]:
+        """
+        Write the SQL files of the models of a top level stream and of its nested streams
+        @return the files written, relative to the output directory, and the models_to_source grouped by nesting level
+        """
+        files = []
+        models_to_source = []
+        for level in stream_models:
+            level_models_to_source = {}
+            for sql_outputs, processor_models_to_source in level:
+                level_models_to_source.update(processor_models_to_source)
+                for file in sql_outputs:
+                    output_sql_file(os.path.join(self.output_directory, file), sql_outputs[file])
+                    files.append(file)
+            models_to_source.append(level_models_to_source)
+        return files, models_to_source
 
     @staticmethod
     def build_stream_processor(
@@ -157,22 +247,6 @@ class CatalogProcessor:
             result.append(stream_processor)
         return result
 
-    def process_substreams(self, substreams: List[StreamProcessor], tables_registry: TableNameRegistry):
-        """
-        Handle nested stream/substream/children
-        """
-        while substreams:
-            children = substreams
-            substreams = []
-            for substream in children:
-                substream.tables_registry = tables_registry
-                nested_processors = substream.process()
-                self.models_to_source.update(substream.models_to_source)
-                if nested_processors:
-                    substreams += nested_processors
-                for file in substream.sql_outputs:
-                    output_sql_file(os.path.join(self.output_directory, file), substream.sql_outputs[file])
-
     def write_yaml_sources_file(self, schema_to_source_tables: Dict[str, Set[str]]):
         """
         Generate the sources.yaml file as described in https://docs.getdbt.com/docs/building-a-dbt-project/using-sources/
@@ -209,6 +283,39 @@ class CatalogProcessor:
 
 # Static Functions
 
+# The resolved table names used by the stream processors of a worker process, see CatalogProcessor.generate_models
+worker_tables_registry: Optional[TableNameRegistry] = None
+
+
+def set_worker_tables_registry(tables_registry: TableNameRegistry):
+    global worker_tables_registry
+    worker_tables_registry = tables_registry
+
+
+def generate_detached_stream_models(stream_processor: StreamProcessor) -> StreamModels:
+    """
+    Generate the models of a top level stream and of its nested streams, in a worker process
+    @param stream_processor is the processor of the top level stream, without tables registry
+    """
+    stream_processor.tables_registry = worker_tables_registry
+    return generate_stream_models(stream_processor)
+
+
+def generate_stream_models(stream_processor: StreamProcessor) -> StreamModels:
+    """
+    Generate the models of a top level stream and of its nested streams, in a breadth-first traversal manner
+    """
+    result = []
+    processors = [stream_processor]
+    while processors:
+        models, children = [], []
+        for processor in processors:
+            children += processor.process() or []
+            models.append((processor.sql_outputs, processor.models_to_source))
+        result.append(models)
+        processors = children
+    return result
+
 
 def read_json(input_path: str) -> Any:
     """
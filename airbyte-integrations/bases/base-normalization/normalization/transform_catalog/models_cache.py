@@ -0,0 +1,101 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+
+import glob
+import hashlib
+import json
+import os
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+# name of the file recording the models generated by transform_catalog, kept in the dbt project directory next to dbt_project.yml
+MODELS_CACHE_FILE = "models_cache.json"
+
+
+class ModelsCache:
+    """
+    Records the models generated in an output directory for each top level stream (and its nested streams), along with
+    a fingerprint of everything they were generated from.
+
+    The models of the streams whose fingerprint didn't change since the previous run don't need to be generated nor written
+    again, which keeps dbt partial parsing effective as dbt only re-parses the files that changed.
+
+    The cache file is kept outside of the output directory so that it doesn't end up with the generated models, and holds
+    one entry per output directory so that several output directories can share it.
+    """
+
+    def __init__(self, path: str, output_directory: str):
+        """
+        @param path is the path to the cache file
+        @param output_directory is the path to the directory where the models are written
+        """
+        self.path: str = path
+        self.output_directory: str = output_directory
+        self.contents: Dict[str, Dict[str, Dict[str, Any]]] = self.load()
+        output_key = os.path.relpath(os.path.abspath(output_directory), os.path.dirname(os.path.abspath(path)))
+        self.streams: Dict[str, Dict[str, Any]] = self.contents.setdefault(output_key, {})
+
+    def load(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        try:
+            with open(self.path, "r") as file:
+                contents = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(contents, dict) or not all(isinstance(streams, dict) for streams in contents.values()):
+            print(f"WARN: Ignoring invalid models cache {self.path}")
+            return {}
+        return contents
+
+    def get(self, stream_key: str, fingerprint: str) -> Optional[List[Dict[str, str]]]:
+        """
+        @param stream_key identifies the stream in the output directory
+        @param fingerprint of the stream definition, see stream_fingerprint
+        @return the models_to_source of the stream grouped by nesting level, if its models are up to date
+        """
+        entry = self.streams.get(stream_key)
+        if not entry or entry.get("fingerprint") != fingerprint:
+            return None
+        if not all(os.path.exists(os.path.join(self.output_directory, file)) for file in entry["files"]):
+            return None
+        return entry["models_to_source"]
+
+    def put(self, stream_key: str, fingerprint: str, files: List[str], models_to_source: List[Dict[str, str]]):
+        """
+        @param stream_key identifies the stream in the output directory
+        @param fingerprint of the stream definition, see stream_fingerprint
+        @param files are the paths of the models written for the stream, relative to the output directory
+        @param models_to_source of the stream grouped by nesting level
+        """
+        self.streams[stream_key] = {"fingerprint": fingerprint, "files": files, "models_to_source": models_to_source}
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        with open(self.path, "w") as file:
+            json.dump(self.contents, file, indent=2)
+
+
+def stream_fingerprint(configured_stream: Dict, table_names: Dict, **options: Any) -> str:
+    """
+    @param configured_stream is the stream as described in the catalog (json schema, sync modes, cursor, primary key...)
+    @param table_names are the table and file names resolved for the stream and its nested streams
+    @param options are the other inputs of the models generation (destination type, default schema...)
+    @return a hash of everything the models of a stream are generated from, including the code generating them
+    """
+    inputs = {"stream": configured_stream, "table_names": table_names, "options": options, "generator": generator_fingerprint()}
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def generator_fingerprint() -> str:
+    """
+    Hash of the code generating the models, so that models are regenerated when normalization is upgraded
+    """
+    h = hashlib.sha256()
+    for path in sorted(glob.glob(os.path.join(os.path.dirname(__file__), "*.py"))):
+        with open(path, "rb") as file:
+            h.update(file.read())
+    return h.hexdigest()
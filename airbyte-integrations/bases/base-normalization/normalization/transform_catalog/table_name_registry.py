@@ -315,6 +315,32 @@ class TableNameRegistry:
 
         return self.name_transformer.normalize_table_name(f"{file_name}{norm_suffix}", False, truncate, conflict, conflict_solver)
 
+    def get_stream_key(self, schema: str, stream_name: str) -> str:
+        """
+        Build the key string used to index the names of a top level stream in get_names_by_stream
+        """
+        return self.get_registry_key(self.name_transformer.normalize_schema_name(schema, False, False), [stream_name], stream_name)
+
+    def get_names_by_stream(self) -> Dict[str, Dict]:
+        """
+        Converts to a pure dict the names resolved for each top level stream and its nested streams, indexed by get_stream_key.
+        The names of a stream can change without the stream itself changing, when a conflicting stream is added to the catalog.
+        """
+        result = {}
+        for key in self.simple_file_registry:
+            for value in self.simple_file_registry[key]:
+                # value.schema is already normalized
+                stream_key = self.get_registry_key(value.schema, value.json_path[:1], value.json_path[0])
+                for schema in [value.intermediate_schema, value.schema]:
+                    registry_key = self.get_registry_key(schema, value.json_path, value.stream_name)
+                    resolved = self.registry[registry_key]
+                    result.setdefault(stream_key, {})[registry_key] = {
+                        "schema": resolved.schema,
+                        "table": resolved.table_name,
+                        "file": resolved.file_name,
+                    }
+        return result
+
     def to_dict(self, apply_function=(lambda x: x)) -> Dict:
         """
         Converts to a pure dict to serialize as json
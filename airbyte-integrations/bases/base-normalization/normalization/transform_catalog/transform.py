@@ -5,11 +5,12 @@
 
 import argparse
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import yaml
 from normalization.destination_type import DestinationType
 from normalization.transform_catalog.catalog_processor import CatalogProcessor
+from normalization.transform_catalog.models_cache import MODELS_CACHE_FILE
 
 
 class TransformCatalog:
@@ -42,6 +43,8 @@ python3 main_dev_transform_catalog.py \
         parser.add_argument("--catalog", nargs="+", type=str, required=True, help="path to Catalog (JSON Schema) file")
         parser.add_argument("--out", type=str, required=True, help="path to output generated DBT Models to")
         parser.add_argument("--json-column", type=str, required=False, help="name of the column containing the json blob")
+        parser.add_argument("--max-workers", type=int, default=1, help="number of processes generating models, 1 to generate them serially")
+        parser.add_argument("--no-models-cache", action="store_true", help="generate the models of all streams, even if they didn't change")
         parsed_args = parser.parse_args(args)
         profiles_yml = read_profiles_yml(parsed_args.profile_config_dir)
         self.config = {
@@ -51,6 +54,8 @@ python3 main_dev_transform_catalog.py \
             "output_path": parsed_args.out,
             "json_column": parsed_args.json_column,
             "profile_config_dir": parsed_args.profile_config_dir,
+            "max_workers": parsed_args.max_workers,
+            "use_models_cache": not parsed_args.no_models_cache,
         }
 
     def process_catalog(self) -> None:
@@ -58,12 +63,22 @@ python3 main_dev_transform_catalog.py \
         schema = self.config["schema"]
         output = self.config["output_path"]
         json_col = self.config["json_column"]
-        processor = CatalogProcessor(output_directory=output, destination_type=destination_type)
+        processor = CatalogProcessor(
+            output_directory=output,
+            destination_type=destination_type,
+            max_workers=self.config.get("max_workers", 1),
+            models_cache_path=self.models_cache_path(),
+        )
         for catalog_file in self.config["catalog"]:
             print(f"Processing {catalog_file}...")
             processor.process(catalog_file=catalog_file, json_column_name=json_col, default_schema=schema)
         self.update_dbt_project_vars(json_column=self.config["json_column"], models_to_source=processor.models_to_source)
 
+    def models_cache_path(self) -> Optional[str]:
+        if not self.config.get("use_models_cache", True):
+            return None
+        return os.path.join(self.config["profile_config_dir"], MODELS_CACHE_FILE)
+
     def update_dbt_project_vars(self, **vars_config: Dict[str, Any]):
         filename = os.path.join(self.config["profile_config_dir"], self.DBT_PROJECT)
         config = read_yaml_config(filename)
@@ -0,0 +1,154 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+
+import json
+import os
+from typing import Any, Dict, Tuple
+from unittest.mock import patch
+
+import pytest
+from normalization.destination_type import DestinationType
+from normalization.transform_catalog.catalog_processor import CatalogProcessor, output_sql_file
+from normalization.transform_catalog.models_cache import MODELS_CACHE_FILE
+
+
+@pytest.fixture(scope="function", autouse=True)
+def before_tests(request):
+    # This makes the test run whether it is executed from the tests folder (with pytest/gradle)
+    # or from the base-normalization folder (through pycharm)
+    unit_tests_dir = os.path.join(request.fspath.dirname, "unit_tests")
+    if os.path.exists(unit_tests_dir):
+        os.chdir(unit_tests_dir)
+    else:
+        os.chdir(request.fspath.dirname)
+    yield
+    os.chdir(request.config.invocation_dir)
+
+
+def run_catalog_processor(
+    catalog_file: str, output_directory: str, destination_type: DestinationType, max_workers: int
+) -> Tuple[Dict, Dict]:
+    processor = CatalogProcessor(
+        output_directory=output_directory,
+        destination_type=destination_type,
+        max_workers=max_workers,
+        models_cache_path=os.path.join(os.path.dirname(output_directory), MODELS_CACHE_FILE),
+    )
+    processor.process(catalog_file=catalog_file, json_column_name="_airbyte_data", default_schema="schema_test")
+    outputs = {}
+    for root, _, files in os.walk(output_directory):
+        for file in files:
+            with open(os.path.join(root, file), "r") as f:
+                outputs[os.path.relpath(os.path.join(root, file), output_directory)] = f.read()
+    return outputs, processor.models_to_source
+
+
+def synthetic_stream(name: str, width: int, depth: int) -> Dict[str, Any]:
+    def properties(level: int) -> Dict[str, Any]:
+        result = {f"{name}_field_{i}": {"type": ["null", "string"]} for i in range(width)}
+        if level < depth:
+            result["children"] = {"type": ["null", "array"], "items": {"type": "object", "properties": properties(level + 1)}}
+            result["details"] = {"type": ["null", "object"], "properties": properties(level + 1)}
+        return result
+
+    return {
+        "stream": {"name": name, "json_schema": {"type": "object", "properties": properties(0)}, "supported_sync_modes": ["incremental"]},
+        "sync_mode": "incremental",
+        "cursor_field": [f"{name}_field_0"],
+        "destination_sync_mode": "append_dedup",
+        "primary_key": [[f"{name}_field_1"]],
+    }
+
+
+@pytest.mark.parametrize(
+    "catalog_file",
+    [
+        "nested_catalog",
+        "long_name_truncate_collisions_catalog",
+        "un-nesting_collisions_catalog",
+    ],
+)
+@pytest.mark.parametrize("destination_type", [DestinationType.POSTGRES, DestinationType.BIGQUERY, DestinationType.SNOWFLAKE])
+def test_parallel_process_matches_serial(catalog_file: str, destination_type: DestinationType, tmp_path):
+    catalog_path = os.path.abspath(f"resources/{catalog_file}.json")
+
+    serial_outputs, serial_models_to_source = run_catalog_processor(catalog_path, str(tmp_path / "serial"), destination_type, 1)
+    parallel_outputs, parallel_models_to_source = run_catalog_processor(catalog_path, str(tmp_path / "parallel"), destination_type, 3)
+
+    assert parallel_outputs == serial_outputs
+    assert list(parallel_models_to_source.items()) == list(serial_models_to_source.items())
+
+
+def test_parallel_process_of_large_catalog(tmp_path):
+    """
+    The models of a large catalog generated with a pool of processes must be the same as the models generated serially
+    """
+    catalog_path = str(tmp_path / "catalog.json")
+    with open(catalog_path, "w") as f:
+        json.dump({"streams": [synthetic_stream(f"stream_{i}", width=10, depth=2) for i in range(16)]}, f)
+
+    serial_results = run_catalog_processor(catalog_path, str(tmp_path / "serial"), DestinationType.POSTGRES, 1)
+    parallel_results = run_catalog_processor(catalog_path, str(tmp_path / "parallel"), DestinationType.POSTGRES, 4)
+
+    assert parallel_results == serial_results
+
+
+def test_models_cache_only_regenerates_changed_streams(tmp_path):
+    streams = [synthetic_stream(f"stream_{i}", width=3, depth=1) for i in range(3)]
+    catalog_path = str(tmp_path / "catalog.json")
+    with open(catalog_path, "w") as f:
+        json.dump({"streams": streams}, f)
+    run_catalog_processor(catalog_path, str(tmp_path / "output"), DestinationType.POSTGRES, 1)
+
+    streams[1]["stream"]["json_schema"]["properties"]["new_field"] = {"type": ["null", "string"]}
+    with open(catalog_path, "w") as f:
+        json.dump({"streams": streams}, f)
+    with patch("normalization.transform_catalog.catalog_processor.output_sql_file", wraps=output_sql_file) as written:
+        outputs, models_to_source = run_catalog_processor(catalog_path, str(tmp_path / "output"), DestinationType.POSTGRES, 1)
+    expected_outputs, expected_models_to_source = run_catalog_processor(
+        catalog_path, str(tmp_path / "expected"), DestinationType.POSTGRES, 1
+    )
+
+    written_files = [call.args[0] for call in written.call_args_list]
+    assert written_files
+    assert all("stream_1" in os.path.basename(file) for file in written_files)
+    assert outputs == expected_outputs
+    assert list(models_to_source.items()) == list(expected_models_to_source.items())
+
+
+def test_models_cache_regenerates_missing_files(tmp_path):
+    catalog_path = str(tmp_path / "catalog.json")
+    with open(catalog_path, "w") as f:
+        json.dump({"streams": [synthetic_stream("stream", width=3, depth=1)]}, f)
+    outputs, _ = run_catalog_processor(catalog_path, str(tmp_path / "output"), DestinationType.POSTGRES, 1)
+    deleted_file = next(file for file in outputs if file.endswith(".sql"))
+    os.remove(str(tmp_path / "output" / deleted_file))
+
+    outputs_after_deletion, _ = run_catalog_processor(catalog_path, str(tmp_path / "output"), DestinationType.POSTGRES, 1)
+
+    assert outputs_after_deletion == outputs
+
+
+@pytest.mark.parametrize("use_models_cache, expected_rewritten", [(True, False), (False, True)])
+def test_models_cache_skips_unchanged_catalog(use_models_cache: bool, expected_rewritten: bool, tmp_path):
+    catalog_path = str(tmp_path / "catalog.json")
+    with open(catalog_path, "w") as f:
+        json.dump({"streams": [synthetic_stream("stream", width=3, depth=1)]}, f)
+    models_cache_path = str(tmp_path / MODELS_CACHE_FILE)
+    output_directory = str(tmp_path / "models" / "generated")
+    CatalogProcessor(output_directory, DestinationType.POSTGRES, models_cache_path=models_cache_path).process(
+        catalog_path, "_airbyte_data", "schema_test"
+    )
+
+    processor = CatalogProcessor(
+        output_directory, DestinationType.POSTGRES, models_cache_path=models_cache_path if use_models_cache else None
+    )
+    with patch("normalization.transform_catalog.catalog_processor.output_sql_file") as written:
+        processor.process(catalog_path, "_airbyte_data", "schema_test")
+
+    assert written.called == expected_rewritten
+    assert processor.models_to_source
+    assert os.path.exists(models_cache_path)
+    assert not os.path.exists(os.path.join(output_directory, MODELS_CACHE_FILE))
@@ -153,7 +153,9 @@ class AbstractTestIncrementalFileStream(ABC):
                     assert any([additional_property in r[FileStream.ab_additional_col].keys() for r in records])
 
             # returning state by simulating call to get_updated_state() with final record so we can test incremental
-            return fs.get_updated_state(current_stream_state=current_state, latest_record=records[-1])
+            fs.state = current_state
+            fs.get_updated_state(current_stream_state=current_state, latest_record=records[-1])
+            return fs.state
 
         else:
             with pytest.raises(Exception) as e_info:
@@ -57,7 +57,7 @@ class S3File(StorageFile):
             params = {"client": make_s3_client(self._provider, session=self._boto_session)}
         else:
             config = ClientConfig(signature_version=UNSIGNED)
-            params = {"client": make_s3_client(self._provider, config=config)}
+            params = {"client": make_s3_client(self._provider, config=config, session=self._boto_session)}
         self.logger.debug(f"try to open {self.file_info}")
         result = smart_open.open(f"s3://{bucket}/{self.url}", transport_params=params, mode=mode)
 
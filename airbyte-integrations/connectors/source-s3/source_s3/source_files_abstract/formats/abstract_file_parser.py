@@ -3,13 +3,17 @@
 #
 
 from abc import ABC, abstractmethod
-from typing import Any, BinaryIO, Iterator, Mapping, TextIO, Union
+from typing import Any, BinaryIO, Dict, Iterator, List, Mapping, TextIO, Union
 
 import pyarrow as pa
 from airbyte_cdk.logger import AirbyteLogger
 from source_s3.source_files_abstract.file_info import FileInfo
 
 
+# data rows of a file as a mapping of {column: [values]}, holding the values of every row of the batch for each column
+RecordBatch = Mapping[str, List[Any]]
+
+
 class AbstractFileParser(ABC):
     logger = AirbyteLogger()
 
@@ -66,6 +70,31 @@ class AbstractFileParser(ABC):
         :yield: data record as a mapping of {columns:values}
         """
 
+    def stream_record_batches(self, file: Union[TextIO, BinaryIO], file_info: FileInfo) -> Iterator[RecordBatch]:
+        """
+        Override this for formats read in batches of rows, e.g. as Arrow record batches, to stream each batch as a whole
+        rather than one record at a time. This lets the stream process records column by column.
+        By default, each record of stream_records() is streamed as a batch of a single row.
+        Note: every row of a batch has the same columns
+
+        :param file: file-like object (opened via StorageFile)
+        :param file_info: file metadata
+        :yield: batch of data rows as a mapping of {column:[values]}
+        """
+        for record in self.stream_records(file, file_info):
+            yield {column: [value] for column, value in record.items()}
+
+    @staticmethod
+    def batch_to_records(batch: RecordBatch) -> Iterator[Dict[str, Any]]:
+        """
+        :param batch: batch of data rows as a mapping of {column:[values]}
+        :yield: data record as a mapping of {columns:values}
+        """
+        columns = list(batch.keys())
+        # zip the columns to get row-by-row values, e.g. [ [1, "a", True], [2, "b", True], [3, "c", False] ]
+        for record_values in zip(*batch.values()):
+            yield dict(zip(columns, record_values))
+
     @classmethod
     def json_type_to_pyarrow_type(cls, typ: str, reverse: bool = False, logger: AirbyteLogger = AirbyteLogger()) -> str:
         """
@@ -15,7 +15,7 @@ from source_s3.exceptions import S3Exception
 from source_s3.source_files_abstract.file_info import FileInfo
 from source_s3.utils import get_value_or_json_if_empty_string, run_in_external_process
 
-from .abstract_file_parser import AbstractFileParser
+from .abstract_file_parser import AbstractFileParser, RecordBatch
 from .csv_spec import CsvFormat
 
 MAX_CHUNK_SIZE = 50.0 * 1024**2  # in bytes
@@ -165,9 +165,17 @@ class CsvParser(AbstractFileParser):
     @wrap_exception((ValueError,))
     def stream_records(self, file: Union[TextIO, BinaryIO], file_info: FileInfo) -> Iterator[Mapping[str, Any]]:
         """
-        https://arrow.apache.org/docs/python/generated/pyarrow.csv.open_csv.html
         PyArrow returns lists of values for each column so we zip() these up into records which we then yield
         """
+        for batch in self.stream_record_batches(file, file_info):
+            yield from self.batch_to_records(batch)
+
+    @wrap_exception((ValueError,))
+    def stream_record_batches(self, file: Union[TextIO, BinaryIO], file_info: FileInfo) -> Iterator[RecordBatch]:
+        """
+        https://arrow.apache.org/docs/python/generated/pyarrow.csv.open_csv.html
+        Each batch read by PyArrow is converted to lists of values for each column at once
+        """
         streaming_reader = pa_csv.open_csv(
             file,
             pa.csv.ReadOptions(**self._read_options()),
@@ -181,12 +189,6 @@ class CsvParser(AbstractFileParser):
             except StopIteration:
                 still_reading = False
             else:
-                batch_dict = batch.to_pydict()
-                batch_columns = [col_info.name for col_info in batch.schema]
-                # this gives us a list of lists where each nested list holds ordered values for a single column
-                # e.g. [ [1,2,3], ["a", "b", "c"], [True, True, False] ]
-                columnwise_record_values = [batch_dict[column] for column in batch_columns]
-                # we zip this to get row-by-row, e.g. [ [1, "a", True], [2, "b", True], [3, "c", False] ]
-                for record_values in zip(*columnwise_record_values):
-                    # create our record of {col: value, col: value} by dict comprehension, iterating through all cols in batch_columns
-                    yield {batch_columns[i]: record_values[i] for i in range(len(batch_columns))}
+                # this gives us lists where each list holds ordered values for a single column
+                # e.g. {"id": [1,2,3], "name": ["a", "b", "c"], "flag": [True, True, False]}
+                yield batch.to_pydict()
@@ -2,16 +2,20 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
-
-from typing import Any, BinaryIO, Iterator, Mapping, TextIO, Union
+import io
+from typing import Any, BinaryIO, Iterator, Mapping, Optional, TextIO, Union
 
 import pyarrow as pa
 from pyarrow import json as pa_json
 from source_s3.source_files_abstract.file_info import FileInfo
 
-from .abstract_file_parser import AbstractFileParser
+from .abstract_file_parser import AbstractFileParser, RecordBatch
 from .jsonl_spec import JsonlFormat
 
+# minimum size in bytes of the chunks of lines parsed at a time, as parsing very small chunks has a significant overhead
+MIN_CHUNK_SIZE = 1024**2
+NUMERIC_PYARROW_TYPES = ("int", "uint", "float", "double", "halffloat", "decimal")
+
 
 class JsonlParser(AbstractFileParser):
     TYPE_MAP = {
@@ -74,11 +78,44 @@ class JsonlParser(AbstractFileParser):
             file, pa.json.ReadOptions(**self._read_options()), pa.json.ParseOptions(**self._parse_options(json_schema))
         )
 
+    def _stream_tables(self, file: Union[TextIO, BinaryIO], json_schema: Mapping[str, Any] = None) -> Iterator[pa.Table]:
+        """
+        Reads the file a chunk of lines at a time so that memory usage depends on the chunk size rather than on the file size.
+        The chunk size is the block_size, or MIN_CHUNK_SIZE if greater.
+        JSON values spanning several lines can't be split by lines, so the whole file is read at once if newlines_in_values is set.
+        :param json_schema: if this is passed in, pyarrow will attempt to enforce this schema on read, defaults to None
+        """
+        if self.format.newlines_in_values:
+            yield self._read_table(file, json_schema)
+            return
+        chunk_size = max(self.format.block_size, MIN_CHUNK_SIZE)
+        while True:
+            lines = file.readlines(chunk_size)
+            if not lines:
+                break
+            chunk = b"".join(lines)
+            if chunk.strip():
+                yield self._read_table(io.BytesIO(chunk), json_schema)
+
+    @staticmethod
+    def _broadest_type(type_1: Optional[str], type_2: str) -> str:
+        """
+        Chooses the PyArrow type holding the values of a column of both types, as inferred from different chunks of a file
+        """
+        if type_1 is None or type_1 == "null" or type_1 == type_2:
+            return type_2
+        if type_2 == "null":
+            return type_1
+        if type_1.startswith(NUMERIC_PYARROW_TYPES) and type_2.startswith(NUMERIC_PYARROW_TYPES):
+            return "double"
+        return "large_string"
+
     def get_inferred_schema(self, file: Union[TextIO, BinaryIO], file_info: FileInfo) -> Mapping[str, Any]:
         """
         https://arrow.apache.org/docs/python/generated/pyarrow.json.read_json.html
         Json reader support multi thread hence, donot need to add external process
         https://arrow.apache.org/docs/python/generated/pyarrow.json.ReadOptions.html
+        The schemas inferred from each chunk of the file are merged, stopping after schema_inference_sample_size records if set.
         """
 
         def field_type_to_str(type_: Any) -> str:
@@ -90,14 +127,28 @@ class JsonlParser(AbstractFileParser):
                 return str(type_)
             raise Exception(f"Unknown PyArrow Type: {type_}")
 
-        table = self._read_table(file)
-        schema_dict = {field.name: field_type_to_str(field.type) for field in table.schema}
+        schema_dict = {}
+        num_records = 0
+        for table in self._stream_tables(file):
+            for field in table.schema:
+                schema_dict[field.name] = self._broadest_type(schema_dict.get(field.name), field_type_to_str(field.type))
+            num_records += table.num_rows
+            if self.format.schema_inference_sample_size and num_records >= self.format.schema_inference_sample_size:
+                break
         return self.json_schema_to_pyarrow_schema(schema_dict, reverse=True)
 
     def stream_records(self, file: Union[TextIO, BinaryIO], file_info: FileInfo) -> Iterator[Mapping[str, Any]]:
         """
         https://arrow.apache.org/docs/python/generated/pyarrow.json.read_json.html
+        PyArrow returns lists of values for each column so we zip() these up into records
+        """
+        for batch in self.stream_record_batches(file, file_info):
+            yield from self.batch_to_records(batch)
 
+    def stream_record_batches(self, file: Union[TextIO, BinaryIO], file_info: FileInfo) -> Iterator[RecordBatch]:
+        """
+        https://arrow.apache.org/docs/python/generated/pyarrow.json.read_json.html
+        Each chunk of the file is converted to lists of values for each column at once
         """
-        table = self._read_table(file, self._master_schema)
-        yield from table.to_pylist()
+        for table in self._stream_tables(file, self._master_schema):
+            yield table.to_pydict()
@@ -3,6 +3,7 @@
 #
 
 from enum import Enum
+from typing import Optional
 
 from pydantic import BaseModel, Field
 
@@ -44,3 +45,11 @@ class JsonlFormat(BaseModel):
         description="The chunk size in bytes to process at a time in memory from each file. If your data is particularly wide and failing during schema detection, increasing this should solve it. Beware of raising this too high as you could hit OOM errors.",
         order=2,
     )
+
+    schema_inference_sample_size: Optional[int] = Field(
+        title="Schema inference sample size",
+        default=None,
+        minimum=1,
+        description="The number of records to read from each file to detect its schema, files are read in chunks of lines so slightly more records may be read. Leave blank to read whole files.",
+        order=3,
+    )
@@ -10,7 +10,7 @@ from pyarrow.parquet import ParquetFile
 from source_s3.exceptions import S3Exception
 from source_s3.source_files_abstract.file_info import FileInfo
 
-from .abstract_file_parser import AbstractFileParser
+from .abstract_file_parser import AbstractFileParser, RecordBatch
 from .parquet_spec import ParquetFormat
 
 # All possible parquet data types
@@ -88,6 +88,16 @@ class ParquetParser(AbstractFileParser):
             return func(field_value) if func else field_value
         raise TypeError(f"unsupported field type: {logical_type}, value: {field_value}")
 
+    @classmethod
+    def convert_column_data(cls, logical_type: str, column_values: List[Any]) -> List[Any]:
+        """Converts not JSON format to JSON one, for all the values of a column"""
+        if logical_type not in PARQUET_TYPES:
+            return [cls.convert_field_data(logical_type, value) for value in column_values]
+        _, _, func = PARQUET_TYPES[logical_type]
+        if not func:
+            return column_values
+        return [None if value is None else func(value) for value in column_values]
+
     def get_inferred_schema(self, file: Union[TextIO, BinaryIO], file_info: FileInfo) -> dict:
         """
         https://arrow.apache.org/docs/python/parquet.html#finer-grained-reading-and-writing
@@ -104,9 +114,16 @@ class ParquetParser(AbstractFileParser):
         return schema_dict
 
     def stream_records(self, file: Union[TextIO, BinaryIO], file_info: FileInfo) -> Iterator[Mapping[str, Any]]:
+        """
+        PyArrow reads streaming batches from a Parquet file, which we zip() up into records
+        """
+        for batch in self.stream_record_batches(file, file_info):
+            yield from self.batch_to_records(batch)
+
+    def stream_record_batches(self, file: Union[TextIO, BinaryIO], file_info: FileInfo) -> Iterator[RecordBatch]:
         """
         https://arrow.apache.org/docs/python/generated/pyarrow.parquet.ParquetFile.html
-        PyArrow reads streaming batches from a Parquet file
+        PyArrow reads streaming batches from a Parquet file, each batch is converted to lists of values for each column at once
         """
 
         reader = self._init_reader(file)
@@ -130,16 +147,12 @@ class ParquetParser(AbstractFileParser):
             for batch in reader.iter_batches(**args):
                 # this gives us a dist of lists where each nested list holds ordered values for a single column
                 # {'number': [1.0, 2.0, 3.0], 'name': ['foo', None, 'bar'], 'flag': [True, False, True], 'delta': [-1.0, 2.5, 0.1]}
-                batch_dict = batch.to_pydict()
                 # sometimes the batch file has more columns than master_schema declares, like:
                 # master schema: ['number', 'name', 'flag', 'delta'],
                 # batch_file_schema: ['number', 'name', 'flag', 'delta', 'EXTRA_COL_NAME'].
                 # we need to check wether batch_file_schema == master_schema and reject extra columns, otherwise "KeyError" raises.
-                batch_columns = [column for column in batch_dict.keys() if column in self._master_schema]
-                columnwise_record_values = [batch_dict[column] for column in batch_columns if column in self._master_schema]
-                # we zip this to get row-by-row
-                for record_values in zip(*columnwise_record_values):
-                    yield {
-                        batch_columns[i]: self.convert_field_data(logical_types[batch_columns[i]], record_values[i])
-                        for i in range(len(batch_columns))
-                    }
+                yield {
+                    column: self.convert_column_data(logical_types[column], values.to_pylist())
+                    for column, values in zip(batch.schema.names, batch.columns)
+                    if column in self._master_schema
+                }
@@ -5,7 +5,7 @@
 
 import json
 import re
-from typing import Any, Dict, Union
+from typing import Any, Dict, Optional, Union
 
 from jsonschema import RefResolver
 from pydantic import BaseModel, Field
@@ -77,6 +77,25 @@ class SourceFilesAbstractSpec(BaseModel):
         order=30,
     )
 
+    max_concurrent_files: int = Field(
+        title="Concurrent file reads",
+        default=1,
+        minimum=1,
+        description="The number of files to read in parallel, when inferring the schema and when syncing records. Raising this speeds up "
+        "syncs of many small files, as records are still emitted in the order of the files' last modified date but each file read ahead "
+        "is held in memory until then.",
+        order=40,
+    )
+
+    max_files_for_schema_inference: Optional[int] = Field(
+        title="Files used for schema inference",
+        default=None,
+        minimum=1,
+        description="The number of most recently modified files to infer the schema from. Leave blank to infer it from all the files. "
+        "Columns only found in other files are synced in the _ab_additional_properties column.",
+        order=50,
+    )
+
     @staticmethod
     def change_format_to_oneOf(schema: dict) -> dict:
         props_to_change = ["format"]
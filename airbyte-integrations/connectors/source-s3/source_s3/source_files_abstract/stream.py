@@ -3,23 +3,26 @@
 #
 
 
+import hashlib
 import json
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from functools import lru_cache
 from traceback import format_exc
-from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Set, Tuple, Union
 
 from airbyte_cdk.logger import AirbyteLogger
 from airbyte_cdk.models import FailureType
 from airbyte_cdk.models.airbyte_protocol import SyncMode
-from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.streams import IncrementalMixin, Stream
 from wcmatch.glob import GLOBSTAR, SPLIT, globmatch
 
 from ..exceptions import S3Exception
 from .file_info import FileInfo
-from .formats.abstract_file_parser import AbstractFileParser
+from .formats.abstract_file_parser import AbstractFileParser, RecordBatch
 from .formats.avro_parser import AvroParser
 from .formats.csv_parser import CsvParser
 from .formats.jsonl_parser import JsonlParser
@@ -53,22 +56,40 @@ class FileStream(Stream, ABC):
     airbyte_columns = [ab_additional_col, ab_last_mod_col, ab_file_name_col]
     datetime_format_string = "%Y-%m-%dT%H:%M:%S%z"
 
-    def __init__(self, dataset: str, provider: dict, format: dict, path_pattern: str, schema: str = None):
+    def __init__(
+        self,
+        dataset: str,
+        provider: dict,
+        format: dict,
+        path_pattern: str,
+        schema: str = None,
+        max_concurrent_files: int = 1,
+        max_files_for_schema_inference: int = None,
+    ):
         """
         :param dataset: table name for this stream
         :param provider: provider specific mapping as described in spec.json
         :param format: file format specific mapping as described in spec.json
         :param path_pattern: glob-style pattern for file-matching (https://facelessuser.github.io/wcmatch/glob/)
         :param schema: JSON-syntax user provided schema, defaults to None
+        :param max_concurrent_files: number of files read in parallel ahead of the one being emitted, defaults to 1
+        :param max_files_for_schema_inference: number of most recently modified files to infer the schema from, defaults to None (all)
         """
         self.dataset = dataset
         self._path_pattern = path_pattern
         self._provider = provider
         self._format = format
+        self._max_concurrent_files = max_concurrent_files
+        self._max_files_for_schema_inference = max_files_for_schema_inference
         self._schema: Dict[str, Any] = {}
         if schema:
             self._schema = self._parse_user_input_schema(schema)
         self.master_schema: Dict[str, Any] = None
+        # schema hash and last modified date of the files inferred from, and schema hash of the files known from a previous run,
+        # by file fingerprint (see _file_fingerprint()). Each distinct schema is hashed and stored once, by hash
+        self._file_schemas: Dict[str, Tuple[str, datetime]] = {}
+        self._known_file_schemas: Dict[str, str] = {}
+        self._schemas_by_hash: Dict[str, Dict[str, Any]] = {}
         LOGGER.info(f"initialised stream with format: {format}")
 
     @staticmethod
@@ -221,18 +242,18 @@ class FileStream(Stream, ABC):
         if self.master_schema is None:
             master_schema = deepcopy(self._schema)
 
-            file_reader = self.fileformatparser_class(self._format)
+            # skip files earlier than min_datetime
+            file_infos = [
+                file_info
+                for file_info in self.get_time_ordered_file_infos()
+                if (min_datetime is None) or (file_info.last_modified >= min_datetime)
+            ]
+            if self._max_files_for_schema_inference:
+                file_infos = file_infos[-self._max_files_for_schema_inference :]
 
             processed_files = []
-            for file_info in self.get_time_ordered_file_infos():
-                # skip this file if it's earlier than min_datetime
-                if (min_datetime is not None) and (file_info.last_modified < min_datetime):
-                    continue
-
-                storagefile = self.storagefile_class(file_info, self._provider)
-                with storagefile.open(file_reader.is_binary) as f:
-                    this_schema = file_reader.get_inferred_schema(f, file_info)
-                    processed_files.append(file_info)
+            for file_info, this_schema in zip(file_infos, self._infer_file_schemas(file_infos)):
+                processed_files.append(file_info)
 
                 if this_schema == master_schema:
                     continue  # exact schema match so go to next file
@@ -279,8 +300,75 @@ class FileStream(Stream, ABC):
 
         return self.master_schema
 
+    def _file_fingerprint(self, file_info: FileInfo) -> str:
+        """
+        A file's schema only changes if the file or the format options it's read with change.
+        Objects are replaced rather than modified in place, so a new version of a file has a new last modified date.
+        """
+        file_identity = [self._format, file_info.key, file_info.last_modified.isoformat(), file_info.size]
+        return hashlib.sha256(json.dumps(file_identity, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:16]
+
+    def _infer_file_schemas(self, file_infos: List[FileInfo]) -> Iterator[Dict[str, Any]]:
+        """
+        Infers the schema of each file, in a pool of max_concurrent_files threads as this is mostly spent opening files.
+        The schemas of files whose fingerprint is known from a previous run are reused rather than inferred again.
+
+        :param file_infos: files to infer the schema of
+        :yield: schema of each file, in the order of file_infos
+        """
+        file_reader = self.fileformatparser_class(self._format)
+
+        def infer_file_schema(file_info: FileInfo) -> Dict[str, Any]:
+            with self.storagefile_class(file_info, self._provider).open(file_reader.is_binary) as f:
+                return file_reader.get_inferred_schema(f, file_info)
+
+        fingerprints = [self._file_fingerprint(file_info) for file_info in file_infos]
+        unknown_files = [
+            file_info for file_info, fingerprint in zip(file_infos, fingerprints) if fingerprint not in self._known_file_schemas
+        ]
+        LOGGER.info(f"inferring the schema of {len(unknown_files)} files, {len(file_infos) - len(unknown_files)} files are known")
+        executor = ThreadPoolExecutor(max_workers=self._max_concurrent_files, thread_name_prefix=f"{self.name}_schema")
+        try:
+            inferred_schemas = executor.map(infer_file_schema, unknown_files)
+            for file_info, fingerprint in zip(file_infos, fingerprints):
+                if fingerprint in self._known_file_schemas:
+                    schema_hash = self._known_file_schemas[fingerprint]
+                else:
+                    file_schema = next(inferred_schemas)
+                    schema_hash = hashlib.sha256(json.dumps(file_schema, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+                    self._schemas_by_hash.setdefault(schema_hash, file_schema)
+                self._file_schemas[fingerprint] = (schema_hash, file_info.last_modified)
+                yield self._schemas_by_hash[schema_hash]
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_file_schemas_state(self, min_date: Optional[date] = None) -> Dict[str, Any]:
+        """
+        :param min_date: if passed, only the files last modified on or after this date are kept
+        :return: the schema of each file inferred from, as {"schemas": {schema_hash: schema}, "files": {file_fingerprint: schema_hash}}
+        so that each distinct schema is only stored once
+        """
+        files = {
+            fingerprint: schema_hash
+            for fingerprint, (schema_hash, last_modified) in self._file_schemas.items()
+            if min_date is None or last_modified.date() >= min_date
+        }
+        return {"schemas": {schema_hash: self._schemas_by_hash[schema_hash] for schema_hash in set(files.values())}, "files": files}
+
     def stream_slices(
         self, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None
+    ) -> Iterable[Optional[Dict[str, Any]]]:
+        """
+        The stream_slices are built by _build_stream_slices() and, if max_concurrent_files > 1, their files are read ahead
+        by _read_ahead() while the records of the previous slices are emitted.
+        """
+        stream_slices = self._build_stream_slices(sync_mode=sync_mode, cursor_field=cursor_field, stream_state=stream_state)
+        if self._max_concurrent_files > 1:
+            stream_slices = self._read_ahead(stream_slices, stream_state if sync_mode == SyncMode.incremental else None)
+        yield from stream_slices
+
+    def _build_stream_slices(
+        self, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None
     ) -> Iterable[Optional[Dict[str, Any]]]:
         """
         This builds full-refresh stream_slices regardless of sync_mode param.
@@ -289,13 +377,47 @@ class FileStream(Stream, ABC):
         In incremental mode, a stream slice may have more than one file so we mirror that format here.
         Incremental stream_slices are implemented in the IncrementalFileStream child class.
         """
-
-        # TODO: this could be optimised via concurrent reads, however we'd lose chronology and need to deal with knock-ons of that
-        # we could do this concurrently both full and incremental by running batches in parallel
-        # and then incrementing the cursor per each complete batch
         for file_info in self.get_time_ordered_file_infos():
             yield {"files": [{"storage_file": self.storagefile_class(file_info, self._provider)}]}
 
+    def _read_ahead(
+        self, stream_slices: Iterable[Optional[Dict[str, Any]]], stream_state: Mapping[str, Any] = None
+    ) -> Iterator[Optional[Dict[str, Any]]]:
+        """
+        Reads the files of the upcoming stream_slices in a pool of max_concurrent_files threads, to hide the latency of opening each file.
+        The records of a file read ahead are held in memory until read_records() reaches its slice.
+        Slices are still yielded in order, so records are emitted and the cursor advanced in the same order as with sequential reads:
+        the state is only checkpointed once all files up to a slice's last_modified have been read and their records emitted.
+
+        :param stream_slices: stream_slices to read the files of, in order
+        :param stream_state: state used to pick the files inferring the master schema, see _get_file_reader()
+        :yield: stream_slices, each file having a "records" future with the list of its records
+        """
+        file_reader: AbstractFileParser = None
+        pending_slices = deque()
+        num_pending_files = 0
+        executor = ThreadPoolExecutor(max_workers=self._max_concurrent_files, thread_name_prefix=f"{self.name}_reader")
+        try:
+            for stream_slice in stream_slices:
+                if stream_slice:
+                    # get the reader only now as building the first slice may update the schema, see IncrementalFileStream
+                    file_reader = file_reader or self._get_file_reader(stream_state)
+                    for file_item in stream_slice["files"]:
+                        file_item["records"] = executor.submit(
+                            lambda file: list(self._read_file(file_reader, file)), file_item["storage_file"]
+                        )
+                    num_pending_files += len(stream_slice["files"])
+                pending_slices.append(stream_slice)
+                # keep max_concurrent_files files read ahead of the slice being emitted
+                while pending_slices and num_pending_files >= self._max_concurrent_files:
+                    stream_slice = pending_slices.popleft()
+                    num_pending_files -= len(stream_slice["files"]) if stream_slice else 0
+                    yield stream_slice
+            yield from pending_slices
+        finally:
+            # don't start reading the files of slices which won't be emitted, e.g. if the sync failed
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def _match_target_schema(self, record: Dict[str, Any], target_columns: List) -> Dict[str, Any]:
         """
         This method handles missing or additional fields in each record, according to the provided target_columns.
@@ -323,6 +445,35 @@ class FileStream(Stream, ABC):
 
         return record
 
+    def _match_target_schema_batch(self, batch: RecordBatch, target_columns: List, extra_map: Mapping[str, Any]) -> RecordBatch:
+        """
+        Same as _match_target_schema() followed by _add_extra_fields_from_map(), for a whole batch of rows at once.
+        Every row of a batch has the same columns, so missing and additional columns are only looked for once per batch.
+
+        :param batch: batch of data rows as a mapping of {column:[values]}
+        :param target_columns: list of column names to mutate this batch into (obtained via self._get_schema_map().keys() as of now)
+        :param extra_map: map of additional columns and values to add to every row
+        :return: batch with columns lining up to target_columns
+        """
+        num_rows = len(next(iter(batch.values()), []))
+        compare_columns = [c for c in target_columns if c not in [self.ab_last_mod_col, self.ab_file_name_col]]
+        compare_columns_set = set(compare_columns)
+        matched_batch = {c: values for c, values in batch.items() if c in compare_columns_set}
+        # missing columns
+        for c in compare_columns:
+            if c != self.ab_additional_col and c not in matched_batch:
+                matched_batch[c] = [None] * num_rows
+        # additional columns
+        additional_columns = [c for c in batch.keys() if c not in compare_columns_set]
+        if additional_columns:
+            additional_values = zip(*[batch[c] for c in additional_columns])
+            matched_batch[self.ab_additional_col] = [dict(zip(additional_columns, values)) for values in additional_values]
+        else:
+            matched_batch[self.ab_additional_col] = [{} for _ in range(num_rows)]
+        for key, value in extra_map.items():
+            matched_batch[key] = [value] * num_rows
+        return matched_batch
+
     def _add_extra_fields_from_map(self, record: Dict[str, Any], extra_map: Mapping[str, Any]) -> Mapping[str, Any]:
         """
         Simple method to take a mapping of columns:values and add them to the provided record
@@ -342,26 +493,31 @@ class FileStream(Stream, ABC):
         stream_state: Mapping[str, Any] = None,
     ) -> Iterable[Mapping[str, Any]]:
         """
-        Uses provider-relevant StorageFile to open file and then iterates through stream_records() using format-relevant AbstractFileParser.
-        Records are mutated on the fly using _match_target_schema() and _add_extra_fields_from_map() to achieve desired final schema.
+        Uses provider-relevant StorageFile to open file and then iterates through stream_record_batches() using format-relevant
+        AbstractFileParser. Records are mutated a batch at a time using _match_target_schema_batch() to achieve desired final schema.
         Since this is called per stream_slice, this method works for both full_refresh and incremental.
+        Files read ahead (see _read_ahead()) already hold their records, which are emitted once the file has been completely read.
         """
         for file_item in stream_slice["files"]:
-            storage_file: StorageFile = file_item["storage_file"]
-            with storage_file.open(file_reader.is_binary) as f:
-                # TODO: make this more efficient than mutating every record one-by-one as they stream
-                for record in file_reader.stream_records(f, storage_file.file_info):
-                    schema_matched_record = self._match_target_schema(record, list(self._get_schema_map().keys()))
-                    complete_record = self._add_extra_fields_from_map(
-                        schema_matched_record,
-                        {
-                            self.ab_last_mod_col: datetime.strftime(storage_file.last_modified, self.datetime_format_string),
-                            self.ab_file_name_col: storage_file.url,
-                        },
-                    )
-                    yield complete_record
+            if "records" in file_item:
+                yield from file_item["records"].result()
+            else:
+                yield from self._read_file(file_reader, file_item["storage_file"])
         LOGGER.info("finished reading a stream slice")
 
+    def _read_file(self, file_reader: AbstractFileParser, storage_file: StorageFile) -> Iterator[Mapping[str, Any]]:
+        target_columns = list(self._get_schema_map().keys())
+        extra_map = {
+            self.ab_last_mod_col: datetime.strftime(storage_file.last_modified, self.datetime_format_string),
+            self.ab_file_name_col: storage_file.url,
+        }
+        with storage_file.open(file_reader.is_binary) as f:
+            for batch in file_reader.stream_record_batches(f, storage_file.file_info):
+                yield from file_reader.batch_to_records(self._match_target_schema_batch(batch, target_columns, extra_map))
+
+    def _get_file_reader(self, stream_state: Mapping[str, Any] = None) -> AbstractFileParser:
+        return self.fileformatparser_class(self._format, self._get_master_schema())
+
     def read_records(
         self,
         sync_mode: SyncMode,
@@ -377,12 +533,73 @@ class FileStream(Stream, ABC):
             yield from self._read_from_slice(file_reader, stream_slice)
 
 
-class IncrementalFileStream(FileStream, ABC):
+class IncrementalFileStream(FileStream, IncrementalMixin, ABC):
     # TODO: ideally want to checkpoint after every file or stream slice rather than N records
     state_checkpoint_interval = None
     buffer_days = 3  # keeping track of all files synced in the last N days
     sync_all_files_always = False
     max_history_size = 1000000000
+    max_file_schemas = 100000  # file schemas are not saved in the state beyond this number of files
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.state = {}
+
+    @property
+    def state(self) -> MutableMapping[str, Any]:
+        """
+        The state is only built when it is checkpointed, from the state the sync started from and the files read since.
+        We also save the schema into the state here so that we can use it on future incremental batches, allowing for additional/missing columns.
+        """
+        if not self._files_read:
+            return self._state
+        state_dict: Dict[str, Any] = {self.cursor_field: datetime.strftime(self._cursor, self.datetime_format_string)}
+        state_dict["schema"] = self._get_schema_map()
+        if self._file_schemas:
+            file_schemas_state = self._get_buffered_file_schemas_state()
+            if file_schemas_state:
+                state_dict["file_schemas"] = file_schemas_state
+        elif "file_schemas" in self._state:
+            state_dict["file_schemas"] = self._state["file_schemas"]
+        if not self.sync_all_files_always:
+            # drop from the history any entries whose key is less than the cursor date - buffer_days
+            state_dict["history"] = {
+                date: set(files)
+                for date, files in self._history.items()
+                if datetime.strptime(date, "%Y-%m-%d").date() + timedelta(days=self.buffer_days) >= self._cursor.date()
+            }
+        return self.size_history_balancer(state_dict)
+
+    @state.setter
+    def state(self, value: MutableMapping[str, Any]):
+        """
+        In the case where the state is empty, we default to 1970-01-01 in order to pick up all files present.
+        """
+        self._state = value
+        self._cursor = self._get_datetime_from_stream_state(value)
+        self._history: Dict[str, Any] = dict(value.get("history", {}))
+        self._files_read: Set[str] = set()
+        file_schemas = value.get("file_schemas", {})
+        self._known_file_schemas = dict(file_schemas.get("files", {}))
+        self._schemas_by_hash = dict(file_schemas.get("schemas", {}))
+        self._file_schemas_state_cache: Optional[Tuple[Tuple[date, int], Optional[Dict[str, Any]]]] = None
+
+    def _get_buffered_file_schemas_state(self) -> Optional[Dict[str, Any]]:
+        """
+        Like the history, the file schemas only cover the files last modified within buffer_days of the cursor, and they are dropped
+        if there are more than max_file_schemas of them.
+        The state is built at every checkpoint so this is only computed again when the date of the cursor, or the files inferred from,
+        change.
+        """
+        min_date = self._cursor.date() - timedelta(days=self.buffer_days)
+        cache_key = (min_date, len(self._file_schemas))
+        if self._file_schemas_state_cache is None or self._file_schemas_state_cache[0] != cache_key:
+            file_schemas_state = self._get_file_schemas_state(min_date)
+            if len(file_schemas_state["files"]) > self.max_file_schemas:
+                LOGGER.info(f"not saving the schemas of {len(file_schemas_state['files'])} files into the state")
+                file_schemas_state = None
+            self._file_schemas_state_cache = (cache_key, file_schemas_state)
+        return self._file_schemas_state_cache[1]
 
     @property
     def cursor_field(self) -> str:
@@ -405,72 +622,52 @@ class IncrementalFileStream(FileStream, ABC):
         else:
             return datetime.strptime("1970-01-01T00:00:00+0000", self.datetime_format_string)
 
-    def get_updated_history(self, current_stream_state, latest_record_datetime, latest_record, current_parsed_datetime, state_date):
+    def add_file_to_history(self, file_url: str, file_last_modified: datetime) -> None:
         """
         History is dict which basically groups files by their modified_at date.
-        After reading each record we add its file to the history set if it wasn't already there.
-        Then we drop from the history set any entries whose key is less than now - buffer_days
+        We add each file read to the history set of its date, if within buffer_days of the cursor.
+        Entries older than the cursor date - buffer_days are dropped when the state is built.
         """
-
-        history = current_stream_state.get("history", {})
-
-        file_modification_date = latest_record_datetime.strftime("%Y-%m-%d")
-
-        # add record to history if record modified date in range delta start from state
-        if latest_record_datetime.date() + timedelta(days=self.buffer_days) >= state_date:
-            history_item = set(history.setdefault(file_modification_date, set()))
-            history_item.add(latest_record[self.ab_file_name_col])
-            history[file_modification_date] = history_item
-
-        # reset history to new date state
-        if current_parsed_datetime.date() != state_date:
-            history = {
-                date: history[date]
-                for date in history
-                if datetime.strptime(date, "%Y-%m-%d").date() + timedelta(days=self.buffer_days) >= state_date
-            }
-
-        return history
+        if file_last_modified.date() + timedelta(days=self.buffer_days) >= self._cursor.date():
+            file_modification_date = file_last_modified.strftime("%Y-%m-%d")
+            history_item = self._history.get(file_modification_date)
+            # files are lists rather than sets in a state read from json
+            if not isinstance(history_item, set):
+                history_item = self._history[file_modification_date] = set(history_item or [])
+            history_item.add(file_url)
 
     def size_history_balancer(self, state_dict):
         """
         Delete history if state size limit reached
         """
-        history = state_dict["history"]
+        history = state_dict.get("history", {})
 
         if history.__sizeof__() > self.max_history_size:
             self.sync_all_files_always = True
-            state_dict.pop("history")
+            state_dict.pop("history", None)
 
         return state_dict
 
     def get_updated_state(self, current_stream_state: MutableMapping[str, Any], latest_record: Mapping[str, Any]) -> Mapping[str, Any]:
         """
-        Inspects the latest record extracted from the data source and the current state object and return an updated state object.
-        In the case where current_stream_state is null, we default to 1970-01-01 in order to pick up all files present.
-        We also save the schema into the state here so that we can use it on future incremental batches, allowing for additional/missing columns.
+        This runs on every record so it only keeps track of the file the latest record was read from, which is O(1) for every record
+        but the first of each file: all the records of a file share its last modified date, which is the cursor.
+        The state is built from the cursor and history tracked here when it is checkpointed, see the state property.
 
         :param current_stream_state: The stream's current state object
         :param latest_record: The latest record extracted from the stream
-        :return: An updated state object
+        :return: the current state object, the updated state is available through the state property
         """
-        state_dict: Dict[str, Any] = {}
-        current_parsed_datetime = self._get_datetime_from_stream_state(current_stream_state)
-        latest_record_datetime = datetime.strptime(
-            latest_record.get(self.cursor_field, "1970-01-01T00:00:00+0000"), self.datetime_format_string
-        )
-        state_dict[self.cursor_field] = datetime.strftime(max(current_parsed_datetime, latest_record_datetime), self.datetime_format_string)
-
-        state_dict["schema"] = self._get_schema_map()
-
-        state_date = self._get_datetime_from_stream_state(state_dict).date()
-
-        if not self.sync_all_files_always:
-            state_dict["history"] = self.get_updated_history(
-                current_stream_state, latest_record_datetime, latest_record, current_parsed_datetime, state_date
+        file_url = latest_record.get(self.ab_file_name_col)
+        if file_url not in self._files_read:
+            self._files_read.add(file_url)
+            file_last_modified = datetime.strptime(
+                latest_record.get(self.cursor_field, "1970-01-01T00:00:00+0000"), self.datetime_format_string
             )
-
-        return self.size_history_balancer(state_dict)
+            self._cursor = max(self._cursor, file_last_modified)
+            if not self.sync_all_files_always:
+                self.add_file_to_history(file_url, file_last_modified)
+        return current_stream_state
 
     def need_to_skip_file(self, stream_state, file_info):
         """
@@ -493,7 +690,7 @@ class IncrementalFileStream(FileStream, ABC):
             or file_is_not_in_history_and_last_modified_plus_buffer_days_is_earlier_than_cursor_value
         )
 
-    def stream_slices(
+    def _build_stream_slices(
         self, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None
     ) -> Iterable[Optional[Dict[str, Any]]]:
         """
@@ -506,7 +703,7 @@ class IncrementalFileStream(FileStream, ABC):
         The stream_slice is then cleared (if we yielded it) and this iteration's file appended to the (next) stream_slice
         """
         if sync_mode == SyncMode.full_refresh:
-            yield from super().stream_slices(sync_mode=sync_mode, cursor_field=cursor_field, stream_state=stream_state)
+            yield from super()._build_stream_slices(sync_mode=sync_mode, cursor_field=cursor_field, stream_state=stream_state)
 
         else:
             # if necessary and present, let's update this object's schema attribute to the schema stored in state
@@ -524,7 +721,7 @@ class IncrementalFileStream(FileStream, ABC):
                 # check if this file belongs in the next slice, if so yield the current slice before this file
                 if (prev_file_last_mod is not None) and (file_info.last_modified != prev_file_last_mod):
                     yield {"files": grouped_files_by_time}
-                    grouped_files_by_time.clear()
+                    grouped_files_by_time = []
 
                 # now we either have an empty stream_slice or a stream_slice that this file shares a last modified with, so append it
                 grouped_files_by_time.append({"storage_file": self.storagefile_class(file_info, self._provider)})
@@ -555,8 +752,7 @@ class IncrementalFileStream(FileStream, ABC):
                 yield from super().read_records(sync_mode, cursor_field, stream_slice, stream_state)
 
             else:
+                yield from self._read_from_slice(self._get_file_reader(stream_state), stream_slice)
 
-                file_reader = self.fileformatparser_class(
-                    self._format, self._get_master_schema(self._get_datetime_from_stream_state(stream_state))
-                )
-                yield from self._read_from_slice(file_reader, stream_slice)
+    def _get_file_reader(self, stream_state: Mapping[str, Any] = None) -> AbstractFileParser:
+        return self.fileformatparser_class(self._format, self._get_master_schema(self._get_datetime_from_stream_state(stream_state)))
@@ -2,10 +2,15 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
+import json
 import os
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, List, Mapping
+from unittest.mock import patch
 
+import pytest
+from source_s3.source_files_abstract.file_info import FileInfo
 from source_s3.source_files_abstract.formats.jsonl_parser import JsonlParser
 
 from .abstract_test_parser import AbstractTestParser
@@ -177,3 +182,39 @@ class TestJsonlParser(AbstractTestParser):
                 "fails": [],
             },
         }
+
+    @staticmethod
+    def _write_jsonl(path: Path, records: List[Mapping[str, Any]]) -> FileInfo:
+        path.write_text("".join(json.dumps(record) + "\n" for record in records))
+        return FileInfo(key=str(path), size=path.stat().st_size, last_modified=datetime.now())
+
+    @patch("source_s3.source_files_abstract.formats.jsonl_parser.MIN_CHUNK_SIZE", 0)
+    def test_stream_records_in_chunks(self, tmp_path: Path) -> None:
+        records = [{"id": i, "name": f"name_{i}", "valid": i % 2 == 0} for i in range(2000)]
+        file_info = self._write_jsonl(tmp_path / "file.jsonl", records)
+        parser = JsonlParser(format={"filetype": "jsonl", "block_size": 1024}, master_schema={"id": "integer", "name": "string"})
+
+        with open(file_info.key, "rb") as f:
+            stream = parser.stream_records(f, file_info)
+            assert next(stream) == records[0]
+            # only the first chunk of the file has been read so far
+            assert f.tell() < file_info.size
+            assert [records[0]] + list(stream) == records
+
+    @pytest.mark.parametrize(
+        "sample_size, expected_schema",
+        [
+            (None, {"id": "number", "name": "string", "extra": "string"}),
+            (10, {"id": "integer", "name": "string"}),
+        ],
+        ids=["whole_file", "sample"],
+    )
+    @patch("source_s3.source_files_abstract.formats.jsonl_parser.MIN_CHUNK_SIZE", 0)
+    def test_inferred_schema_in_chunks(self, sample_size: int, expected_schema: Mapping[str, str], tmp_path: Path) -> None:
+        records = [{"id": i, "name": None if i < 100 else "name"} for i in range(1000)]
+        records += [{"id": i + 0.5, "name": "name", "extra": "value"} for i in range(1000)]
+        file_info = self._write_jsonl(tmp_path / "file.jsonl", records)
+        parser = JsonlParser(format={"filetype": "jsonl", "block_size": 1024, "schema_inference_sample_size": sample_size})
+
+        with open(file_info.key, "rb") as f:
+            assert parser.get_inferred_schema(f, file_info) == expected_schema
@@ -2,15 +2,24 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
-from datetime import datetime
-from typing import Any, Dict, List, Mapping
+import functools
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, BinaryIO, Dict, Iterator, List, Mapping, TextIO, Union
 from unittest.mock import MagicMock, patch
 
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
 import pytest
 from airbyte_cdk import AirbyteLogger
 from airbyte_cdk.models import SyncMode
 from source_s3.exceptions import S3Exception
 from source_s3.source_files_abstract.file_info import FileInfo
+from source_s3.source_files_abstract.formats.abstract_file_parser import AbstractFileParser
+from source_s3.source_files_abstract.formats.csv_parser import CsvParser
+from source_s3.source_files_abstract.formats.parquet_parser import ParquetParser
 from source_s3.source_files_abstract.storagefile import StorageFile
 from source_s3.source_files_abstract.stream import IncrementalFileStream
 from source_s3.stream import IncrementalFileStreamS3
@@ -20,10 +29,40 @@ from .abstract_test_parser import create_by_local_file, memory_limit
 LOGGER = AirbyteLogger()
 
 
-def mock_big_size_object():
-    mock = MagicMock()
-    mock.__sizeof__.return_value = 1000000001
-    return mock
+class LocalFile(StorageFile):
+    """Local file sleeping on open to simulate the latency of opening a remote file"""
+
+    open_latency = 0.05
+
+    @contextmanager
+    def open(self, binary: bool) -> Iterator[Union[TextIO, BinaryIO]]:
+        time.sleep(self.open_latency)
+        with open(self.url, "rb" if binary else "r") as f:
+            yield f
+
+
+class IncrementalFileStreamLocal(IncrementalFileStream):
+    storagefile_class = LocalFile
+
+    def __init__(self, file_infos: List[FileInfo], **kwargs: Any):
+        super().__init__(dataset="dummy", provider={}, format={"filetype": "csv"}, path_pattern="**", **kwargs)
+        self.file_infos = file_infos
+
+    def filepath_iterator(self) -> Iterator[FileInfo]:
+        yield from self.file_infos
+
+
+def generate_csv_files(directory: Any, num_files: int, new_column_every: int = None) -> List[FileInfo]:
+    """Generates small csv files, modified two at a time, with an additional column every new_column_every files if set"""
+    file_infos = []
+    start = datetime(2022, 1, 1, tzinfo=timezone.utc)
+    for i in range(num_files):
+        path = directory / f"file_{i}.csv"
+        columns = ["id", "name"] + ([f"column_{i // new_column_every}"] if new_column_every else [])
+        rows = [[str(i * 10 + j), f"name_{j}"] + ([str(j)] if new_column_every else []) for j in range(10)]
+        path.write_text("\n".join(",".join(row) for row in [columns] + rows) + "\n")
+        file_infos.append(FileInfo(key=str(path), size=path.stat().st_size, last_modified=start + timedelta(minutes=i // 2)))
+    return file_infos
 
 
 class TestIncrementalFileStream:
@@ -121,6 +160,38 @@ class TestIncrementalFileStream:
                 fs._match_target_schema(record, target_columns)
                 LOGGER.debug(str(e_info))
 
+    @pytest.mark.parametrize(
+        "target_columns, batch",
+        [
+            (["id", "first_name", "last_name"], {"id": ["1", "2"], "first_name": ["Frodo", "Sam"], "last_name": ["Baggins", "Gamgee"]}),
+            (
+                ["id", "first_name", "last_name"],
+                {"id": ["1", "2"], "first_name": ["Frodo", "Sam"], "last_name": ["Baggins", "Gamgee"], "items": [["Sting"], None]},
+            ),
+            (["id", "first_name", "last_name", "location", "items"], {"id": ["1", "2"], "first_name": ["Frodo", "Sam"]}),
+            (["id", "first_name", "friends"], {"id": ["1", "2"], "location": ["The Shire", "Bag End"], "items": [["Sting"], []]}),
+            (["id", "first_name"], {}),
+        ],
+        ids=["simple_case", "additional_columns", "missing_columns", "additional_and_missing_columns", "empty_batch"],
+    )
+    @patch(
+        "source_s3.source_files_abstract.stream.IncrementalFileStream.__abstractmethods__", set()
+    )  # patching abstractmethods to empty set so we can instantiate ABC to test
+    def test_match_target_schema_batch(self, target_columns: List[str], batch: Dict[str, List[Any]]) -> None:
+        fs = IncrementalFileStream(dataset="dummy", provider={}, format={}, path_pattern="")
+        extra_map = {fs.ab_last_mod_col: "2022-01-01T00:00:00Z", fs.ab_file_name_col: "s3://bucket/file"}
+        target_columns = target_columns + [fs.ab_additional_col, fs.ab_last_mod_col, fs.ab_file_name_col]
+
+        records = list(CsvParser.batch_to_records(fs._match_target_schema_batch(batch, target_columns, extra_map)))
+
+        expected_records = [
+            fs._add_extra_fields_from_map(fs._match_target_schema(record, target_columns), extra_map)
+            for record in CsvParser.batch_to_records(batch)
+        ]
+        assert records == expected_records
+        assert [list(record.keys()) for record in records] == [list(record.keys()) for record in expected_records]
+        assert all(records[0][fs.ab_additional_col] is not record[fs.ab_additional_col] for record in records[1:])
+
     @pytest.mark.parametrize(  # set expected_return_record to None for an expected fail
         "extra_map, record, expected_return_record",
         [
@@ -357,7 +428,7 @@ class TestIncrementalFileStream:
             ),
             (  # history size limit reached
                 {"_ab_source_file_url": "test.csv"},
-                {"_ab_source_file_last_modified": "2022-07-01T00:00:00+0000", "history": mock_big_size_object()},
+                {"_ab_source_file_last_modified": "2022-07-01T00:00:00+0000", "history": {"2022-07-01": {"old_test_file.csv"}}},
                 None,
             ),
         ],
@@ -369,10 +440,37 @@ class TestIncrementalFileStream:
     def test_get_updated_history(self, latest_record, current_stream_state, expected, request) -> None:
         fs = IncrementalFileStream(dataset="dummy", provider={}, format={"filetype": "csv"}, path_pattern="**/prefix*.csv")
         fs._get_schema_map = MagicMock(return_value={})
-        assert fs.get_updated_state(current_stream_state, latest_record).get("history") == expected
+        if request.node.callspec.id == "history_size_limit_reached":
+            fs.max_history_size = 0
+        fs.state = current_stream_state
+        assert fs.get_updated_state(current_stream_state, latest_record) is current_stream_state
+        assert fs.state.get("history") == expected
 
         if request.node.callspec.id == "history_size_limit_reached":
             assert fs.sync_all_files_always
+            # the state is still built once the history has been dropped
+            assert fs.state == {"_ab_source_file_last_modified": "2022-07-01T00:00:00+0000", "schema": {}}
+
+    @patch(
+        "source_s3.source_files_abstract.stream.IncrementalFileStream.__abstractmethods__", set()
+    )  # patching abstractmethods to empty set so we can instantiate ABC to test
+    def test_state_is_built_on_checkpoint(self) -> None:
+        fs = IncrementalFileStream(dataset="dummy", provider={}, format={"filetype": "csv"}, path_pattern="**/prefix*.csv")
+        fs._get_schema_map = MagicMock(return_value={"id": "integer"})
+        fs.state = {"_ab_source_file_last_modified": "2022-07-01T00:00:00+0000", "history": {"2022-07-01": ["old_test_file.csv"]}}
+
+        for file_url, last_modified in [("a.csv", "2022-07-02T10:00:00+0000"), ("b.csv", "2022-07-03T10:00:00+0000")]:
+            for i in range(1000):
+                record = {"id": i, "_ab_source_file_last_modified": last_modified, "_ab_source_file_url": file_url}
+                fs.get_updated_state({}, record)
+        assert not fs._get_schema_map.called
+
+        assert fs.state == {
+            "_ab_source_file_last_modified": "2022-07-03T10:00:00+0000",
+            "schema": {"id": "integer"},
+            "history": {"2022-07-01": {"old_test_file.csv"}, "2022-07-02": {"a.csv"}, "2022-07-03": {"b.csv"}},
+        }
+        assert fs._get_schema_map.call_count == 1
 
     @pytest.mark.parametrize(  # set expected_return_record to None for an expected fail
         "stream_state, expected_error",
@@ -720,3 +818,173 @@ class TestIncrementalFileStream:
             },
             "type": "object",
         }
+
+    @pytest.mark.parametrize("file_type", ["csv", "parquet"])
+    @patch(
+        "source_s3.source_files_abstract.stream.IncrementalFileStream.__abstractmethods__", set()
+    )  # patching abstractmethods to empty set so we can instantiate ABC to test
+    def test_read_from_slice_batches(self, file_type: str, tmp_path) -> None:
+        """
+        Reading a file a batch at a time must produce the same records as reading it record by record, which is what
+        AbstractFileParser.stream_record_batches() does by default.
+        """
+        num_rows = 50000
+        table = pa.table(
+            {
+                "id": list(range(num_rows)),
+                "name": [f"name_{i}" for i in range(num_rows)],
+                "score": [i / 7 for i in range(num_rows)],
+                "valid": [i % 2 == 0 for i in range(num_rows)],
+                "extra": [f"extra_{i}" for i in range(num_rows)],
+            }
+        )
+        filepath = str(tmp_path / f"benchmark.{file_type}")
+        master_schema = {"id": "integer", "name": "string", "score": "number", "valid": "boolean", "missing": "string"}
+        if file_type == "csv":
+            pa_csv.write_csv(table, filepath)
+            file_reader = CsvParser(format={"filetype": "csv"}, master_schema=master_schema)
+        else:
+            pq.write_table(table, filepath)
+            file_reader = ParquetParser(format={"filetype": "parquet"}, master_schema={**master_schema, "extra": "string"})
+
+        storage_file = MagicMock(
+            last_modified=datetime(2022, 1, 1), url=filepath, file_info=FileInfo(key=filepath, size=0, last_modified=datetime(2022, 1, 1))
+        )
+        storage_file.open.side_effect = lambda binary: open(filepath, "rb" if binary else "r")
+        fs = IncrementalFileStream(dataset="dummy", provider={}, format={"filetype": file_type}, path_pattern="")
+        fs._get_schema_map = MagicMock(
+            return_value={**master_schema, fs.ab_additional_col: "object", fs.ab_last_mod_col: "string", fs.ab_file_name_col: "string"}
+        )
+        stream_slice = {"files": [{"storage_file": storage_file}]}
+
+        batch_records = list(fs._read_from_slice(file_reader, stream_slice))
+        with storage_file.open(file_reader.is_binary) as f:
+            parsed_records = list(file_reader.stream_records(f, storage_file.file_info))
+        # parsers stream their records from their batches, so the parsed records are replayed one by one
+        file_reader.stream_records = MagicMock(return_value=iter(parsed_records))
+        file_reader.stream_record_batches = functools.partial(AbstractFileParser.stream_record_batches, file_reader)
+        records = list(fs._read_from_slice(file_reader, stream_slice))
+
+        assert len(batch_records) == num_rows
+        assert batch_records == records
+
+    @pytest.mark.parametrize("sync_mode", [SyncMode.full_refresh, SyncMode.incremental])
+    def test_read_ahead_matches_sequential_read(self, sync_mode: SyncMode, tmp_path) -> None:
+        file_infos = generate_csv_files(tmp_path, 12)
+        results = {}
+        timings = {}
+        for max_concurrent_files in [1, 4]:
+            stream = IncrementalFileStreamLocal(file_infos, max_concurrent_files=max_concurrent_files)
+            records = []
+            start = time.perf_counter()
+            for stream_slice in stream.stream_slices(sync_mode=sync_mode, stream_state={}):
+                for record in stream.read_records(sync_mode=sync_mode, stream_slice=stream_slice, stream_state={}):
+                    records.append(record)
+                    stream.get_updated_state({}, record)
+            timings[max_concurrent_files] = time.perf_counter() - start
+            results[max_concurrent_files] = records, stream.state
+
+        assert len(results[1][0]) == 120
+        assert results[4] == results[1]
+        assert timings[4] < timings[1]
+
+    def test_read_ahead_is_bounded(self, tmp_path) -> None:
+        stream = IncrementalFileStreamLocal(generate_csv_files(tmp_path, 12), max_concurrent_files=3)
+        stream_slices = list(stream._build_stream_slices(sync_mode=SyncMode.incremental, stream_state={}))
+        stream._build_stream_slices = MagicMock(return_value=iter(stream_slices))
+
+        read_ahead_slices = stream.stream_slices(sync_mode=SyncMode.incremental, stream_state={})
+        first_slice = next(read_ahead_slices)
+
+        assert first_slice is stream_slices[0]
+        files_read_ahead = [file_item for stream_slice in stream_slices for file_item in stream_slice["files"] if "records" in file_item]
+        # files are read ahead a whole slice at a time, it takes the first two slices of 2 files to reach 3 files
+        assert len(files_read_ahead) == 4
+        read_ahead_slices.close()
+        assert not any("records" in file_item for stream_slice in stream_slices[2:] for file_item in stream_slice["files"])
+
+    def test_parallel_schema_inference_matches_sequential(self, tmp_path) -> None:
+        file_infos = generate_csv_files(tmp_path, 12, new_column_every=3)
+        schemas = {}
+        timings = {}
+        for max_concurrent_files in [1, 4]:
+            stream = IncrementalFileStreamLocal(file_infos, max_concurrent_files=max_concurrent_files)
+            start = time.perf_counter()
+            schemas[max_concurrent_files] = stream._get_master_schema()
+            timings[max_concurrent_files] = time.perf_counter() - start
+
+        assert list(schemas[1].items()) == [
+            ("id", "integer"),
+            ("name", "string"),
+            ("column_0", "integer"),
+            ("column_1", "integer"),
+            ("column_2", "integer"),
+            ("column_3", "integer"),
+        ]
+        assert list(schemas[4].items()) == list(schemas[1].items())
+        assert timings[4] < timings[1]
+
+    def test_schema_inference_from_most_recent_files(self, tmp_path) -> None:
+        stream = IncrementalFileStreamLocal(generate_csv_files(tmp_path, 12, new_column_every=3), max_files_for_schema_inference=4)
+        with patch.object(LocalFile, "open", side_effect=LocalFile.open, autospec=True) as opened:
+            schema = stream._get_master_schema()
+
+        assert sorted(call.args[0].url for call in opened.call_args_list) == [str(tmp_path / f"file_{i}.csv") for i in [10, 11, 8, 9]]
+        assert schema == {"id": "integer", "name": "string", "column_2": "integer", "column_3": "integer"}
+
+    def test_schema_inference_skips_known_files(self, tmp_path) -> None:
+        file_infos = generate_csv_files(tmp_path, 6, new_column_every=3)
+        stream = IncrementalFileStreamLocal(file_infos)
+        for stream_slice in stream.stream_slices(sync_mode=SyncMode.incremental, stream_state={}):
+            for record in stream.read_records(sync_mode=SyncMode.incremental, stream_slice=stream_slice, stream_state={}):
+                stream.get_updated_state({}, record)
+        # only keep the file schemas from the state, and start from the beginning
+        state = {"file_schemas": stream.state["file_schemas"]}
+        assert len(state["file_schemas"]["files"]) == 6
+        assert len(state["file_schemas"]["schemas"]) == 2
+
+        # the last file has been replaced
+        (tmp_path / "file_5.csv").write_text("id,name,other_column\n1,name,true\n")
+        file_infos[-1] = FileInfo(key=file_infos[-1].key, size=0, last_modified=file_infos[-1].last_modified + timedelta(days=1))
+        stream = IncrementalFileStreamLocal(file_infos)
+        stream.state = state
+        with patch.object(LocalFile, "open", side_effect=LocalFile.open, autospec=True) as opened:
+            schema = stream._get_master_schema()
+
+        assert [call.args[0].url for call in opened.call_args_list] == [file_infos[-1].key]
+        assert schema == {"id": "integer", "name": "string", "column_0": "integer", "column_1": "integer", "other_column": "boolean"}
+
+    def test_file_schemas_state_is_bounded_and_cached(self, tmp_path) -> None:
+        file_infos = generate_csv_files(tmp_path, 8, new_column_every=2)
+        # one file per day
+        file_infos = [
+            FileInfo(key=file_info.key, size=file_info.size, last_modified=datetime(2022, 1, 1, tzinfo=timezone.utc) + timedelta(days=i))
+            for i, file_info in enumerate(file_infos)
+        ]
+        stream = IncrementalFileStreamLocal(file_infos)
+        stream._get_master_schema()
+        with patch.object(stream, "_get_file_schemas_state", wraps=stream._get_file_schemas_state) as get_file_schemas_state:
+            stream.get_updated_state(
+                {}, {"_ab_source_file_url": file_infos[-1].key, "_ab_source_file_last_modified": "2022-01-08T00:00:00+0000"}
+            )
+            first_state = stream.state["file_schemas"]
+            stream.get_updated_state(
+                {}, {"_ab_source_file_url": file_infos[-2].key, "_ab_source_file_last_modified": "2022-01-07T00:00:00+0000"}
+            )
+            assert stream.state["file_schemas"] == first_state
+        assert get_file_schemas_state.call_count == 1
+
+        # only the files within buffer_days of the cursor are kept, like in the history
+        assert len(first_state["files"]) == stream.buffer_days + 1
+        assert first_state["files"] == {
+            stream._file_fingerprint(file_info): stream._file_schemas[stream._file_fingerprint(file_info)][0]
+            for file_info in file_infos[-4:]
+        }
+        assert sorted(first_state["schemas"].values(), key=list) == [
+            {"id": "integer", "name": "string", "column_2": "integer"},
+            {"id": "integer", "name": "string", "column_3": "integer"},
+        ]
+
+        stream.max_file_schemas = 2
+        stream.get_updated_state({}, {"_ab_source_file_url": "other_file", "_ab_source_file_last_modified": "2022-01-09T00:00:00+0000"})
+        assert "file_schemas" not in stream.state
@@ -91,6 +91,7 @@ class SourceSalesforce(AbstractSource):
                 full_refresh, incremental = SalesforceStream, IncrementalSalesforceStream
             elif api_type == "bulk":
                 full_refresh, incremental = BulkSalesforceStream, BulkIncrementalSalesforceStream
+                streams_kwargs["pipelined"] = config.get("pipeline_bulk_jobs", False)
             else:
                 raise Exception(f"Stream {stream_name} cannot be processed by REST or BULK API.")
 
@@ -2,12 +2,14 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
+import codecs
 import csv
 import ctypes
 import math
 import os
 import time
 from abc import ABC
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import closing
 from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Type, Union
 
@@ -141,6 +143,14 @@ class BulkSalesforceStream(SalesforceStream):
     DEFAULT_WAIT_TIMEOUT_SECONDS = 86400  # 24-hour bulk job running time
     MAX_CHECK_INTERVAL_SECONDS = 2.0
     MAX_RETRY_NUMBER = 3
+    RESULTS_CHUNK_SIZE = 1024**2
+
+    def __init__(self, pipelined: bool = False, **kwargs):
+        """
+        @ pipelined: bool - run the job of the next page while the records of the current page are read, see `read_pipelined_records`
+        """
+        super().__init__(**kwargs)
+        self.pipelined = pipelined
 
     def path(self, next_page_token: Mapping[str, Any] = None, **kwargs: Any) -> str:
         return f"/services/data/{self.sf_api.version}/jobs/query"
@@ -316,6 +326,133 @@ class BulkSalesforceStream(SalesforceStream):
             # remove binary tmp file, after data is read
             os.remove(path)
 
+    def download_records(self, url: str, chunk_size: int = RESULTS_CHUNK_SIZE) -> Tuple[str, int, Optional[Mapping[str, Any]]]:
+        """
+        Streams the CSV result of a successfully `executed_job` to a temporary file, decoded as utf-8, and parses it on the fly
+        to know the number of records and the last record of the page without waiting for them to be read.
+        @ url: string - the url of the `executed_job`
+        @ chunk_size: int - the buffer size for each chunk to fetch from stream, in bytes, default: 1 MB
+        Return the tuple containing the path of the downloaded data (saved temporarily), the number of records and the last record.
+        """
+        tmp_file = os.path.realpath(os.path.basename(url))
+        with closing(self._send_http_request("GET", f"{url}/results", stream=True)) as response, open(
+            tmp_file, "w", encoding=DEFAULT_ENCODING, newline=""
+        ) as data_file:
+            # only trust an explicit charset, `requests` falls back to ISO-8859-1 for any `text/*` response
+            response_encoding = response.encoding if "charset" in response.headers.get("Content-Type", "").lower() else self.encoding
+            decoder = codecs.getincrementaldecoder(response_encoding)()
+
+            def lines() -> Iterable[str]:
+                pending = ""
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    text = decoder.decode(self.filter_null_bytes(chunk))
+                    data_file.write(text)
+                    *chunk_lines, pending = (pending + text).split("\n")
+                    for line in chunk_lines:
+                        yield line + "\n"
+                text = decoder.decode(b"", final=True)
+                data_file.write(text)
+                if pending + text:
+                    yield pending + text
+
+            rows = csv.reader(lines(), dialect="unix")
+            header = next(rows, None)
+            count, last_row = 0, None
+            for last_row in rows:
+                count += 1
+        last_record = self.row_to_record(header, last_row) if header and last_row else None
+        return tmp_file, count, last_record
+
+    @staticmethod
+    def row_to_record(header: List[str], row: List[str]) -> Mapping[str, Any]:
+        # the BULK API writes null values as empty strings
+        return {field: value or None for field, value in zip(header, row)}
+
+    def read_csv_records(self, path: str) -> Iterable[Mapping[str, Any]]:
+        """
+        Reads the records of the data saved by `download_records`, without any type inference: the values are strings,
+        they are converted to the types of the schema by the transformer of the stream.
+        @ path: string - the path to the downloaded temporarily data.
+        """
+        try:
+            with open(path, "r", encoding=DEFAULT_ENCODING, newline="") as data:
+                rows = csv.reader(data, dialect="unix")
+                header = next(rows, None)
+                if header:
+                    for row in rows:
+                        yield self.row_to_record(header, row)
+        except IOError as ioe:
+            raise TmpFileIOError(f"The IO/Error occured while reading tmp data. Called: {path}. Stream: {self.name}", ioe)
+        finally:
+            os.remove(path)
+
+    def fetch_page(self, query: str, url: str) -> Tuple[Optional[str], Optional[Tuple[str, int, Optional[Mapping[str, Any]]]]]:
+        """
+        Executes the job of a page, downloads its result with `download_records` and deletes the job.
+        Return the tuple containing the job status and the result of `download_records`, if the job is successful.
+        """
+        job_full_url, job_status = self.execute_job(query=query, url=url)
+        if not job_full_url:
+            return job_status, None
+        try:
+            return job_status, self.download_records(url=job_full_url)
+        finally:
+            self.delete_job(url=job_full_url)
+
+    @staticmethod
+    def discard_page(page: Future):
+        if not page.cancelled() and not page.exception():
+            _, result = page.result()
+            if result:
+                os.remove(result[0])
+
+    def read_pipelined_records(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: List[str] = None,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> Iterable[Mapping[str, Any]]:
+        """
+        Reads the pages like `read_records`, but the job of the next page is submitted as soon as the result of the current page
+        is downloaded, and runs in a background thread while the records of the current page are read.
+        """
+        stream_state = stream_state or {}
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{self.name}_bulk")
+
+        def submit_page(next_page_token: Optional[Mapping[str, Any]]) -> Future:
+            params = self.request_params(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
+            path = self.path(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
+            return executor.submit(self.fetch_page, query=params["q"], url=f"{self.url_base}{path}")
+
+        page: Optional[Future] = submit_page(None)
+        try:
+            while page:
+                job_status, result = page.result()
+                page = None
+                if not result:
+                    if job_status == "Failed":
+                        standard_instance = self.get_standard_instance()
+                        self.logger.warning(
+                            "switch to STANDARD(non-BULK) sync. Because the SalesForce BULK job has returned a failed status"
+                        )
+                        yield from standard_instance.read_records(
+                            sync_mode=sync_mode, cursor_field=cursor_field, stream_slice=stream_slice, stream_state=stream_state
+                        )
+                        return
+                    raise SalesforceException(f"Job for {self.name} stream using BULK API was failed.")
+
+                path, count, last_record = result
+                # same stop conditions as `read_records`, known before reading the records of the page
+                next_page_token = self.next_page_token(last_record) if count >= self.page_size else None
+                if next_page_token:
+                    page = submit_page(next_page_token)
+                yield from self.read_csv_records(path)
+        finally:
+            if page and not page.cancel():
+                page.add_done_callback(self.discard_page)
+            executor.shutdown(wait=False)
+
     def abort_job(self, url: str):
         data = {"state": "Aborted"}
         self._send_http_request("PATCH", url=url, json=data)
@@ -352,6 +489,12 @@ class BulkSalesforceStream(SalesforceStream):
         stream_slice: Mapping[str, Any] = None,
         stream_state: Mapping[str, Any] = None,
     ) -> Iterable[Mapping[str, Any]]:
+        if self.pipelined:
+            yield from self.read_pipelined_records(
+                sync_mode=sync_mode, cursor_field=cursor_field, stream_slice=stream_slice, stream_state=stream_state
+            )
+            return
+
         stream_state = stream_state or {}
         next_page_token = None
 
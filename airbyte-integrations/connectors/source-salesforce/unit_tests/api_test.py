@@ -6,7 +6,9 @@
 import csv
 import io
 import logging
+import os
 import re
+import time
 from unittest.mock import Mock
 
 import pytest
@@ -615,3 +617,116 @@ def test_bulk_stream_paging(stream_config, stream_api_pk):
 
         q = f"{SELECT} WHERE (LastModifiedDate = {last_modified_date2} AND Id > '4') OR (LastModifiedDate > {last_modified_date2}) {ORDER_BY}"
         assert get_query(12) == q
+
+
+def test_bulk_stream_paging_pipelined(stream_config, stream_api_pk):
+    last_modified_date1 = "2022-10-01T00:00:00Z"
+    last_modified_date2 = "2022-10-02T00:00:00Z"
+
+    stream_config = {**stream_config, "start_date": last_modified_date1, "pipeline_bulk_jobs": True}
+    stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config, stream_api_pk)
+    assert stream.pipelined
+    stream.page_size = 2
+
+    csv_header = "Field1,LastModifiedDate,Id"
+    pages = [
+        [f"test,{last_modified_date1},1", f"test,{last_modified_date1},3"],
+        [f"test,{last_modified_date1},5", f"test,{last_modified_date2},2"],
+        [f",{last_modified_date2},4"],
+    ]
+
+    with requests_mock.Mocker() as mocked_requests:
+        post_responses = []
+        for job_id, page in enumerate(pages, 1):
+            post_responses.append({"json": {"id": f"{job_id}"}})
+            mocked_requests.register_uri("GET", stream.path() + f"/{job_id}", json={"state": "JobComplete"})
+            mocked_requests.register_uri("GET", stream.path() + f"/{job_id}/results", text="\n".join([csv_header] + page))
+            mocked_requests.register_uri("DELETE", stream.path() + f"/{job_id}")
+        mocked_requests.register_uri("POST", stream.path(), post_responses)
+
+        records = list(stream.read_records(sync_mode=SyncMode.full_refresh))
+
+        # values are not inferred, they are converted to the types of the schema by the transformer of the stream
+        assert records == [
+            {"Field1": "test", "Id": "1", "LastModifiedDate": last_modified_date1},
+            {"Field1": "test", "Id": "3", "LastModifiedDate": last_modified_date1},
+            {"Field1": "test", "Id": "5", "LastModifiedDate": last_modified_date1},
+            {"Field1": "test", "Id": "2", "LastModifiedDate": last_modified_date2},
+            {"Field1": None, "Id": "4", "LastModifiedDate": last_modified_date2},
+        ]
+
+        queries = [request.json()["query"] for request in mocked_requests.request_history if request.method == "POST"]
+        SELECT = "SELECT LastModifiedDate,Id FROM Account"
+        ORDER_BY = "ORDER BY LastModifiedDate,Id ASC LIMIT 2"
+        assert queries == [
+            f"{SELECT} WHERE LastModifiedDate >= {last_modified_date1} {ORDER_BY}",
+            f"{SELECT} WHERE (LastModifiedDate = {last_modified_date1} AND Id > '3') OR (LastModifiedDate > {last_modified_date1}) {ORDER_BY}",
+            f"{SELECT} WHERE LastModifiedDate >= {last_modified_date2} {ORDER_BY}",
+        ]
+        assert len([r for r in mocked_requests.request_history if r.method == "DELETE"]) == len(pages)
+
+
+def test_bulk_pipelined_submits_next_job_before_reading_page(stream_config, stream_api, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    stream: BulkIncrementalSalesforceStream = generate_stream("Account", {**stream_config, "pipeline_bulk_jobs": True}, stream_api)
+    stream.page_size = 2
+
+    with requests_mock.Mocker() as m:
+        post_responses = []
+        for job_id in range(1, 4):
+            post_responses.append({"json": {"id": f"{job_id}"}})
+            m.register_uri("GET", stream.path() + f"/{job_id}", json={"state": "JobComplete"})
+            m.register_uri(
+                "GET",
+                stream.path() + f"/{job_id}/results",
+                text=f"Field1,LastModifiedDate,ID\ntest,2021-11-1{job_id},1\ntest,2021-11-1{job_id},2",
+            )
+            m.register_uri("DELETE", stream.path() + f"/{job_id}")
+        m.register_uri("POST", stream.path(), post_responses)
+
+        records = stream.read_records(sync_mode=SyncMode.full_refresh)
+        assert next(records)["LastModifiedDate"] == "2021-11-11"
+        # the second job is submitted before the records of the first page are read, but not the third one
+        deadline = time.monotonic() + 5
+        while len(os.listdir(tmp_path)) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len([r for r in m.request_history if r.method == "POST"]) == 2
+
+        # the downloaded data of a page which is not read is removed
+        records.close()
+        while os.listdir(tmp_path) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not os.listdir(tmp_path)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1024**2])
+def test_download_records(stream_config, stream_api, chunk_size, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    job_full_url: str = "https://fase-account.salesforce.com/services/data/v52.0/jobs/query/7504W00000bkgnpQAA"
+    stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config, stream_api)
+    content = '"Id","Name","IsDeleted"\n"1","\x00ヤ\nも","false"\n"2","","true"\n'.encode("utf-8")
+
+    with requests_mock.Mocker() as m:
+        m.register_uri("GET", f"{job_full_url}/results", headers={"Content-Type": "text/csv"}, content=content)
+        path, count, last_record = stream.download_records(url=job_full_url, chunk_size=chunk_size)
+
+    assert count == 2
+    assert last_record == {"Id": "2", "Name": None, "IsDeleted": "true"}
+    assert list(stream.read_csv_records(path)) == [
+        {"Id": "1", "Name": "ヤ\nも", "IsDeleted": "false"},
+        {"Id": "2", "Name": None, "IsDeleted": "true"},
+    ]
+    assert not os.path.exists(path)
+
+
+def test_download_records_empty(stream_config, stream_api, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    job_full_url: str = "https://fase-account.salesforce.com/services/data/v52.0/jobs/query/7504W00000bkgnpQAA"
+    stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config, stream_api)
+
+    with requests_mock.Mocker() as m:
+        m.register_uri("GET", f"{job_full_url}/results", content=b"\x00")
+        path, count, last_record = stream.download_records(url=job_full_url)
+
+    assert (count, last_record) == (0, None)
+    assert list(stream.read_csv_records(path)) == []